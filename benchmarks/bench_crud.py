@@ -0,0 +1,359 @@
+import argparse
+import csv
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from types import GeneratorType
+
+try:
+    import resource
+except ImportError:  # Not available on Windows; the RSS growth is then reported as None
+    resource = None
+
+import psycopg2
+from psycopg2 import sql
+
+from crud_operations.add_student import AddStudent
+from crud_operations.bulk_import_students import BulkStudentImporter
+from crud_operations.connection_pool import borrow_connection
+from crud_operations.create_student_table import CreateStudent
+from crud_operations.delete_student import DeleteStudent
+from crud_operations.migrations import SchemaMigrator
+from crud_operations.prepared_statements import prepared_statements
+from crud_operations.read_student_data import StudentDataReader
+from crud_operations.update_student import UpdateStudent
+from crud_operations.update_student_attribute import UpdateStudentAttribute
+from http_api.load_test import percentile
+
+DEFAULT_SIZES = (10000, 100000, 1000000)
+
+
+def peak_rss_mb():
+    """Return the peak resident set size of the process so far in MiB, or None if unknown."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return peak / (1024 * 1024 if sys.platform == 'darwin' else 1024)
+
+
+def start_memory_peak():
+    """
+    Start measuring the peak memory of one operation.
+
+    The peak resident set size covers the whole process and includes the result buffers
+    libpq allocates outside the Python heap, but it never goes down, so only its growth
+    during the operation is attributed to it. tracemalloc's peak, when tracing, is reset
+    instead, and the Python memory allocated before the operation is subtracted.
+    Returns:
+        tuple: (peak RSS in MiB or None, bytes traced before the operation or None).
+    """
+    traced = None
+    if tracemalloc.is_tracing():
+        tracemalloc.reset_peak()
+        traced = tracemalloc.get_traced_memory()[0]
+    return peak_rss_mb(), traced
+
+
+def memory_peaks(baseline):
+    """
+    Return the memory peaks of the operation started with ``start_memory_peak``.
+    Returns:
+        dict: 'peak_rss_growth_mb', how far the operation raised the peak RSS of the
+        process, and 'peak_traced_mb', its peak Python memory (None unless tracing).
+    """
+    rss_baseline, traced_baseline = baseline
+    rss = peak_rss_mb()
+    traced = None
+    if traced_baseline is not None and tracemalloc.is_tracing():
+        traced = round(max(tracemalloc.get_traced_memory()[1] - traced_baseline, 0) / (1024 * 1024), 1)
+    return {'peak_rss_growth_mb': round(rss - rss_baseline, 1) if rss is not None else None,
+            'peak_traced_mb': traced}
+
+
+def summarize(latencies, rows, memory=None):
+    """
+    Summarise the timings of one benchmarked operation.
+    Args:
+        latencies (list): Seconds taken by each call.
+        rows (int): Total number of rows processed by all calls.
+        memory (dict): Memory peaks of the operation returned by ``memory_peaks``.
+    Returns:
+        dict: Call count, mean and p50/p95/p99 latency in milliseconds, rows/s and the
+        memory peaks.
+    """
+    ordered = sorted(latencies)
+    total = sum(ordered)
+    return {
+        'calls': len(ordered),
+        'rows': rows,
+        'mean_ms': round(statistics.fmean(ordered) * 1000, 3) if ordered else 0.0,
+        'p50_ms': round(percentile(ordered, 0.50) * 1000, 3),
+        'p95_ms': round(percentile(ordered, 0.95) * 1000, 3),
+        'p99_ms': round(percentile(ordered, 0.99) * 1000, 3),
+        'rows_per_second': round(rows / total, 1) if total else 0.0,
+        **(memory or {'peak_rss_growth_mb': None, 'peak_traced_mb': None}),
+    }
+
+
+def time_calls(func, argument_lists):
+    """
+    Call ``func`` once per argument list and time each call.
+    Returns:
+        tuple: (latencies in seconds, total rows reported by the calls, memory peaks as
+        returned by ``memory_peaks``). A call counts as one row unless it returns a list, whose length is used
+        instead, or a generator, which is consumed within the call's time without keeping
+        its rows.
+    """
+    latencies = []
+    rows = 0
+    baseline = start_memory_peak()
+    for args in argument_lists:
+        started = time.perf_counter()
+        result = func(*args)
+        if isinstance(result, GeneratorType):
+            rows += sum(1 for _ in result)
+        else:
+            rows += len(result) if isinstance(result, list) else 1
+        latencies.append(time.perf_counter() - started)
+    return latencies, rows, memory_peaks(baseline)
+
+
+def random_student(index):
+    """Return the (name, address, age, number) fields of a generated student."""
+    return (f'Student {index}', f'{index % 997} Benchmark Street', 18 + index % 50,
+            f'{random.randint(0, 10 ** 10 - 1):010d}')
+
+
+class CrudBenchmark:
+    """
+    Seeds a scratch table and measures the latency and throughput of the CRUD classes.
+
+    The table is dropped and recreated for every row count, so each run starts from the
+    same state. No cache is used, so every call reaches the database.
+    """
+
+    def __init__(self, db_connection, table_name='students_bench', iterations=200, batch_size=1000):
+        """
+        Initialize the benchmark.
+        Args:
+            db_connection: Connection or connection pool to benchmark against.
+            table_name (str): Scratch table; it is dropped before each run.
+            iterations (int): Calls made for each single-row operation.
+            batch_size (int): Rows changed by each call of the batch operations.
+        """
+        self.connection = db_connection
+        self.table_name = table_name
+        self.iterations = iterations
+        self.batch_size = batch_size
+
+    def run(self, row_count):
+        """
+        Seed the table with ``row_count`` students and benchmark every operation.
+        Returns:
+            dict: The summary of each operation, keyed by name.
+        """
+        results = {'bulk_import': self.seed(row_count)}
+
+        ids = self.student_ids()
+        sample = random.sample(ids, min(self.iterations, len(ids)))
+        full_scans = max(1, min(self.iterations, 5_000_000 // max(row_count, 1)))
+
+        adder = AddStudent(self.connection, self.table_name)
+        reader = StudentDataReader(self.connection, self.table_name)
+        updater = UpdateStudent(self.connection, self.table_name)
+        attribute_updater = UpdateStudentAttribute(self.connection, self.table_name)
+        deleter = DeleteStudent(self.connection, self.table_name)
+
+        results['add_student'] = summarize(*time_calls(
+            adder.add_student, [random_student(row_count + i) for i in range(self.iterations)]))
+        results['fetch_records'] = summarize(*time_calls(reader.fetch_records, [()] * full_scans))
+        results['fetch_page'] = summarize(*time_calls(
+            reader.fetch_page, [(student_id, 200) for student_id in sample]))
+        results['stream_records'] = summarize(*time_calls(
+            reader.stream_records, [()] * full_scans))
+        results['find_student_by_id'] = summarize(*time_calls(
+            updater.find_student_by_id, [(student_id,) for student_id in sample]))
+        results['update_all_student_fields'] = summarize(*time_calls(
+            updater.update_all_student_fields,
+            [(student_id,) + random_student(student_id) for student_id in sample]))
+        results['update_student_field'] = summarize(*time_calls(
+            attribute_updater.update_student_field,
+            [(student_id, 'age', 18 + student_id % 60) for student_id in sample]))
+
+        batches = [random.sample(ids, min(self.batch_size, len(ids))) for _ in range(max(1, self.iterations // 20))]
+        results['update_students_fields'] = summarize(
+            *self._batch_rows(attribute_updater.update_students_fields,
+                              [([(student_id, 'address', 'Batch Avenue') for student_id in batch],)
+                               for batch in batches]))
+
+        # Deletions come last so the other operations see the full table
+        results['delete_student'] = summarize(*time_calls(
+            deleter.delete_student, [(student_id,) for student_id in sample]))
+        remaining = sorted(set(ids) - set(sample))
+
+        # Each half of these students is deleted with and without prepared statements respectively
+        compared_ids = [(student_id,)
+                        for student_id in random.sample(remaining, min(len(sample) * 2, len(remaining)))]
+        half = len(compared_ids) // 2
+        remaining = sorted(set(remaining) - {student_id for student_id, in compared_ids})
+        results['prepared_statements'] = self.compare_prepared({
+            'add_student': (adder.add_student,
+                            [random_student(row_count + self.iterations + i) for i in range(self.iterations)]),
+            'update_all_student_fields': (updater.update_all_student_fields,
+                                          [(student_id,) + random_student(student_id) for student_id in sample]),
+            'update_student_field': (attribute_updater.update_student_field,
+                                     [(student_id, 'age', 19 + student_id % 60) for student_id in sample]),
+            'delete_student': (deleter.delete_student, compared_ids[:half], compared_ids[half:]),
+        })
+        delete_batches = [remaining[i:i + self.batch_size]
+                          for i in range(0, min(len(remaining), self.batch_size * len(batches)), self.batch_size)]
+        results['delete_students'] = summarize(
+            *self._batch_rows(deleter.delete_students, [(batch,) for batch in delete_batches]))
+        return results
+
+    @staticmethod
+    def compare_prepared(operations):
+        """
+        Time operations with statements sent as SQL text, then as server-side prepared statements.
+        Args:
+            operations (dict): Maps a name to ``(func, argument_lists)``, or to
+                ``(func, direct_argument_lists, prepared_argument_lists)`` when the same
+                arguments cannot be used twice, e.g. for deletions.
+        Returns:
+            dict: For each operation, the 'direct' and 'prepared' summaries and the change of
+            the mean latency in percent.
+        """
+        enabled = prepared_statements.enabled
+        results = {}
+        try:
+            for name, (func, direct_arguments, *prepared_arguments) in operations.items():
+                prepared_statements.enabled = False
+                direct = summarize(*time_calls(func, direct_arguments))
+                prepared_statements.enabled = True
+                prepared = summarize(*time_calls(func, prepared_arguments[0] if prepared_arguments
+                                                 else direct_arguments))
+                change = (prepared['mean_ms'] / direct['mean_ms'] - 1) * 100 if direct['mean_ms'] else 0.0
+                results[name] = {'direct': direct, 'prepared': prepared, 'mean_change_pct': round(change, 1)}
+        finally:
+            prepared_statements.enabled = enabled
+        return results
+
+    def seed(self, row_count):
+        """
+        Recreate the scratch table and load ``row_count`` generated students with COPY.
+        Returns:
+            dict: Summary of the bulk import.
+        """
+        self.drop_table()
+        CreateStudent(self.connection, self.table_name).create_student_table()
+
+        with tempfile.TemporaryDirectory() as directory:
+            csv_path = os.path.join(directory, 'students.csv')
+            with open(csv_path, 'w', newline='', encoding='utf-8') as output:
+                writer = csv.writer(output)
+                writer.writerow(('name', 'address', 'age', 'number'))
+                writer.writerows(random_student(index) for index in range(row_count))
+
+            importer = BulkStudentImporter(self.connection, self.table_name, batch_size=50000)
+            baseline = start_memory_peak()
+            summary = importer.import_csv(csv_path, os.path.join(directory, 'rejects.csv'))
+            memory = memory_peaks(baseline)
+
+        with borrow_connection(self.connection) as connection:
+            with connection.cursor() as cursor:
+                cursor.execute(sql.SQL('ANALYZE {table_name}').format(table_name=sql.Identifier(self.table_name)))
+            connection.commit()
+
+        return summarize([summary['seconds']], summary['imported'], memory)
+
+    def student_ids(self):
+        """Return the IDs of every student in the scratch table."""
+        with borrow_connection(self.connection) as connection:
+            with connection.cursor() as cursor:
+                cursor.execute(sql.SQL('SELECT id FROM {table_name}').format(
+                    table_name=sql.Identifier(self.table_name)))
+                ids = [row[0] for row in cursor.fetchall()]
+            connection.commit()
+        return ids
+
+    def drop_table(self):
+        """Drop the scratch table and its change trigger functions, and forget its migrations."""
+        with borrow_connection(self.connection) as connection:
+            with connection.cursor() as cursor:
+                # The per-row function of migration 3 and the per-statement one that replaced it in migration 5
+                cursor.execute(sql.SQL('DROP TABLE IF EXISTS {table_name}; '
+                                       'DROP FUNCTION IF EXISTS {row_function}(), {function}()').format(
+                    table_name=sql.Identifier(self.table_name),
+                    row_function=sql.Identifier(f'{self.table_name}_notify_change'),
+                    function=sql.Identifier(f'{self.table_name}_notify_changes')))
+            connection.commit()
+        # Otherwise the next run would consider the dropped table up to date
+        SchemaMigrator(self.connection, self.table_name).forget()
+
+    @staticmethod
+    def _batch_rows(func, argument_lists):
+        """Time batch calls, counting the rows passed to each call instead of its result."""
+        latencies, _, memory = time_calls(func, argument_lists)
+        return latencies, sum(len(args[0]) for args in argument_lists), memory
+
+
+def main():
+    """Run the CRUD benchmark from the command line and print or save the JSON report."""
+    from crud_operations.db import db_params
+
+    parser = argparse.ArgumentParser(description='Benchmark the CRUD layer against a local PostgreSQL.')
+    parser.add_argument('--rows', type=int, nargs='+', default=list(DEFAULT_SIZES),
+                        help='Row counts to seed the table with, one run each')
+    parser.add_argument('--iterations', type=int, default=200, help='Calls per single-row operation')
+    parser.add_argument('--batch-size', type=int, default=1000, help='Rows per batch update or delete')
+    parser.add_argument('--table', default='students_bench', help='Scratch table, dropped before each run')
+    parser.add_argument('--keep', action='store_true', help='Keep the scratch table after the last run')
+    parser.add_argument('--seed', type=int, default=0, help='Seed of the generated data')
+    parser.add_argument('--output', help='Write the JSON report to this file instead of stdout')
+    parser.add_argument('--memory', action='store_true',
+                        help='Also report the peak Python memory of each operation with tracemalloc; '
+                             'tracing slows the Python side of every call, so latencies are higher')
+    args = parser.parse_args()
+
+    random.seed(args.seed)
+    if args.memory:
+        tracemalloc.start()
+    connection = psycopg2.connect(**db_params)
+    benchmark = CrudBenchmark(connection, args.table, args.iterations, args.batch_size)
+    report = {
+        'started_at': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'psycopg2': psycopg2.__version__.split()[0],
+        'server_version': connection.server_version,
+        'iterations': args.iterations,
+        'batch_size': args.batch_size,
+        'memory_traced': args.memory,
+        'runs': {},
+    }
+    try:
+        for row_count in args.rows:
+            print(f'Benchmarking with {row_count} rows...', file=sys.stderr)
+            report['runs'][str(row_count)] = benchmark.run(row_count)
+        if not args.keep:
+            benchmark.drop_table()
+    finally:
+        connection.close()
+
+    output = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as report_file:
+            report_file.write(output + '\n')
+    else:
+        print(output)
+
+
+if __name__ == '__main__':
+    main()
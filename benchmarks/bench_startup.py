@@ -0,0 +1,130 @@
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+from http_api.load_test import percentile
+
+# Time from interpreter start until the main window is drawn that a cold start should stay under
+STARTUP_TARGET_MS = 500
+
+# Modules main.py must not import before the main window is shown
+LAZY_MODULES = (
+    'psycopg2',
+    'crud_operations.db',
+    'crud_operations.create_student_table',
+    'gui.create_student_window',
+    'gui.delete_student_window',
+    'gui.read_student_window',
+    'gui.statistics_window',
+    'gui.update_student_window',
+    'gui.update_student_attribute_window',
+    'gui.profiler',
+)
+
+# Run in a fresh interpreter, so every measurement is a cold start
+STARTUP_PROBE = '''
+import json, sys, time
+started = time.perf_counter()
+import main
+result = {{'import_ms': (time.perf_counter() - started) * 1000, 'window_ms': None, 'window_error': None,
+          'eagerly_imported': [name for name in {lazy_modules!r} if name in sys.modules]}}
+if {window!r}:
+    import tkinter  # Already imported by main.py
+    try:
+        root = main.Tk()
+        main.MainWindow(root)
+        root.update()  # Draw the window
+        result['window_ms'] = (time.perf_counter() - started) * 1000
+        root.destroy()
+    except tkinter.TclError as e:  # No display available
+        result['window_error'] = str(e)
+print(json.dumps(result))
+'''
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def probe_startup(window=True):
+    """
+    Start the GUI in a fresh interpreter, without connecting to the database, and time it.
+    Args:
+        window (bool): Also create and draw the main window; needs a display.
+    Returns:
+        dict: 'import_ms' to import main.py, 'window_ms' until the main window is drawn (None
+        without a display, with the reason in 'window_error'), 'process_ms' for the whole
+        process including interpreter start and exit, and the lazy modules imported too early.
+    """
+    script = STARTUP_PROBE.format(lazy_modules=LAZY_MODULES, window=window)
+    started = time.perf_counter()
+    completed = subprocess.run([sys.executable, '-c', script], cwd=PROJECT_ROOT,
+                               capture_output=True, text=True, check=True)
+    result = json.loads(completed.stdout.strip().splitlines()[-1])
+    result['process_ms'] = (time.perf_counter() - started) * 1000
+    return result
+
+
+def summarize_ms(values):
+    """Return the mean, p50 and max of a list of milliseconds, or None if it is empty."""
+    ordered = sorted(value for value in values if value is not None)
+    if not ordered:
+        return None
+    return {
+        'mean_ms': round(statistics.fmean(ordered), 1),
+        'p50_ms': round(percentile(ordered, 0.50), 1),
+        'max_ms': round(ordered[-1], 1),
+    }
+
+
+def measure_startup(runs=5, window=True, target_ms=STARTUP_TARGET_MS):
+    """
+    Measure the cold start of the GUI several times and compare it with the target.
+    Args:
+        runs (int): Number of fresh interpreters to start.
+        window (bool): Also time drawing the main window.
+        target_ms (float): Startup time the median run should stay under.
+    Returns:
+        dict: Summaries of each timing, the lazy modules imported too early, and whether the
+        median time until the window is drawn (or main.py is imported, without a display)
+        meets the target.
+    """
+    probes = [probe_startup(window) for _ in range(runs)]
+    report = {
+        'runs': runs,
+        'target_ms': target_ms,
+        'import': summarize_ms([probe['import_ms'] for probe in probes]),
+        'window': summarize_ms([probe['window_ms'] for probe in probes]),
+        'process': summarize_ms([probe['process_ms'] for probe in probes]),
+        'window_error': probes[-1]['window_error'],
+        'eagerly_imported': sorted({name for probe in probes for name in probe['eagerly_imported']}),
+    }
+    measured = report['window'] or report['import']
+    report['meets_target'] = measured['p50_ms'] <= target_ms and not report['eagerly_imported']
+    return report
+
+
+def main():
+    """Measure the cold start of the GUI from the command line and print or save the JSON report."""
+    parser = argparse.ArgumentParser(description='Measure how quickly the main window appears.')
+    parser.add_argument('--runs', type=int, default=5, help='Number of cold starts')
+    parser.add_argument('--target-ms', type=float, default=STARTUP_TARGET_MS,
+                        help='Median time until the main window is drawn that counts as a pass')
+    parser.add_argument('--no-window', action='store_true', help='Only time importing main.py (no display needed)')
+    parser.add_argument('--output', help='Write the JSON report to this file instead of stdout')
+    args = parser.parse_args()
+
+    report = measure_startup(args.runs, not args.no_window, args.target_ms)
+    output = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as report_file:
+            report_file.write(output + '\n')
+    else:
+        print(output)
+    sys.exit(0 if report['meets_target'] else 1)
+
+
+if __name__ == '__main__':
+    main()
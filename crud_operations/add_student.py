@@ -1,5 +1,9 @@
 from psycopg2 import sql
-from tkinter import messagebox
+
+from crud_operations.connection_pool import borrow_connection
+from crud_operations.exceptions import DatabaseOperationError
+from crud_operations.prepared_statements import prepared_statements
+from crud_operations.validation import validate_student
 
 
 class AddStudent:
@@ -7,15 +11,17 @@ class AddStudent:
     Class responsible for adding a new student record to the database.
     """
 
-    def __init__(self, db_connection, table_name='students2_1'):
+    def __init__(self, db_connection, table_name='students2_1', cache=None):
         """
          Initialize with database connection and optional table name.
          Args:
-             db_connection: Active connection to the database.
+             db_connection: Active connection or connection pool for the database.
              table_name (str): The database table name (default is 'students2_1').
+             cache (StudentCache): Optional row cache invalidated when a student is added.
          """
         self.connection = db_connection
         self.table_name = table_name
+        self.cache = cache
 
     def add_student(self, name, address, age, number):
         """
@@ -25,50 +31,42 @@ class AddStudent:
             address (str): Address of the student.
             age (int): Age of the student.
             number (str): Contact number of the student.
+        Returns:
+            tuple: The inserted (id, name, address, age, number) row.
+        Raises:
+            ValidationError: If a field is missing or invalid.
+            DatabaseOperationError: If the insert failed.
         """
-        # Validate input fields
-        if not name or not address or not age:
-            messagebox.showerror('Missing Fields', 'Please fill out all fields.')
-            return
-
-        # Validate the phone number format
-        if not self.is_valid_phone_number(number):
-            messagebox.showerror('Invalid Phone Number',
-                                 'Please enter a valid phone number.')
-            return
+        # Validate input fields and ensure age is an integer
+        age = validate_student(name, address, age, number)
 
-        try:
-            age = int(age)  # Ensure age is an integer
-        except ValueError:
-            messagebox.showerror('Invalid Age', 'Please enter a valid number for age.')
-            return
+        with borrow_connection(self.connection) as connection:
+            try:
+                # Create a cursor for executing SQL queries
+                cursor = connection.cursor()
 
-        try:
-            # Create a cursor for executing SQL queries
-            cursor = self.connection.cursor()
-
-            # Prepare the SQL query for insertion with parameterized inputs
-            insert_data = sql.SQL("""
+                # The parameterized insert is composed once per table and prepared once per connection
+                insert_data = prepared_statements.statement(('add_student', self.table_name), lambda: sql.SQL("""
                  INSERT INTO {table_name} (name, address, age, number)
                  VALUES (%s, %s, %s, %s)
-                    """).format(table_name=sql.Identifier(self.table_name))
-
-            # Execute the query with parameters
-            cursor.execute(insert_data, (name, address, age, number))
+                 RETURNING id, name, address, age, number
+                    """).format(table_name=sql.Identifier(self.table_name)))
 
-            # Commit the changes to the database
-            self.connection.commit()
-            messagebox.showinfo('Success', 'Student added successfully!')
+                # Execute the query with parameters
+                prepared_statements.execute(cursor, insert_data, (name, address, age, number))
+                student = cursor.fetchone()
 
-        except Exception as e:
-            # Handle any errors during the database operation
-            messagebox.showerror('Database Error', f'Error inserting data: {e}')
-            self.connection.rollback()  # Rollback if an error occurs to maintain data integrity
+                # Commit the changes to the database
+                connection.commit()
+                if self.cache:
+                    self.cache.record_change(student)  # Cached query results no longer include every row
+                return student
 
-        finally:
-            # Close the cursor
-            cursor.close()
+            except Exception as e:
+                # Rollback if an error occurs to maintain data integrity
+                connection.rollback()
+                raise DatabaseOperationError(f'Error inserting data: {e}') from e
 
-    def is_valid_phone_number(self, number):
-        """Validates that the phone number has 10 digits."""
-        return len(number) == 10 and number.isdigit()
+            finally:
+                # Close the cursor
+                cursor.close()
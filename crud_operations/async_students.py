@@ -0,0 +1,329 @@
+import asyncio
+import logging
+
+try:
+    import asyncpg
+except ImportError:  # The async layer is optional; the Tkinter application only needs psycopg2
+    asyncpg = None
+
+from crud_operations.validation import FIELD_TYPES, validate_field_value, validate_student, validate_student_id
+
+# Set up logging
+logging.basicConfig(filename='app.log', level=logging.ERROR,
+                    format='%(asctime)s - %(levelname)s - %(message)s')
+
+
+def quote_identifier(name):
+    """Quote a table or index name for use in a SQL statement, like ``sql.Identifier`` does."""
+    return '"{}"'.format(name.replace('"', '""'))
+
+
+async def create_async_pool(min_size=1, max_size=10, **db_params):
+    """
+    Create an asyncpg connection pool to the PostgreSQL database.
+    Args:
+        min_size (int): Number of connections opened up front.
+        max_size (int): Maximum number of connections.
+        **db_params: psycopg2-style connection parameters (dbname, user, password, host, port).
+            Defaults to the parameters read from the environment by ``crud_operations.db``.
+    Returns:
+        asyncpg.Pool: The connection pool.
+    """
+    if asyncpg is None:
+        raise RuntimeError('The asyncpg package is required for the async data-access layer.')
+
+    if not db_params:
+        from crud_operations.db import db_params
+
+    params = dict(db_params)
+    if 'dbname' in params:
+        params['database'] = params.pop('dbname')  # asyncpg names it "database"
+    if 'port' in params:
+        params['port'] = int(params['port'])
+
+    return await asyncpg.create_pool(min_size=min_size, max_size=max_size, **params)
+
+
+class AsyncStudentDatabase:
+    """
+    Asyncio counterpart of the ``crud_operations`` classes, built on an asyncpg pool.
+
+    Every method borrows a connection from the pool only for the duration of its
+    statement, so many coroutines can share one pool. Nothing is shown to the user:
+    invalid input raises ``ValidationError``, a missing student is reported through the
+    return value, and database errors propagate as asyncpg exceptions.
+    """
+
+    def __init__(self, pool, table_name='students2_1', cache=None):
+        """
+        Initialize with an asyncpg pool and table name.
+        Args:
+            pool (asyncpg.Pool): Pool created with ``create_async_pool``.
+            table_name (str): Name of the database table.
+            cache (StudentCache): Optional row cache kept in sync with changes.
+        """
+        self.pool = pool
+        self.table_name = table_name
+        self.cache = cache
+        self._table = quote_identifier(table_name)
+
+    async def create_student_table(self, db_connection=None, partition_size=None):
+        """
+        Create the student table, or bring it up to date, with the shared schema migrations.
+
+        Runs ``CreateStudent.create_student_table`` in a worker thread, so the versions
+        recorded in ``schema_migrations`` and the partitioned layout are the same whichever
+        layer creates the table first. The migrations are psycopg2 ``sql`` objects, which
+        asyncpg cannot render, so they are applied over a psycopg2 connection.
+        Args:
+            db_connection: psycopg2 connection or connection pool to apply the migrations
+                with; if None, a connection is opened with the parameters of
+                ``crud_operations.db`` and closed again.
+            partition_size (int): Partition the table by ranges of this many IDs (defaults
+                to the PARTITION_SIZE environment variable, like ``CreateStudent``).
+        Returns:
+            dict: Sorted 'applied' and 'skipped' migration versions.
+        Raises:
+            ConnectionError: If no connection could be opened.
+            DatabaseOperationError: If the table could not be created or migrated.
+        """
+        from crud_operations.create_student_table import CreateStudent
+        from crud_operations.partitioning import PARTITION_SIZE
+
+        if partition_size is None:
+            partition_size = PARTITION_SIZE
+
+        def migrate():
+            connection = db_connection
+            if connection is None:
+                from crud_operations.db import close_connection, create_connection
+                connection = create_connection()
+                if connection is None:
+                    raise ConnectionError('Could not connect to the database.')
+            try:
+                return CreateStudent(connection, self.table_name, partition_size).create_student_table()
+            finally:
+                if db_connection is None:
+                    close_connection(connection)
+
+        return await asyncio.get_running_loop().run_in_executor(None, migrate)
+
+    async def add_student(self, name, address, age, number):
+        """
+        Insert a new student record.
+        Args:
+            name (str): Name of the student.
+            address (str): Address of the student.
+            age (int): Age of the student.
+            number (str): Contact number of the student.
+        Returns:
+            tuple: The inserted (id, name, address, age, number) row.
+        """
+        age = validate_student(name, address, age, number)
+
+        async with self.pool.acquire() as connection:
+            row = await connection.fetchrow(f"""
+                INSERT INTO {self._table} (name, address, age, number)
+                VALUES ($1, $2, $3, $4)
+                RETURNING id, name, address, age, number
+            """, name, address, age, number)
+
+        student = tuple(row)
+        if self.cache:
+            self.cache.record_change(student)
+        return student
+
+    async def fetch_records(self):
+        """
+        Retrieve every student record, ordered by ID.
+        Returns:
+            list: Student rows as tuples.
+        """
+        async with self.pool.acquire() as connection:
+            rows = await connection.fetch(f'SELECT id, name, address, age, number FROM {self._table} ORDER BY id')
+        return [tuple(row) for row in rows]
+
+    async def fetch_page(self, after_id=0, limit=200):
+        """
+        Retrieve one page of student records, using the keyset scheme of ``StudentDataReader.fetch_page``.
+        Args:
+            after_id (int): ID of the last row of the previous page (0 for the first page).
+            limit (int): Maximum number of rows to return.
+        Returns:
+            list: Student rows as tuples.
+        """
+        async with self.pool.acquire() as connection:
+            rows = await connection.fetch(f"""
+                SELECT id, name, address, age, number FROM {self._table}
+                WHERE id > $1
+                ORDER BY id
+                LIMIT $2
+            """, after_id, limit)
+        return [tuple(row) for row in rows]
+
+    async def find_student_by_id(self, student_id):
+        """
+        Fetch a student by ID.
+        Args:
+            student_id (int): The student's ID.
+        Returns:
+            tuple: The (id, name, address, age, number) row, or None if the student does not exist.
+        """
+        student_id = int(student_id)
+        if self.cache:
+            cached = self.cache.get(student_id)
+            if cached is not None:
+                return cached
+            version = self.cache.version  # Read before querying so concurrent changes are not hidden
+
+        async with self.pool.acquire() as connection:
+            row = await connection.fetchrow(f"""
+                SELECT id, name, address, age, number FROM {self._table}
+                WHERE id = $1
+            """, student_id)
+
+        if row is None:
+            return None
+        student = tuple(row)
+        if self.cache:
+            self.cache.put(student, version)
+        return student
+
+    async def update_all_student_fields(self, student_id, name, address, age, number):
+        """
+        Update the name, address, age and number of a student.
+        Returns:
+            tuple: The updated student row, or None if the student was not found.
+        """
+        age = validate_student(name, address, age, number)
+
+        async with self.pool.acquire() as connection:
+            row = await connection.fetchrow(f"""
+                UPDATE {self._table}
+                SET name = $1, address = $2, age = $3, number = $4
+                WHERE id = $5
+                RETURNING id, name, address, age, number
+            """, name, address, age, number, int(student_id))
+
+        return self._record_update(row)
+
+    async def update_student_field(self, student_id, field_choice, value):
+        """
+        Update a specific field of a student record.
+        Args:
+            student_id (int): ID of the student to update.
+            field_choice (str): Field to be updated ('name', 'address', 'age', 'number').
+            value: New value for the field.
+        Returns:
+            tuple: The updated student row, or None if the student was not found.
+        """
+        value = validate_field_value(field_choice, value)
+
+        async with self.pool.acquire() as connection:
+            row = await connection.fetchrow(f"""
+                UPDATE {self._table}
+                SET {quote_identifier(field_choice)} = $1
+                WHERE id = $2
+                RETURNING id, name, address, age, number
+            """, value, int(student_id))
+
+        return self._record_update(row)
+
+    async def update_students_fields(self, updates):
+        """
+        Apply many attribute updates in a single transaction, one statement per field.
+
+        Each field group is passed as two arrays and joined with ``unnest``. When the same
+        field of the same student appears more than once, the last value wins.
+        Args:
+            updates (iterable): ``(student_id, field, value)`` tuples.
+        Returns:
+            dict: 'matched' and 'unmatched' counts of distinct student IDs, and the sorted 'unmatched_ids'.
+        """
+        values_by_field = {}
+        for student_id, field_choice, value in updates:
+            value = validate_field_value(field_choice, value)
+            values_by_field.setdefault(field_choice, {})[validate_student_id(student_id)] = value
+
+        requested_ids = {student_id for values in values_by_field.values() for student_id in values}
+        matched_ids = set()
+
+        async with self.pool.acquire() as connection:
+            async with connection.transaction():
+                for field_choice, values in values_by_field.items():
+                    field_type = FIELD_TYPES[field_choice]
+                    rows = await connection.fetch(f"""
+                        UPDATE {self._table} AS s
+                        SET {quote_identifier(field_choice)} = v.value
+                        FROM unnest($1::int[], $2::{field_type}[]) AS v(id, value)
+                        WHERE s.id = v.id
+                        RETURNING s.id
+                    """, list(values), list(values.values()))
+                    matched_ids.update(row[0] for row in rows)
+
+        if self.cache:
+            for student_id in matched_ids:
+                self.cache.invalidate(student_id)
+
+        unmatched_ids = sorted(requested_ids - matched_ids)
+        return {'matched': len(matched_ids), 'unmatched': len(unmatched_ids), 'unmatched_ids': unmatched_ids}
+
+    async def delete_student(self, student_id):
+        """
+        Delete a student record by ID.
+        Args:
+            student_id (int): ID of the student to delete.
+        Returns:
+            bool: True if the student was deleted, False if it did not exist.
+        """
+        async with self.pool.acquire() as connection:
+            deleted_id = await connection.fetchval(f"""
+                DELETE FROM {self._table}
+                WHERE id = $1
+                RETURNING id
+            """, int(student_id))
+
+        if deleted_id is None:
+            return False
+        self._invalidate([deleted_id])
+        return True
+
+    async def delete_students(self, student_ids):
+        """
+        Delete several student records in a single statement.
+        Args:
+            student_ids (list[int]): IDs of the students to delete.
+        Returns:
+            tuple: (deleted_ids, missing_ids) sorted lists.
+        """
+        student_ids = sorted({int(student_id) for student_id in student_ids})
+        if not student_ids:
+            return [], []
+
+        async with self.pool.acquire() as connection:
+            rows = await connection.fetch(f"""
+                DELETE FROM {self._table}
+                WHERE id = ANY($1::int[])
+                RETURNING id
+            """, student_ids)
+
+        deleted_ids = sorted(row[0] for row in rows)
+        self._invalidate(deleted_ids)
+
+        deleted = set(deleted_ids)
+        return deleted_ids, [student_id for student_id in student_ids if student_id not in deleted]
+
+    def _record_update(self, row):
+        """Convert an updated row to a tuple and keep the cache in sync."""
+        if row is None:
+            return None
+        student = tuple(row)
+        if self.cache:
+            self.cache.record_change(student)
+        return student
+
+    def _invalidate(self, student_ids):
+        """Drop deleted students from the cache, if one is used."""
+        if self.cache:
+            for student_id in student_ids:
+                self.cache.invalidate(student_id)
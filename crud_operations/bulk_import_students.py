@@ -0,0 +1,191 @@
+import argparse
+import csv
+import io
+import logging
+import time
+
+import psycopg2
+from psycopg2 import sql
+from psycopg2.extras import execute_values
+
+from crud_operations.connection_pool import borrow_connection
+from crud_operations.exceptions import ValidationError
+from crud_operations.validation import validate_student
+
+# Set up logging
+logging.basicConfig(filename='app.log', level=logging.ERROR,
+                    format='%(asctime)s - %(levelname)s - %(message)s')
+
+# Columns expected in the CSV header, in the order they are loaded into the table
+STUDENT_COLUMNS = ('name', 'address', 'age', 'number')
+
+
+class BulkStudentImporter:
+    """
+    Class responsible for loading large CSV files of students into the database.
+    """
+
+    def __init__(self, db_connection, table_name='students2_1', batch_size=5000):
+        """
+        Initialize with database connection and optional table name.
+        Args:
+            db_connection: Active connection or connection pool for the database.
+            table_name (str): The database table name (default is 'students2_1').
+            batch_size (int): Number of valid rows loaded and committed at a time.
+        """
+        self.connection = db_connection
+        self.table_name = table_name
+        self.batch_size = batch_size
+
+    def import_csv(self, csv_path, reject_path, use_copy=True):
+        """
+        Validate and load every row of a CSV file into the student table.
+
+        Rows are read in a single streaming pass and checked with ``validate_student``,
+        like the rows added by ``AddStudent.add_student``. Valid rows are loaded in batches with
+        ``COPY FROM STDIN`` (or ``execute_values`` if COPY is unavailable), and
+        invalid rows are written to ``reject_path`` together with the reason.
+        Args:
+            csv_path (str): Path of a CSV file with a name, address, age, number header.
+            reject_path (str): Path of the CSV file that receives rejected rows.
+            use_copy (bool): Load batches with COPY; set to False to always use INSERT.
+        Returns:
+            dict: Number of 'imported' and 'rejected' rows and the elapsed 'seconds'.
+        """
+        started = time.perf_counter()
+        imported = 0
+        rejected = 0
+
+        with open(csv_path, newline='', encoding='utf-8') as source, \
+                open(reject_path, 'w', newline='', encoding='utf-8') as rejects, \
+                borrow_connection(self.connection) as connection:
+            reader = csv.DictReader(source)
+            missing_columns = set(STUDENT_COLUMNS) - set(reader.fieldnames or ())
+            if missing_columns:
+                raise ValueError(f'CSV file is missing columns: {", ".join(sorted(missing_columns))}')
+
+            reject_writer = csv.writer(rejects)
+            reject_writer.writerow(('line', 'reason') + STUDENT_COLUMNS)
+
+            batch = []  # Validated rows waiting to be loaded
+            batch_lines = []  # Source line numbers of the rows in the batch
+            for row in reader:
+                values = [row.get(column) or '' for column in STUDENT_COLUMNS]
+                error = self.validate_row(*values)
+                if error:
+                    reject_writer.writerow([reader.line_num, error] + values)
+                    rejected += 1
+                    continue
+
+                batch.append((values[0], values[1], int(values[2]), values[3]))
+                batch_lines.append(reader.line_num)
+                if len(batch) >= self.batch_size:
+                    loaded = self._load_batch(connection, batch, batch_lines, reject_writer, use_copy)
+                    imported += loaded
+                    rejected += len(batch) - loaded
+                    batch, batch_lines = [], []
+
+            if batch:
+                loaded = self._load_batch(connection, batch, batch_lines, reject_writer, use_copy)
+                imported += loaded
+                rejected += len(batch) - loaded
+
+        return {'imported': imported, 'rejected': rejected,
+                'seconds': time.perf_counter() - started}
+
+    @staticmethod
+    def validate_row(name, address, age, number):
+        """
+        Check one row with the rules applied by ``AddStudent.add_student``.
+        Args:
+            name (str): Name of the student.
+            address (str): Address of the student.
+            age (str): Age of the student.
+            number (str): Contact number of the student.
+        Returns:
+            str: The reason the row is invalid, or None if it can be loaded.
+        """
+        try:
+            validate_student(name, address, age, number)
+        except ValidationError as error:
+            return str(error)
+        return None
+
+    def _load_batch(self, connection, batch, batch_lines, reject_writer, use_copy):
+        """
+        Load one batch of validated rows and commit it.
+
+        Falls back from COPY to ``execute_values`` when COPY fails, and rejects the
+        whole batch if the database refuses it either way.
+        Returns:
+            int: Number of rows loaded.
+        """
+        if use_copy:
+            try:
+                self._copy_batch(connection, batch)
+                connection.commit()
+                return len(batch)
+            except psycopg2.Error as e:
+                logging.error(f'COPY into {self.table_name} failed, falling back to INSERT: {e}')
+                connection.rollback()
+
+        try:
+            self._insert_batch(connection, batch)
+            connection.commit()
+            return len(batch)
+        except psycopg2.Error as e:
+            logging.error(f'Batch insert into {self.table_name} failed: {e}')
+            connection.rollback()
+            for line, values in zip(batch_lines, batch):
+                reject_writer.writerow([line, f'Database error: {str(e).strip()}'] + list(values))
+            return 0
+
+    def _copy_batch(self, connection, batch):
+        """Stream a batch of rows to the server with COPY FROM STDIN."""
+        buffer = io.StringIO()
+        csv.writer(buffer).writerows(batch)
+        buffer.seek(0)
+
+        copy_query = sql.SQL("""
+            COPY {table_name} (name, address, age, number) FROM STDIN WITH (FORMAT csv)
+        """).format(table_name=sql.Identifier(self.table_name))
+
+        with connection.cursor() as cursor:
+            cursor.copy_expert(copy_query, buffer)
+
+    def _insert_batch(self, connection, batch):
+        """Insert a batch of rows with a single multi-row INSERT statement."""
+        insert_query = sql.SQL("""
+            INSERT INTO {table_name} (name, address, age, number) VALUES %s
+        """).format(table_name=sql.Identifier(self.table_name))
+
+        with connection.cursor() as cursor:
+            execute_values(cursor, insert_query, batch, page_size=len(batch))
+
+
+def main():
+    """Import a CSV file of students from the command line."""
+    from crud_operations.db import create_connection, close_connection
+
+    parser = argparse.ArgumentParser(description='Bulk import students from a CSV file.')
+    parser.add_argument('csv_path', help='CSV file with a name,address,age,number header')
+    parser.add_argument('--rejects', default='rejected_students.csv',
+                        help='CSV file that receives rejected rows')
+    parser.add_argument('--batch-size', type=int, default=5000)
+    parser.add_argument('--table', default='students2_1')
+    args = parser.parse_args()
+
+    conn = create_connection()
+    if not conn:
+        raise SystemExit('Could not connect to the database.')
+    try:
+        importer = BulkStudentImporter(conn, args.table, args.batch_size)
+        summary = importer.import_csv(args.csv_path, args.rejects)
+        print(f"Imported {summary['imported']} rows, rejected {summary['rejected']} rows "
+              f"in {summary['seconds']:.2f} seconds.")
+    finally:
+        close_connection(conn)
+
+
+if __name__ == '__main__':
+    main()
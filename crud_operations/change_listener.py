@@ -0,0 +1,76 @@
+import json
+import logging
+
+from psycopg2 import sql
+
+# Set up logging
+logging.basicConfig(filename='app.log', level=logging.ERROR,
+                    format='%(asctime)s - %(levelname)s - %(message)s')
+
+# Statements changing more rows than this publish a single RELOAD instead of one notification per row
+BULK_CHANGE_ROWS = 100
+
+# Operation of the notification telling listeners to re-read everything they show
+RELOAD = 'RELOAD'
+
+
+def change_channel(table_name):
+    """Return the NOTIFY channel on which changes to a table are published."""
+    return f'{table_name}_changes'
+
+
+class StudentChangeListener:
+    """
+    Receives the change feed published by the trigger installed by ``CreateStudent``.
+
+    Every insert, update or delete on the student table sends a ``NOTIFY`` with a
+    JSON payload such as ``{"op": "UPDATE", "id": 42}``. Statements changing more than
+    ``BULK_CHANGE_ROWS`` rows, and purges of whole partitions, send a single
+    ``{"op": "RELOAD"}`` instead. The listener needs a connection of its own, because
+    the connection is switched to autocommit and kept listening.
+    """
+
+    def __init__(self, connection, table_name='students2_1'):
+        """
+        Initialize the listener.
+        Args:
+            connection: A dedicated psycopg2 connection, owned by the listener from now on.
+            table_name (str): Name of the database table to follow.
+        """
+        self.connection = connection
+        self.table_name = table_name
+
+    def start(self):
+        """Start listening for changes to the table."""
+        # Notifications are only delivered outside of a transaction
+        self.connection.autocommit = True
+        with self.connection.cursor() as cursor:
+            cursor.execute(sql.SQL('LISTEN {channel}').format(
+                channel=sql.Identifier(change_channel(self.table_name))))
+
+    def poll(self):
+        """
+        Return the changes received since the last call without blocking.
+        Returns:
+            list: ``(op, student_id)`` tuples in the order they were committed,
+            where op is 'INSERT', 'UPDATE' or 'DELETE', or ``('RELOAD', None)`` when
+            too many rows changed to list them.
+        """
+        self.connection.poll()
+        changes = []
+        while self.connection.notifies:
+            notify = self.connection.notifies.pop(0)
+            try:
+                payload = json.loads(notify.payload)
+                if payload['op'] == RELOAD:
+                    changes.append((RELOAD, None))
+                else:
+                    changes.append((payload['op'], int(payload['id'])))
+            except (ValueError, KeyError, TypeError) as e:
+                logging.error(f'Ignoring malformed change notification {notify.payload!r}: {e}')
+        return changes
+
+    def close(self):
+        """Stop listening and close the dedicated connection."""
+        if not self.connection.closed:
+            self.connection.close()
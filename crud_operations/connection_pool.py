@@ -0,0 +1,141 @@
+import logging
+import threading
+import time
+from contextlib import contextmanager
+
+import psycopg2
+from psycopg2 import pool
+
+# Set up logging
+logging.basicConfig(filename='app.log', level=logging.ERROR,
+                    format='%(asctime)s - %(levelname)s - %(message)s')
+
+
+class StudentConnectionPool:
+    """
+    Thread-safe pool of PostgreSQL connections shared by the GUI windows and CRUD classes.
+    """
+
+    def __init__(self, minconn=1, maxconn=5, health_check_interval=30, **db_params):
+        """
+        Initialize the pool and open ``minconn`` connections up front.
+
+        Args:
+            minconn (int): Number of connections kept open at all times.
+            maxconn (int): Maximum number of connections the pool may open.
+            health_check_interval (float): Idle time in seconds after which a connection
+                is pinged before being handed out again.
+            **db_params: Keyword arguments passed to ``psycopg2.connect``.
+        """
+        self.db_params = db_params
+        self.health_check_interval = health_check_interval
+        self._pool = pool.ThreadedConnectionPool(minconn, maxconn, **db_params)
+        self._last_used = {}  # Maps id(connection) to the time it was returned to the pool
+        self._lock = threading.Lock()
+        # Borrowers wait for a free slot instead of failing when the pool is exhausted
+        self._slots = threading.BoundedSemaphore(maxconn)
+
+    @contextmanager
+    def connection(self):
+        """
+        Borrow a healthy connection for the duration of a ``with`` block.
+
+        Blocks while all ``maxconn`` connections are borrowed. Any transaction left open
+        by the caller is rolled back when the connection is returned, and connections
+        that were broken while borrowed are discarded.
+        Yields:
+            A psycopg2 connection object.
+        """
+        self._slots.acquire()
+        try:
+            conn = self._checkout()
+            try:
+                yield conn
+            finally:
+                self._checkin(conn)
+        finally:
+            self._slots.release()
+
+    def open_dedicated_connection(self):
+        """
+        Open a connection outside of the pool for long-lived uses such as LISTEN.
+
+        Returns:
+            A new psycopg2 connection object; the caller is responsible for closing it.
+        """
+        return psycopg2.connect(**self.db_params)
+
+    def close(self):
+        """Close every connection held by the pool."""
+        if not self._pool.closed:
+            self._pool.closeall()
+            print("Connection pool closed.")
+
+    def _checkout(self):
+        """Take a connection from the pool, replacing it if it fails the health check."""
+        # Every connection in the pool may be stale after a network outage, so allow one
+        # attempt per possible connection plus one freshly opened connection.
+        for _ in range(self._pool.maxconn + 1):
+            conn = self._pool.getconn()
+            if self._is_healthy(conn):
+                return conn
+            logging.error('Discarding broken database connection from the pool.')
+            self._discard(conn)
+        raise psycopg2.OperationalError('Could not obtain a healthy connection from the pool.')
+
+    def _checkin(self, conn):
+        """Return a connection to the pool, closing it if it is no longer usable."""
+        if conn.closed:
+            self._discard(conn)
+            return
+        with self._lock:
+            self._last_used[id(conn)] = time.monotonic()
+        self._pool.putconn(conn)
+
+    def _discard(self, conn):
+        """Remove a connection from the pool and close it."""
+        with self._lock:
+            self._last_used.pop(id(conn), None)
+        self._pool.putconn(conn, close=True)
+
+    def _is_healthy(self, conn):
+        """
+        Check that a connection can still talk to the server.
+
+        Connections used within the last ``health_check_interval`` seconds are trusted
+        without a round trip; idle ones are pinged with ``SELECT 1``.
+        """
+        if conn.closed:
+            return False
+
+        with self._lock:
+            last_used = self._last_used.get(id(conn))
+        if last_used is not None and time.monotonic() - last_used < self.health_check_interval:
+            return True
+
+        try:
+            with conn.cursor() as cursor:
+                cursor.execute('SELECT 1')
+            conn.rollback()
+            return True
+        except (psycopg2.OperationalError, psycopg2.InterfaceError):
+            return False
+
+
+@contextmanager
+def borrow_connection(db_connection):
+    """
+    Yield a usable connection from either a pool or a plain connection.
+
+    Lets the CRUD classes accept a ``StudentConnectionPool`` or a single psycopg2
+    connection interchangeably.
+    Args:
+        db_connection: A ``StudentConnectionPool`` or an active database connection.
+    Yields:
+        A psycopg2 connection object.
+    """
+    if isinstance(db_connection, StudentConnectionPool):
+        with db_connection.connection() as conn:
+            yield conn
+    else:
+        yield db_connection
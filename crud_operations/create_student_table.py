@@ -1,7 +1,8 @@
-from psycopg2 import sql, OperationalError
-from tkinter import messagebox
 import logging
 
+from crud_operations.migrations import MIGRATIONS, PARTITIONED_MIGRATIONS, SchemaMigrator, change_trigger_query
+from crud_operations.partitioning import PARTITION_SIZE, PartitionManager
+
 # Set up logging
 logging.basicConfig(filename='app.log', level=logging.ERROR,
                     format='%(asctime)s - %(levelname)s - %(message)s')
@@ -12,51 +13,47 @@ class CreateStudent:
     Class to manage the creation of a student table in a PostgreSQL database.
     """
 
-    def __init__(self, db_connection, table_name='students2_1'):
+    def __init__(self, db_connection, table_name='students2_1', partition_size=PARTITION_SIZE):
         """
         Initialize the CreateStudent instance.
 
         Args:
-            db_connection: A connection object to the PostgreSQL database.
+            db_connection: A connection object or connection pool for the PostgreSQL database.
             table_name (str): The name of the table to create.
+            partition_size (int): If set, the table is partitioned by ranges of this many IDs
+                (defaults to the PARTITION_SIZE environment variable, unset meaning unpartitioned).
         """
         self.connection = db_connection
         self.table_name = table_name
+        self.partition_size = partition_size
 
     def create_student_table(self):
         """
-        Create the student table in the PostgreSQL database if it doesn't already exist.
+        Create the student table, or bring it up to date, by applying its pending migrations.
+
+        The table, its search indexes and change trigger are versioned migrations of
+        ``crud_operations.migrations``; when the table is up to date no DDL is sent.
+        A partitioned table also gets the partitions for its next IDs.
+
+        Returns:
+            dict: Sorted 'applied' and 'skipped' migration versions.
+        Raises:
+            DatabaseOperationError: If the table could not be created or migrated, or a
+                partitioned layout is requested for an existing unpartitioned table.
+        """
+        migrations = PARTITIONED_MIGRATIONS if self.partition_size else MIGRATIONS
+        result = SchemaMigrator(self.connection, self.table_name, migrations).migrate()
+        if self.partition_size:
+            PartitionManager(self.connection, self.table_name, self.partition_size).ensure_partitions()
+        if result['applied'] or result['skipped']:
+            print(f'Table {self.table_name} created or migrated successfully.')
+        return result
+
+    def change_trigger_query(self):
+        """
+        Build the DDL of the trigger that sends a NOTIFY for every insert, update or delete.
+
+        Returns:
+            sql.Composed: The statements creating the trigger function and trigger.
         """
-        try:
-            # Initialize cursor to execute SQL queries
-            with self.connection.cursor() as cursor:
-                # Construct the SQL query for creating the table.
-                create_table_query = sql.SQL("""
-                    CREATE TABLE IF NOT EXISTS {table_name} (
-                        id SERIAL PRIMARY KEY,
-                        name TEXT NOT NULL,
-                        address TEXT NOT NULL,
-                        age INT NOT NULL CHECK (age >= 0),  -- Ensures age is non-negative.
-                        number TEXT NOT NULL
-                    );
-                """).format(table_name=sql.Identifier(self.table_name))
-
-                # Execute the SQL query to create the table
-                cursor.execute(create_table_query)
-
-                # Commit the transaction after executing the query to make the changes persistent.
-                self.connection.commit()
-
-                print(f'Table {self.table_name} created or verified successfully.')
-
-        except OperationalError as op_err:
-            # Handle operational database errors
-            logging.error(f'Operational error while creating table {self.table_name}: {op_err}')
-            messagebox.showerror('Database Error', f'Operational error: {op_err}')
-            self.connection.rollback()
-
-        except Exception as e:
-            # Handle unexpected errors
-            logging.error(f'Error creating table {self.table_name}: {e}')
-            messagebox.showerror('Database Error,' f"Error creating table: {e}")
-            self.connection.rollback()  # Rollback in case of error
+        return change_trigger_query(self.table_name)
@@ -1,10 +1,12 @@
 import time
 import os
-from tkinter import messagebox
 import logging
 
 import psycopg2
 
+from crud_operations.connection_pool import StudentConnectionPool
+from crud_operations.instrumentation import InstrumentedCursor
+
 # Set up logging
 logging.basicConfig(filename='app.log', level=logging.ERROR,
                     format='%(asctime)s - %(levelname)s - %(message)s')
@@ -26,8 +28,8 @@ except KeyError as e:
 def create_connection():
     """Create a database connection to the PostgreSQL database."""
     try:
-        # Establishing connection using the predefined parameters
-        connection = psycopg2.connect(**db_params)
+        # Establishing connection using the predefined parameters; every statement is timed
+        connection = psycopg2.connect(cursor_factory=InstrumentedCursor, **db_params)
         print("Connection to PostgreSQL established.")
         return connection
     except Exception as error:
@@ -47,7 +49,7 @@ def close_connection(conn):
 
 
 def create_connection_with_retry(retries=3, delay=5):
-    """Attempt to create a connection with retries."""
+    """Attempt to create a connection with retries, returning None if every attempt failed."""
     for _ in range(retries):
         conn = create_connection()
         if conn:
@@ -55,5 +57,27 @@ def create_connection_with_retry(retries=3, delay=5):
         print(f'Retrying in {delay} seconds...')
         time.sleep(delay)
     logging.error("Failed to establish a connection after several retries.")
-    messagebox.showerror("Database Connection", "Failed to connect to the database. Exiting.")
+    return None
+
+
+def create_connection_pool(minconn=1, maxconn=5):
+    """Create a pool of connections to the PostgreSQL database."""
+    try:
+        connection_pool = StudentConnectionPool(minconn, maxconn, cursor_factory=InstrumentedCursor, **db_params)
+        print("Connection pool to PostgreSQL established.")
+        return connection_pool
+    except Exception as error:
+        logging.error(f"Error: Unable to create the connection pool\n{error}")
+        return None
+
+
+def create_connection_pool_with_retry(retries=3, delay=5, minconn=1, maxconn=5):
+    """Attempt to create a connection pool with retries, returning None if every attempt failed."""
+    for _ in range(retries):
+        connection_pool = create_connection_pool(minconn, maxconn)
+        if connection_pool:
+            return connection_pool
+        print(f'Retrying in {delay} seconds...')
+        time.sleep(delay)
+    logging.error("Failed to establish a connection pool after several retries.")
     return None
@@ -1,22 +1,26 @@
-from tkinter import messagebox
-
 from psycopg2 import sql
 
+from crud_operations.connection_pool import borrow_connection
+from crud_operations.exceptions import DatabaseOperationError
+from crud_operations.prepared_statements import prepared_statements
+
 
 class DeleteStudent:
     """
     Class to handle the deletion of a student record from the database.
     """
 
-    def __init__(self, db_connection, table_name='students2_1'):
+    def __init__(self, db_connection, table_name='students2_1', cache=None):
         """
         Initialize with a database connection and table name.
         Args:
-            db_connection: Active database connection.
+            db_connection: Active database connection or connection pool.
             table_name (str): Name of the database table.
+            cache (StudentCache): Optional row cache invalidated for deleted students.
         """
         self.connection = db_connection
         self.table_name = table_name  # Table name for deleting records
+        self.cache = cache
 
     def delete_student(self, student_id):
         """
@@ -24,39 +28,112 @@ class DeleteStudent:
         Args:
             student_id (int): ID of the student to delete.
         Returns:
-            bool: True if deletion was successful, False otherwise.
-        """
-        try:
-            with self.connection.cursor() as cursor:
-                # Check if the student exists in the database
-                find_student_query = sql.SQL("""
-                             SELECT id FROM {table_name}
-                             WHERE id = %s
-                                """).format(
-                    table_name=sql.Identifier(self.table_name)
-                )
-                cursor.execute(find_student_query, (student_id,))
-                student = cursor.fetchone()
-
-                if not student:
-                    return False  # Student not found
-
-                # Proceed to delete the student if found
-                delete_query = sql.SQL("""
-                     DELETE FROM {table_name} 
+            bool: True if the student was deleted, False if it did not exist.
+        Raises:
+            DatabaseOperationError: If the deletion failed.
+        """
+        with borrow_connection(self.connection) as connection:
+            try:
+                with connection.cursor() as cursor:
+                    # Delete the student and learn whether it existed in the same round trip
+                    delete_query = prepared_statements.statement(('delete_student', self.table_name), lambda: sql.SQL("""
+                     DELETE FROM {table_name}
                      WHERE id = %s
+                     RETURNING id
                         """).format(
-                    table_name=sql.Identifier(self.table_name)
-                )
-                cursor.execute(delete_query, (student_id,))
+                        table_name=sql.Identifier(self.table_name)
+                    ))
+                    prepared_statements.execute(cursor, delete_query, (student_id,))
+                    student = cursor.fetchone()
+
+                    if not student:
+                        connection.rollback()  # Nothing was deleted, just end the transaction
+                        return False  # Student not found
+
+                    # Commit the transaction
+                    connection.commit()
+                    self._invalidate([student_id])
+
+                    return True  # Successfully deleted
+
+            except Exception as e:
+                # Handle errors and rollback transaction if necessary
+                connection.rollback()
+                raise DatabaseOperationError(f'Error deleting student: {e}') from e
+
+    def delete_students(self, student_ids):
+        """
+        Delete several student records in a single statement.
+        Args:
+            student_ids (list[int]): IDs of the students to delete.
+        Returns:
+            tuple: (deleted_ids, missing_ids) sorted lists.
+        Raises:
+            DatabaseOperationError: If the deletion failed.
+        """
+        student_ids = sorted(set(student_ids))
+        if not student_ids:
+            return [], []
+
+        delete_query = sql.SQL("""
+            DELETE FROM {table_name}
+            WHERE id = ANY(%s)
+            RETURNING id
+        """).format(table_name=sql.Identifier(self.table_name))
+
+        with borrow_connection(self.connection) as connection:
+            try:
+                with connection.cursor() as cursor:
+                    cursor.execute(delete_query, (student_ids,))
+                    deleted_ids = sorted(row[0] for row in cursor.fetchall())
+
+                # Commit the whole batch at once
+                connection.commit()
+                self._invalidate(deleted_ids)
+
+                deleted = set(deleted_ids)
+                missing_ids = [student_id for student_id in student_ids if student_id not in deleted]
+                return deleted_ids, missing_ids
+
+            except Exception as e:
+                # Handle errors and rollback transaction if necessary
+                connection.rollback()
+                raise DatabaseOperationError(f'Error deleting students: {e}') from e
+
+    def delete_student_range(self, first_id, last_id):
+        """
+        Delete every student record whose ID lies in an inclusive range.
+        Args:
+            first_id (int): First ID of the range.
+            last_id (int): Last ID of the range.
+        Returns:
+            list: Sorted IDs of the deleted students.
+        Raises:
+            DatabaseOperationError: If the deletion failed.
+        """
+        delete_query = sql.SQL("""
+            DELETE FROM {table_name}
+            WHERE id BETWEEN %s AND %s
+            RETURNING id
+        """).format(table_name=sql.Identifier(self.table_name))
+
+        with borrow_connection(self.connection) as connection:
+            try:
+                with connection.cursor() as cursor:
+                    cursor.execute(delete_query, (first_id, last_id))
+                    deleted_ids = sorted(row[0] for row in cursor.fetchall())
 
-                # Commit the transaction
-                self.connection.commit()
+                connection.commit()
+                self._invalidate(deleted_ids)
+                return deleted_ids
 
-                return True  # Successfully deleted
+            except Exception as e:
+                # Handle errors and rollback transaction if necessary
+                connection.rollback()
+                raise DatabaseOperationError(f'Error deleting students: {e}') from e
 
-        except Exception as e:
-            # Handle errors and rollback transaction if necessary
-            self.connection.rollback()
-            messagebox.showerror('Database Error', f'Error deleting student: {e}')
-            return False
+    def _invalidate(self, student_ids):
+        """Drop deleted students from the cache, if one is used."""
+        if self.cache:
+            for student_id in student_ids:
+                self.cache.invalidate(student_id)
@@ -0,0 +1,47 @@
+class StudentServiceError(Exception):
+    """
+    Base class of the errors raised by the ``crud_operations`` classes.
+
+    Every error carries a short ``title`` next to its message, so a user interface
+    can present it without knowing which operation failed.
+    """
+
+    title = 'Error'
+
+    def __init__(self, message, title=None):
+        """
+        Initialize the error.
+        Args:
+            message (str): Description of what went wrong.
+            title (str): Short heading for the error; defaults to the class title.
+        """
+        super().__init__(message)
+        if title is not None:
+            self.title = title
+
+
+class ValidationError(StudentServiceError, ValueError):
+    """Raised when the input of an operation is invalid; nothing was sent to the database."""
+
+    title = 'Invalid Input'
+
+
+class StudentNotFoundError(StudentServiceError, LookupError):
+    """Raised when an operation targets a student ID that does not exist."""
+
+    title = 'Not Found'
+
+    def __init__(self, student_id):
+        """
+        Initialize the error.
+        Args:
+            student_id (int): The ID that was not found.
+        """
+        super().__init__(f'Student with ID {student_id} not found.')
+        self.student_id = student_id
+
+
+class DatabaseOperationError(StudentServiceError):
+    """Raised when the database rejects an operation; the transaction has been rolled back."""
+
+    title = 'Database Error'
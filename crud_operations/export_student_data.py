@@ -0,0 +1,216 @@
+import gzip
+import json
+import os
+
+try:
+    import pyarrow
+    import pyarrow.ipc
+    import pyarrow.parquet
+except ImportError:  # The columnar exports are optional; CSV and JSON Lines only need the standard library
+    pyarrow = None
+
+import psycopg2
+from psycopg2 import sql
+
+from crud_operations.connection_pool import borrow_connection
+from crud_operations.exceptions import DatabaseOperationError
+from crud_operations.read_student_data import StudentDataReader
+
+# Columns written to every export, in table order
+EXPORT_COLUMNS = ('id', 'name', 'address', 'age', 'number')
+
+# Rows per Parquet row group and Arrow record batch; only one is held in memory at a time
+ROW_GROUP_SIZE = 100000
+
+
+def arrow_schema():
+    """Return the Arrow schema of the exported columns, matching the types of the table."""
+    return pyarrow.schema([('id', pyarrow.int32()), ('name', pyarrow.string()), ('address', pyarrow.string()),
+                           ('age', pyarrow.int32()), ('number', pyarrow.string())])
+
+
+class StudentDataExporter:
+    """
+    Class for streaming the student table to CSV, JSON Lines, Parquet or Arrow files.
+    """
+
+    def __init__(self, db_connection, table_name='students2_1'):
+        """
+        Initialize with a database connection and table name.
+        Args:
+            db_connection: Active database connection or connection pool.
+            table_name (str): Name of the database table.
+        """
+        self.connection = db_connection
+        self.table_name = table_name
+
+    def export_csv(self, path, compress=False):
+        """
+        Write the whole table to a CSV file with a header row.
+
+        The server formats the rows itself with ``COPY ... TO STDOUT`` and they are
+        written straight to disk as they arrive, so client memory stays bounded.
+        Args:
+            path (str): Destination file path.
+            compress (bool): Gzip-compress the output.
+        Returns:
+            int: Number of rows exported.
+        Raises:
+            DatabaseOperationError: If the table could not be read.
+        """
+        copy_query = sql.SQL("""
+            COPY (SELECT id, name, address, age, number FROM {table_name} ORDER BY id)
+            TO STDOUT WITH (FORMAT csv, HEADER)
+        """).format(table_name=sql.Identifier(self.table_name))
+
+        try:
+            with borrow_connection(self.connection) as connection, \
+                    self._open_output(path, compress) as output:
+                try:
+                    with connection.cursor() as cursor:
+                        cursor.copy_expert(copy_query, output)
+                        exported = cursor.rowcount
+                    # End the read-only transaction
+                    connection.commit()
+                except psycopg2.DatabaseError as error:
+                    connection.rollback()
+                    raise DatabaseOperationError(f'Failed to export records: {error}') from error
+        except BaseException:
+            self._remove_partial(path)
+            raise
+
+        return exported
+
+    def export_jsonl(self, path, compress=False, itersize=2000):
+        """
+        Write the whole table to a JSON Lines file, one student object per line.
+
+        Rows are read through the server-side cursor of ``StudentDataReader.stream_records``.
+        Args:
+            path (str): Destination file path.
+            compress (bool): Gzip-compress the output.
+            itersize (int): Number of rows fetched from the server per round trip.
+        Returns:
+            int: Number of rows exported.
+        Raises:
+            DatabaseOperationError: If the table could not be read.
+        """
+        reader = StudentDataReader(self.connection, self.table_name)
+        exported = 0
+
+        try:
+            with self._open_output(path, compress) as output:
+                for record in reader.stream_records(itersize):
+                    output.write(json.dumps(dict(zip(EXPORT_COLUMNS, record))))
+                    output.write('\n')
+                    exported += 1
+        except BaseException:
+            self._remove_partial(path)
+            raise
+
+        return exported
+
+    def export_parquet(self, path, compression='zstd', row_group_size=ROW_GROUP_SIZE, itersize=10000):
+        """
+        Write the whole table to a Parquet file, for analytics tools that read only the columns they need.
+
+        Rows are read through the server-side cursor of ``StudentDataReader.stream_records``
+        and converted to Arrow arrays one row group at a time, so tables larger than memory
+        can be exported.
+        Args:
+            path (str): Destination file path.
+            compression (str): Parquet column compression ('zstd', 'snappy', 'gzip' or 'none').
+            row_group_size (int): Rows per row group.
+            itersize (int): Number of rows fetched from the server per round trip.
+        Returns:
+            int: Number of rows exported.
+        Raises:
+            RuntimeError: If pyarrow is not installed.
+            DatabaseOperationError: If the table could not be read.
+        """
+        self._require_pyarrow()
+        exported = 0
+        try:
+            with pyarrow.parquet.ParquetWriter(path, arrow_schema(), compression=compression) as writer:
+                for batch in self.record_batches(row_group_size, itersize):
+                    writer.write_table(pyarrow.Table.from_batches([batch]), row_group_size=row_group_size)
+                    exported += batch.num_rows
+        except BaseException:
+            # The writer still closes the file with a valid footer, so it would look complete
+            self._remove_partial(path)
+            raise
+        return exported
+
+    def export_arrow(self, path, batch_size=ROW_GROUP_SIZE, itersize=10000):
+        """
+        Write the whole table to an Arrow IPC (Feather v2) file, which can be memory-mapped by readers.
+        Args:
+            path (str): Destination file path.
+            batch_size (int): Rows per record batch.
+            itersize (int): Number of rows fetched from the server per round trip.
+        Returns:
+            int: Number of rows exported.
+        Raises:
+            RuntimeError: If pyarrow is not installed.
+            DatabaseOperationError: If the table could not be read.
+        """
+        self._require_pyarrow()
+        exported = 0
+        try:
+            with pyarrow.OSFile(path, 'wb') as sink, pyarrow.ipc.new_file(sink, arrow_schema()) as writer:
+                for batch in self.record_batches(batch_size, itersize):
+                    writer.write_batch(batch)
+                    exported += batch.num_rows
+        except BaseException:
+            self._remove_partial(path)
+            raise
+        return exported
+
+    def record_batches(self, batch_size=ROW_GROUP_SIZE, itersize=10000):
+        """
+        Stream the table as Arrow record batches.
+        Args:
+            batch_size (int): Rows per record batch.
+            itersize (int): Number of rows fetched from the server per round trip.
+        Yields:
+            pyarrow.RecordBatch: Up to ``batch_size`` students, ordered by ID.
+        """
+        self._require_pyarrow()
+        schema = arrow_schema()
+        reader = StudentDataReader(self.connection, self.table_name)
+        rows = []
+        for record in reader.stream_records(itersize):
+            rows.append(record)
+            if len(rows) == batch_size:
+                yield self._to_batch(rows, schema)
+                rows = []
+        if rows:
+            yield self._to_batch(rows, schema)
+
+    @staticmethod
+    def _to_batch(rows, schema):
+        """Convert row tuples to a record batch, one Arrow array per column."""
+        columns = zip(*rows)
+        return pyarrow.RecordBatch.from_arrays(
+            [pyarrow.array(values, type=field.type) for values, field in zip(columns, schema)], schema=schema)
+
+    @staticmethod
+    def _require_pyarrow():
+        """Raise if the optional pyarrow package is missing."""
+        if pyarrow is None:
+            raise RuntimeError('The pyarrow package is required for Parquet and Arrow exports.')
+
+    @staticmethod
+    def _remove_partial(path):
+        """Delete the output of a failed export, so a truncated file is not taken for a complete one."""
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+    @staticmethod
+    def _open_output(path, compress):
+        """Open the destination file for text writing, gzip-compressed if requested."""
+        if compress:
+            return gzip.open(path, 'wt', encoding='utf-8', newline='')
+        return open(path, 'w', encoding='utf-8', newline='')
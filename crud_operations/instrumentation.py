@@ -0,0 +1,221 @@
+import bisect
+import logging
+import os
+import sys
+import threading
+import time
+
+from psycopg2 import extensions, sql
+
+# Upper bounds in milliseconds of the latency histogram buckets; slower statements fall in '+Inf'
+HISTOGRAM_BUCKETS_MS = (1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+
+# Statements slower than this are written to the slow query log (override with SLOW_QUERY_MS)
+SLOW_QUERY_MS = float(os.environ.get('SLOW_QUERY_MS', 200))
+
+# Longest statement text written to the slow query log
+MAX_LOGGED_STATEMENT = 1000
+
+# Modules that run statements on behalf of a CRUD method, skipped when naming the operation
+PASS_THROUGH_MODULES = {__name__, 'crud_operations.prepared_statements'}
+
+# Slow queries are warnings, which the application-wide ERROR level would drop,
+# so they get their own logger writing to app.log
+slow_query_logger = logging.getLogger('crud_operations.slow_queries')
+slow_query_logger.setLevel(logging.WARNING)
+slow_query_logger.propagate = False
+if not slow_query_logger.handlers:
+    _handler = logging.FileHandler('app.log', delay=True)
+    _handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
+    slow_query_logger.addHandler(_handler)
+
+
+class OperationStats:
+    """Aggregated timings of the statements run by one operation."""
+
+    __slots__ = ('calls', 'errors', 'rows', 'round_trips', 'total_seconds', 'max_seconds', 'buckets')
+
+    def __init__(self):
+        self.calls = 0
+        self.errors = 0
+        self.rows = 0
+        self.round_trips = 0
+        self.total_seconds = 0.0
+        self.max_seconds = 0.0
+        self.buckets = [0] * (len(HISTOGRAM_BUCKETS_MS) + 1)
+
+    def as_dict(self):
+        """Return the statistics as plain values, with times in milliseconds."""
+        labels = [f'<={bound}ms' for bound in HISTOGRAM_BUCKETS_MS] + ['+Inf']
+        return {
+            'calls': self.calls,
+            'errors': self.errors,
+            'rows': self.rows,
+            'round_trips': self.round_trips,
+            'total_ms': round(self.total_seconds * 1000, 3),
+            'mean_ms': round(self.total_seconds * 1000 / self.calls, 3) if self.calls else 0.0,
+            'max_ms': round(self.max_seconds * 1000, 3),
+            'histogram': dict(zip(labels, self.buckets)),
+        }
+
+
+class QueryStats:
+    """
+    Thread-safe registry of statement timings, aggregated per operation.
+
+    An operation is the CRUD method that ran the statement, such as
+    ``AddStudent.add_student``. Listeners registered with ``add_listener`` receive
+    every recorded statement, so timings can also be sent to other monitoring tools.
+    """
+
+    def __init__(self, slow_query_ms=SLOW_QUERY_MS):
+        """
+        Initialize an empty registry.
+        Args:
+            slow_query_ms (float): Statements slower than this are logged; None disables the log.
+        """
+        self.enabled = True
+        self.slow_query_ms = slow_query_ms
+        self._operations = {}
+        self._listeners = []
+        self._lock = threading.Lock()
+
+    def record(self, operation, statement, seconds, rows=0, round_trips=1, error=None):
+        """
+        Record one executed statement.
+        Args:
+            operation (str): Name of the operation that ran the statement.
+            statement: The SQL statement, or a callable returning it, used for the slow
+                query log and listeners; a callable is only called when the text is needed.
+            seconds (float): Time the statement took.
+            rows (int): Rows returned or affected.
+            round_trips (int): Requests sent to the server.
+            error (Exception): The error raised by the statement, if any.
+        """
+        with self._lock:
+            stats = self._operations.get(operation)
+            if stats is None:
+                stats = self._operations[operation] = OperationStats()
+            stats.calls += 1
+            stats.rows += max(rows, 0)
+            stats.round_trips += round_trips
+            stats.total_seconds += seconds
+            stats.max_seconds = max(stats.max_seconds, seconds)
+            stats.buckets[bisect.bisect_left(HISTOGRAM_BUCKETS_MS, seconds * 1000)] += 1
+            if error is not None:
+                stats.errors += 1
+            listeners = list(self._listeners)
+
+        slow = self.slow_query_ms is not None and seconds * 1000 >= self.slow_query_ms
+        if (slow or listeners) and callable(statement):
+            statement = statement()
+
+        if slow:
+            slow_query_logger.warning(
+                f'Slow query in {operation}: {seconds * 1000:.1f} ms, {rows} rows, '
+                f'{round_trips} round trips{" (failed)" if error else ""}: '
+                f'{" ".join(str(statement).split())[:MAX_LOGGED_STATEMENT]}')
+
+        for listener in listeners:
+            listener(operation, statement, seconds, rows, round_trips, error)
+
+    def add_listener(self, listener):
+        """
+        Call ``listener(operation, statement, seconds, rows, round_trips, error)`` for every statement.
+        """
+        with self._lock:
+            self._listeners.append(listener)
+
+    def remove_listener(self, listener):
+        """Stop calling a listener added with ``add_listener``."""
+        with self._lock:
+            self._listeners.remove(listener)
+
+    def snapshot(self):
+        """
+        Return the aggregated statistics.
+        Returns:
+            dict: Statistics of each operation, keyed by operation name.
+        """
+        with self._lock:
+            return {operation: stats.as_dict() for operation, stats in sorted(self._operations.items())}
+
+    def reset(self):
+        """Forget every recorded statement."""
+        with self._lock:
+            self._operations.clear()
+
+
+# Registry shared by every instrumented connection of the application
+query_stats = QueryStats()
+
+
+def calling_operation(frame):
+    """
+    Name the CRUD method a statement was run from by walking up the call stack.
+    Args:
+        frame: The frame to start from.
+    Returns:
+        str: ``Class.method`` (or the function name) of the nearest caller in
+        ``crud_operations``, or None if the statement did not come from there.
+    """
+    while frame is not None:
+        module = frame.f_globals.get('__name__', '')
+        if module.startswith('crud_operations.') and module not in PASS_THROUGH_MODULES:
+            owner = frame.f_locals.get('self')
+            name = frame.f_code.co_name
+            return f'{type(owner).__name__}.{name}' if owner is not None else name
+        frame = frame.f_back
+    return None
+
+
+class InstrumentedCursor(extensions.cursor):
+    """
+    Cursor that records the time, row count and round trips of every statement in ``query_stats``.
+
+    Used as the ``cursor_factory`` of the application's connections, so every cursor the
+    CRUD classes open is instrumented without changing them. The rows of a named
+    (server-side) cursor are fetched in later round trips that are not timed here.
+    """
+
+    def execute(self, query, vars=None):
+        return self._timed(query, 1, super().execute, query, vars)
+
+    def executemany(self, query, vars_list):
+        vars_list = list(vars_list)
+        return self._timed(query, len(vars_list), super().executemany, query, vars_list)
+
+    def copy_expert(self, sql_statement, file, size=8192):
+        return self._timed(sql_statement, 1, super().copy_expert, sql_statement, file, size)
+
+    def _timed(self, query, round_trips, method, *args):
+        """Run a cursor method and record how long it took."""
+        if not query_stats.enabled:
+            return method(*args)
+
+        error = None
+        started = time.perf_counter()
+        try:
+            return method(*args)
+        except Exception as e:
+            error = e
+            raise
+        finally:
+            seconds = time.perf_counter() - started
+            operation = calling_operation(sys._getframe(1))
+            if operation is None:
+                # Statements run outside the CRUD classes are grouped by their SQL command
+                operation = self._statement_text(query).split(None, 1)[0].upper() if query else 'UNKNOWN'
+            query_stats.record(operation, lambda: self._statement_text(query), seconds,
+                               max(self.rowcount, 0), round_trips, error)
+
+    def _statement_text(self, query):
+        """Return a statement as text, rendering ``psycopg2.sql`` compositions with this cursor."""
+        if isinstance(query, sql.Composable):
+            try:
+                return query.as_string(self)
+            except Exception:
+                return repr(query)
+        if isinstance(query, bytes):
+            return query.decode('utf-8', 'replace')
+        return str(query).strip()
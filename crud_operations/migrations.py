@@ -0,0 +1,413 @@
+import argparse
+import logging
+
+import psycopg2
+from psycopg2 import errors, sql
+
+from crud_operations.change_listener import BULK_CHANGE_ROWS, change_channel
+from crud_operations.connection_pool import borrow_connection
+from crud_operations.exceptions import DatabaseOperationError
+
+# Set up logging
+logging.basicConfig(filename='app.log', level=logging.ERROR,
+                    format='%(asctime)s - %(levelname)s - %(message)s')
+
+# Metadata table recording the migrations applied to each student table
+MIGRATIONS_TABLE = 'schema_migrations'
+
+
+def student_table_query(table_name):
+    """Build the DDL of the student table."""
+    return sql.SQL("""
+        CREATE TABLE IF NOT EXISTS {table_name} (
+            id SERIAL PRIMARY KEY,
+            name TEXT NOT NULL,
+            address TEXT NOT NULL,
+            age INT NOT NULL CHECK (age >= 0),  -- Ensures age is non-negative.
+            number TEXT NOT NULL
+        );
+    """).format(table_name=sql.Identifier(table_name))
+
+
+def partitioned_table_query(table_name):
+    """
+    Build the DDL of the student table partitioned by ID range.
+
+    Rows whose ID is not covered by a range partition go to the ``<table>_default``
+    partition, so an insert never fails for lack of a partition; see
+    ``crud_operations.partitioning`` for creating the range partitions.
+    """
+    return sql.SQL("""
+        CREATE TABLE IF NOT EXISTS {table_name} (
+            id SERIAL,
+            name TEXT NOT NULL,
+            address TEXT NOT NULL,
+            age INT NOT NULL CHECK (age >= 0),  -- Ensures age is non-negative.
+            number TEXT NOT NULL,
+            PRIMARY KEY (id)
+        ) PARTITION BY RANGE (id);
+        CREATE TABLE IF NOT EXISTS {default_partition} PARTITION OF {table_name} DEFAULT;
+    """).format(table_name=sql.Identifier(table_name),
+                default_partition=sql.Identifier(f'{table_name}_default'))
+
+
+def search_indexes_query(table_name):
+    """Build the btree indexes behind the age range and phone number searches."""
+    return sql.SQL("""
+        CREATE INDEX IF NOT EXISTS {number_index} ON {table_name} (number);
+        CREATE INDEX IF NOT EXISTS {age_index} ON {table_name} (age);
+    """).format(table_name=sql.Identifier(table_name),
+                number_index=sql.Identifier(f'{table_name}_number_idx'),
+                age_index=sql.Identifier(f'{table_name}_age_idx'))
+
+
+def change_trigger_query(table_name):
+    """
+    Build the DDL of the trigger that sends a NOTIFY for every insert, update or delete.
+
+    The payload is a JSON object with the operation and the student ID, e.g.
+    ``{"op": "DELETE", "id": 42}``, published on the ``<table>_changes`` channel.
+    """
+    function_name = f'{table_name}_notify_change'
+    trigger_name = f'{table_name}_notify_change_trigger'
+    return sql.SQL("""
+        CREATE OR REPLACE FUNCTION {function}() RETURNS trigger AS $$
+        BEGIN
+            PERFORM pg_notify({channel}, json_build_object(
+                'op', TG_OP,
+                'id', CASE WHEN TG_OP = 'DELETE' THEN OLD.id ELSE NEW.id END
+            )::text);
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql;
+
+        DO $$
+        BEGIN
+            IF NOT EXISTS (SELECT 1 FROM pg_trigger
+                           WHERE tgname = {trigger_literal}
+                           AND tgrelid = {table_literal}::regclass) THEN
+                CREATE TRIGGER {trigger}
+                    AFTER INSERT OR UPDATE OR DELETE ON {table_name}
+                    FOR EACH ROW EXECUTE FUNCTION {function}();
+            END IF;
+        END;
+        $$;
+    """).format(function=sql.Identifier(function_name),
+                channel=sql.Literal(change_channel(table_name)),
+                trigger=sql.Identifier(trigger_name),
+                trigger_literal=sql.Literal(trigger_name),
+                # Quoted so the ::regclass cast resolves the name exactly as the Identifier does
+                table_literal=sql.Literal('"{}"'.format(table_name.replace('"', '""'))),
+                table_name=sql.Identifier(table_name))
+
+
+def trigram_indexes_query(table_name):
+    """Build the pg_trgm GIN indexes behind the name prefix and address substring searches."""
+    return sql.SQL("""
+        CREATE EXTENSION IF NOT EXISTS pg_trgm;
+        CREATE INDEX IF NOT EXISTS {name_index} ON {table_name} USING gin (name gin_trgm_ops);
+        CREATE INDEX IF NOT EXISTS {address_index} ON {table_name} USING gin (address gin_trgm_ops);
+    """).format(table_name=sql.Identifier(table_name),
+                name_index=sql.Identifier(f'{table_name}_name_trgm_idx'),
+                address_index=sql.Identifier(f'{table_name}_address_trgm_idx'))
+
+
+def change_statement_triggers_query(table_name):
+    """
+    Build the DDL replacing the row-level change trigger with statement-level triggers.
+
+    Each statement publishes the IDs it changed from its transition table, one
+    notification per row like before, unless it changed more than ``BULK_CHANGE_ROWS``
+    rows. COPY imports, batch updates and range deletes then publish a single
+    ``{"op": "RELOAD"}`` and listeners re-read their view instead.
+    """
+    triggers = {event: f'{table_name}_notify_{event.lower()}_trigger' for event in ('INSERT', 'UPDATE', 'DELETE')}
+    return sql.SQL("""
+        DROP TRIGGER IF EXISTS {row_trigger} ON {table_name};
+        DROP FUNCTION IF EXISTS {row_function}();
+
+        CREATE OR REPLACE FUNCTION {function}() RETURNS trigger AS $$
+        BEGIN
+            -- Counts no further than needed to tell a bulk change from a small one
+            IF (SELECT count(*) FROM (SELECT 1 FROM changed_rows LIMIT {bulk_rows} + 1) AS counted) > {bulk_rows} THEN
+                PERFORM pg_notify({channel}, json_build_object('op', 'RELOAD')::text);
+            ELSE
+                PERFORM pg_notify({channel}, json_build_object('op', TG_OP, 'id', id)::text)
+                FROM changed_rows ORDER BY id;
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql;
+
+        DROP TRIGGER IF EXISTS {insert_trigger} ON {table_name};
+        CREATE TRIGGER {insert_trigger} AFTER INSERT ON {table_name}
+            REFERENCING NEW TABLE AS changed_rows
+            FOR EACH STATEMENT EXECUTE FUNCTION {function}();
+        DROP TRIGGER IF EXISTS {update_trigger} ON {table_name};
+        CREATE TRIGGER {update_trigger} AFTER UPDATE ON {table_name}
+            REFERENCING NEW TABLE AS changed_rows
+            FOR EACH STATEMENT EXECUTE FUNCTION {function}();
+        DROP TRIGGER IF EXISTS {delete_trigger} ON {table_name};
+        CREATE TRIGGER {delete_trigger} AFTER DELETE ON {table_name}
+            REFERENCING OLD TABLE AS changed_rows
+            FOR EACH STATEMENT EXECUTE FUNCTION {function}();
+    """).format(row_trigger=sql.Identifier(f'{table_name}_notify_change_trigger'),
+                row_function=sql.Identifier(f'{table_name}_notify_change'),
+                function=sql.Identifier(f'{table_name}_notify_changes'),
+                channel=sql.Literal(change_channel(table_name)),
+                bulk_rows=sql.Literal(BULK_CHANGE_ROWS),
+                insert_trigger=sql.Identifier(triggers['INSERT']),
+                update_trigger=sql.Identifier(triggers['UPDATE']),
+                delete_trigger=sql.Identifier(triggers['DELETE']),
+                table_name=sql.Identifier(table_name))
+
+
+class Migration:
+    """
+    One versioned change of the schema of a student table.
+
+    The DDL of a migration should be idempotent (``IF NOT EXISTS``), so tables created
+    before migrations were recorded are brought under version control without errors.
+    """
+
+    def __init__(self, version, description, build, optional=False):
+        """
+        Initialize the migration.
+        Args:
+            version (int): Position of the migration; migrations are applied in increasing order.
+            description (str): What the migration changes.
+            build (callable): Returns the DDL for a table name as a ``sql.Composable``.
+            optional (bool): If the DDL fails (e.g. for lack of privileges), record the
+                migration as skipped and carry on instead of failing.
+        """
+        self.version = version
+        self.description = description
+        self.build = build
+        self.optional = optional
+
+
+# Every migration of the student table, oldest first; append new ones with the next version
+MIGRATIONS = (
+    Migration(1, 'Create the student table', student_table_query),
+    Migration(2, 'Index phone numbers and ages for the searches', search_indexes_query),
+    Migration(3, 'Publish every change with a NOTIFY trigger', change_trigger_query),
+    # Installing an extension needs extra privileges; without it searches fall back to sequential scans
+    Migration(4, 'Trigram indexes for the name and address searches', trigram_indexes_query, optional=True),
+    Migration(5, 'Publish changes once per statement, with a single RELOAD for bulk changes',
+              change_statement_triggers_query),
+)
+
+# The same schema on a table partitioned by ID range; indexes and triggers created on the
+# partitioned table apply to each of its partitions
+PARTITIONED_MIGRATIONS = (
+    Migration(1, 'Create the student table partitioned by ID range', partitioned_table_query),
+) + MIGRATIONS[1:]
+
+
+class SchemaMigrator:
+    """
+    Applies the pending migrations of a student table once and records them.
+
+    Checking a table that is up to date costs a single ``SELECT`` on the metadata table,
+    without DDL or catalog locks. Pending migrations are applied under an advisory lock,
+    so clients starting at the same time do not apply them twice.
+    """
+
+    def __init__(self, db_connection, table_name='students2_1', migrations=MIGRATIONS):
+        """
+        Initialize the migrator.
+        Args:
+            db_connection: Active connection or connection pool for the database.
+            table_name (str): The student table to migrate.
+            migrations (tuple): The migrations of the table, oldest first.
+        Raises:
+            ValueError: If the migration versions are not unique and increasing.
+        """
+        versions = [migration.version for migration in migrations]
+        if versions != sorted(set(versions)):
+            raise ValueError('Migration versions must be unique and in increasing order.')
+        self.connection = db_connection
+        self.table_name = table_name
+        self.migrations = migrations
+
+    def migrate(self):
+        """
+        Apply the pending migrations, each in its own transaction.
+        Returns:
+            dict: Sorted 'applied' and 'skipped' versions; both are empty if the table was up to date.
+        Raises:
+            DatabaseOperationError: If a required migration failed; the migrations applied
+                before it stay applied.
+        """
+        result = {'applied': [], 'skipped': []}
+        with borrow_connection(self.connection) as connection:
+            try:
+                if not self._pending(connection):
+                    return result
+
+                with connection.cursor() as cursor:
+                    # Held for the session, across the transactions of the migrations. It is taken
+                    # before the metadata table is created, because concurrent CREATE TABLE IF NOT
+                    # EXISTS statements can still fail on a duplicate key in the catalog
+                    cursor.execute('SELECT pg_advisory_lock(hashtext(%s))', (MIGRATIONS_TABLE,))
+                connection.commit()
+
+                try:
+                    with connection.cursor() as cursor:
+                        cursor.execute(sql.SQL("""
+                            CREATE TABLE IF NOT EXISTS {migrations} (
+                                table_name TEXT NOT NULL,
+                                version INT NOT NULL,
+                                description TEXT NOT NULL,
+                                status TEXT NOT NULL DEFAULT 'applied',
+                                applied_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+                                PRIMARY KEY (table_name, version)
+                            )
+                        """).format(migrations=sql.Identifier(MIGRATIONS_TABLE)))
+                    connection.commit()
+
+                    # Another client may have applied them while this one waited for the lock
+                    for migration in self._pending(connection):
+                        result[self._apply(connection, migration)].append(migration.version)
+                finally:
+                    connection.rollback()  # End a transaction aborted by a failed migration
+                    with connection.cursor() as cursor:
+                        cursor.execute('SELECT pg_advisory_unlock(hashtext(%s))', (MIGRATIONS_TABLE,))
+                    connection.commit()
+
+            except psycopg2.Error as e:
+                logging.error(f'Error migrating table {self.table_name}: {e}')
+                connection.rollback()
+                raise DatabaseOperationError(f'Could not migrate table {self.table_name}: {e}') from e
+
+        return result
+
+    def status(self):
+        """
+        Describe every migration of the table.
+        Returns:
+            list[dict]: 'version', 'description', 'status' ('applied', 'skipped' or 'pending')
+            and 'applied_at' of each migration.
+        Raises:
+            DatabaseOperationError: If the metadata table could not be read.
+        """
+        with borrow_connection(self.connection) as connection:
+            try:
+                recorded = {version: (status, applied_at)
+                            for version, status, applied_at in self._recorded(connection)}
+            except psycopg2.Error as e:
+                connection.rollback()
+                raise DatabaseOperationError(f'Could not read the migrations of {self.table_name}: {e}') from e
+
+        return [{'version': migration.version,
+                 'description': migration.description,
+                 'status': recorded.get(migration.version, ('pending', None))[0],
+                 'applied_at': recorded.get(migration.version, (None, None))[1]}
+                for migration in self.migrations]
+
+    def forget(self, skipped_only=False):
+        """
+        Delete the records of the table's migrations, e.g. after the table was dropped.
+        Args:
+            skipped_only (bool): Only forget skipped migrations, so ``migrate`` tries them again.
+        Raises:
+            DatabaseOperationError: If the records could not be deleted.
+        """
+        query = sql.SQL('DELETE FROM {migrations} WHERE table_name = %s{condition}').format(
+            migrations=sql.Identifier(MIGRATIONS_TABLE),
+            condition=sql.SQL(" AND status = 'skipped'" if skipped_only else ''))
+
+        with borrow_connection(self.connection) as connection:
+            try:
+                with connection.cursor() as cursor:
+                    cursor.execute('SELECT to_regclass(%s)', (MIGRATIONS_TABLE,))
+                    if cursor.fetchone()[0] is not None:
+                        cursor.execute(query, (self.table_name,))
+                connection.commit()
+            except psycopg2.Error as e:
+                connection.rollback()
+                raise DatabaseOperationError(f'Could not forget the migrations of {self.table_name}: {e}') from e
+
+    def _recorded(self, connection):
+        """Return the (version, status, applied_at) rows recorded for the table, ending the transaction."""
+        try:
+            with connection.cursor() as cursor:
+                cursor.execute(sql.SQL("""
+                    SELECT version, status, applied_at FROM {migrations}
+                    WHERE table_name = %s
+                """).format(migrations=sql.Identifier(MIGRATIONS_TABLE)), (self.table_name,))
+                rows = cursor.fetchall()
+            connection.commit()
+            return rows
+        except errors.UndefinedTable:
+            connection.rollback()  # No migration was ever applied in this database
+            return []
+
+    def _pending(self, connection):
+        """Return the migrations not yet recorded for the table."""
+        recorded = {row[0] for row in self._recorded(connection)}
+        return [migration for migration in self.migrations if migration.version not in recorded]
+
+    def _apply(self, connection, migration):
+        """
+        Apply one migration and record it.
+        Returns:
+            str: 'applied', or 'skipped' if an optional migration failed.
+        """
+        status = 'applied'
+        try:
+            with connection.cursor() as cursor:
+                cursor.execute(migration.build(self.table_name))
+        except psycopg2.Error as e:
+            if not migration.optional:
+                raise
+            logging.error(f'Skipped optional migration {migration.version} of {self.table_name} '
+                          f'({migration.description}): {e}')
+            connection.rollback()
+            status = 'skipped'
+
+        with connection.cursor() as cursor:
+            cursor.execute(sql.SQL("""
+                INSERT INTO {migrations} (table_name, version, description, status)
+                VALUES (%s, %s, %s, %s)
+            """).format(migrations=sql.Identifier(MIGRATIONS_TABLE)),
+                (self.table_name, migration.version, migration.description, status))
+        connection.commit()
+        print(f'Migration {migration.version} of {self.table_name} {status}: {migration.description}.')
+        return status
+
+
+def main():
+    """Apply or list the migrations of a student table from the command line."""
+    from crud_operations.db import create_connection_with_retry
+
+    parser = argparse.ArgumentParser(description='Apply the pending schema migrations of a student table.')
+    parser.add_argument('--table', default='students2_1')
+    parser.add_argument('--status', action='store_true', help='List the migrations instead of applying them')
+    parser.add_argument('--retry-skipped', action='store_true',
+                        help='Try the optional migrations that were skipped again')
+    args = parser.parse_args()
+
+    connection = create_connection_with_retry(retries=1)
+    if not connection:
+        raise SystemExit('Could not connect to the database.')
+
+    try:
+        migrator = SchemaMigrator(connection, args.table)
+        if args.status:
+            for migration in migrator.status():
+                print(f"{migration['version']:>4}  {migration['status']:<8} {migration['applied_at'] or '':<32}"
+                      f"  {migration['description']}")
+            return
+
+        if args.retry_skipped:
+            migrator.forget(skipped_only=True)
+        result = migrator.migrate()
+        if not result['applied'] and not result['skipped']:
+            print(f'Table {args.table} is up to date.')
+    finally:
+        connection.close()
+
+
+if __name__ == '__main__':
+    main()
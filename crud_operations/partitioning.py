@@ -0,0 +1,369 @@
+import argparse
+import json
+import logging
+import os
+import re
+
+import psycopg2
+from psycopg2 import sql
+
+from crud_operations.change_listener import RELOAD, change_channel
+from crud_operations.connection_pool import borrow_connection
+from crud_operations.exceptions import DatabaseOperationError
+from crud_operations.migrations import PARTITIONED_MIGRATIONS, SchemaMigrator, partitioned_table_query
+
+# Set up logging
+logging.basicConfig(filename='app.log', level=logging.ERROR,
+                    format='%(asctime)s - %(levelname)s - %(message)s')
+
+# Students per ID range partition; 0 keeps the table unpartitioned (override with PARTITION_SIZE)
+PARTITION_SIZE = int(os.environ.get('PARTITION_SIZE', 0))
+
+# Empty partitions kept ready beyond the highest ID handed out so far
+PARTITIONS_AHEAD = 2
+
+_RANGE_BOUND = re.compile(r"FOR VALUES FROM \('?(-?\d+)'?\) TO \('?(-?\d+)'?\)")
+
+
+def regclass_name(table_name):
+    """Quote a table name so a ``::regclass`` cast resolves it exactly as ``sql.Identifier`` does."""
+    return '"{}"'.format(table_name.replace('"', '""'))
+
+
+def parse_partition_bound(bound):
+    """
+    Parse the bound of a range partition as returned by ``pg_get_expr``.
+    Args:
+        bound (str): E.g. ``FOR VALUES FROM (0) TO (1000000)`` or ``DEFAULT``.
+    Returns:
+        tuple: The (lower, upper) IDs, upper excluded, or (None, None) for the default partition.
+    """
+    match = _RANGE_BOUND.search(bound)
+    if not match:
+        return None, None
+    return int(match.group(1)), int(match.group(2))
+
+
+class PartitionManager:
+    """
+    Manages a student table partitioned by ranges of ``partition_size`` IDs.
+
+    Partition ``<table>_pNNNNNN`` holds the IDs from ``NNNNNN * partition_size`` up to,
+    but excluding, the next multiple. New partitions are created ahead of the ID
+    sequence, and a range of students is purged by dropping the partitions it covers
+    instead of deleting their rows one by one. Lookups by ID only visit one partition.
+    Rows inserted while no partition covered their ID wait in the default partition
+    and are moved into their partition when it is created.
+    """
+
+    def __init__(self, db_connection, table_name='students2_1', partition_size=PARTITION_SIZE or 1_000_000,
+                 cache=None):
+        """
+        Initialize the manager.
+        Args:
+            db_connection: Active connection or connection pool for the database.
+            table_name (str): The partitioned student table.
+            partition_size (int): Number of IDs per partition.
+            cache (StudentCache): Optional row cache cleared when students are purged.
+        Raises:
+            ValueError: If ``partition_size`` is not positive.
+        """
+        if partition_size <= 0:
+            raise ValueError('The partition size must be positive.')
+        self.connection = db_connection
+        self.table_name = table_name
+        self.partition_size = partition_size
+        self.cache = cache
+
+    def partition_name(self, index):
+        """Return the name of the partition holding the IDs from ``index * partition_size``."""
+        return f'{self.table_name}_p{index:06d}'
+
+    def partitions(self):
+        """
+        List the partitions of the table.
+        Returns:
+            list[dict]: 'name', 'lower' and 'upper' ID bounds (upper excluded; None for the
+            default partition) and the planner's 'estimated_rows' of each partition, by lower bound.
+        Raises:
+            DatabaseOperationError: If the catalog could not be read.
+        """
+        with borrow_connection(self.connection) as connection:
+            try:
+                with connection.cursor() as cursor:
+                    partitions = self._partitions(cursor)
+                connection.commit()
+                return partitions
+            except psycopg2.Error as e:
+                connection.rollback()
+                raise DatabaseOperationError(f'Could not list the partitions of {self.table_name}: {e}') from e
+
+    def ensure_partitions(self, ahead=PARTITIONS_AHEAD):
+        """
+        Create the partitions for the next IDs the sequence will hand out.
+
+        Partitions are only added above the highest existing one. Ranges whose IDs have
+        all been handed out are skipped unless the default partition holds rows of them,
+        so partitions dropped by ``purge_range`` are not created again, while rows that
+        went to the default partition are moved into their new partition.
+        Args:
+            ahead (int): Partitions to keep ready beyond the one holding the last ID.
+        Returns:
+            list: Names of the partitions created.
+        Raises:
+            DatabaseOperationError: If the table is not partitioned or a partition could not be created.
+        """
+        with borrow_connection(self.connection) as connection:
+            try:
+                with connection.cursor() as cursor:
+                    if self._relkind(cursor) != 'p':
+                        connection.rollback()
+                        raise DatabaseOperationError(
+                            f'Table {self.table_name} is not partitioned; convert it with '
+                            f'python -m crud_operations.partitioning convert --table {self.table_name}')
+                    cursor.execute("SELECT coalesce(pg_sequence_last_value("
+                                   "pg_get_serial_sequence(%s, 'id')::regclass), 0)",
+                                   (regclass_name(self.table_name),))
+                    last_id = cursor.fetchone()[0]
+                    created = self._create_partitions(cursor, last_id, ahead)
+                connection.commit()
+                return created
+
+            except psycopg2.Error as e:
+                logging.error(f'Error creating partitions of {self.table_name}: {e}')
+                connection.rollback()
+                raise DatabaseOperationError(f'Could not create partitions of {self.table_name}: {e}') from e
+
+    def purge_range(self, first_id, last_id):
+        """
+        Delete every student whose ID lies in an inclusive range, dropping whole partitions.
+
+        Partitions entirely inside the range are dropped, which takes the same time whatever
+        their size; only the rows of partially covered partitions are deleted with ``DELETE``.
+        Args:
+            first_id (int): First ID of the range.
+            last_id (int): Last ID of the range.
+        Returns:
+            dict: 'dropped_partitions' names and the number of 'deleted_rows' in other partitions.
+        Raises:
+            DatabaseOperationError: If the purge failed; nothing is purged.
+        """
+        with borrow_connection(self.connection) as connection:
+            try:
+                with connection.cursor() as cursor:
+                    dropped = [partition['name'] for partition in self._partitions(cursor)
+                               if partition['lower'] is not None
+                               and first_id <= partition['lower'] and partition['upper'] - 1 <= last_id]
+                    for name in dropped:
+                        cursor.execute(sql.SQL('DROP TABLE {partition}').format(partition=sql.Identifier(name)))
+                    if dropped:
+                        # Dropping a table fires no trigger, so tell the listeners to re-read their views
+                        cursor.execute('SELECT pg_notify(%s, %s)',
+                                       (change_channel(self.table_name), json.dumps({'op': RELOAD})))
+
+                    cursor.execute(sql.SQL('DELETE FROM {table_name} WHERE id BETWEEN %s AND %s').format(
+                        table_name=sql.Identifier(self.table_name)), (first_id, last_id))
+                    deleted_rows = max(cursor.rowcount, 0)
+                connection.commit()
+
+            except psycopg2.Error as e:
+                logging.error(f'Error purging students {first_id}-{last_id} of {self.table_name}: {e}')
+                connection.rollback()
+                raise DatabaseOperationError(f'Could not purge students: {e}') from e
+
+        if self.cache:
+            self.cache.clear()  # The IDs of the dropped rows are not known
+        return {'dropped_partitions': dropped, 'deleted_rows': deleted_rows}
+
+    def convert_table(self, drop_old=False):
+        """
+        Convert an existing unpartitioned student table into a partitioned one.
+
+        The table is renamed to ``<table>_unpartitioned`` and its rows are copied into a new
+        partitioned table in one transaction, during which the table is locked. The indexes
+        and change trigger are then recreated by the partitioned migrations.
+        Args:
+            drop_old (bool): Drop the renamed table once the copy is committed.
+        Returns:
+            int: Number of students copied, or 0 if the table was already partitioned.
+        Raises:
+            DatabaseOperationError: If the conversion failed; the table is left unchanged.
+        """
+        old_name = f'{self.table_name}_unpartitioned'
+        with borrow_connection(self.connection) as connection:
+            try:
+                with connection.cursor() as cursor:
+                    relkind = self._relkind(cursor)
+                    if relkind == 'p':
+                        connection.commit()
+                        return 0
+                    if relkind is None:
+                        connection.rollback()
+                        raise DatabaseOperationError(f'Table {self.table_name} does not exist.')
+
+                    table, old = sql.Identifier(self.table_name), sql.Identifier(old_name)
+                    # Free the names of the constraint, indexes and trigger for the new table
+                    cursor.execute(sql.SQL("""
+                        LOCK TABLE {table} IN ACCESS EXCLUSIVE MODE;
+                        ALTER TABLE {table} RENAME TO {old};
+                        ALTER TABLE {old} RENAME CONSTRAINT {pkey} TO {old_pkey};
+                        DROP INDEX IF EXISTS {indexes};
+                        DROP TRIGGER IF EXISTS {trigger} ON {old};
+                    """).format(table=table, old=old,
+                                pkey=sql.Identifier(f'{self.table_name}_pkey'),
+                                old_pkey=sql.Identifier(f'{old_name}_pkey'),
+                                indexes=sql.SQL(', ').join(
+                                    sql.Identifier(f'{self.table_name}_{suffix}')
+                                    for suffix in ('number_idx', 'age_idx', 'name_trgm_idx', 'address_trgm_idx')),
+                                trigger=sql.Identifier(f'{self.table_name}_notify_change_trigger')))
+
+                    cursor.execute(partitioned_table_query(self.table_name))
+                    cursor.execute(sql.SQL('SELECT coalesce(max(id), 0) FROM {old}').format(old=old))
+                    last_id = cursor.fetchone()[0]
+                    self._create_partitions(cursor, last_id, PARTITIONS_AHEAD, skip_handed_out=False)
+
+                    # Indexes and the trigger are only created after the copy, which is faster
+                    cursor.execute(sql.SQL("""
+                        INSERT INTO {table} (id, name, address, age, number)
+                        SELECT id, name, address, age, number FROM {old}
+                    """).format(table=table, old=old))
+                    copied = cursor.rowcount
+                    # The sequence of the new table continues after the highest copied ID
+                    cursor.execute("SELECT setval(pg_get_serial_sequence(%s, 'id'), greatest(%s, 1), %s)",
+                                   (regclass_name(self.table_name), last_id, last_id > 0))
+                connection.commit()
+
+            except psycopg2.Error as e:
+                logging.error(f'Error converting {self.table_name} to a partitioned table: {e}')
+                connection.rollback()
+                raise DatabaseOperationError(f'Could not partition table {self.table_name}: {e}') from e
+
+        migrator = SchemaMigrator(self.connection, self.table_name, PARTITIONED_MIGRATIONS)
+        migrator.forget()
+        migrator.migrate()
+
+        if drop_old:
+            with borrow_connection(self.connection) as connection:
+                with connection.cursor() as cursor:
+                    cursor.execute(sql.SQL('DROP TABLE {old}').format(old=sql.Identifier(old_name)))
+                connection.commit()
+        return copied
+
+    def _relkind(self, cursor):
+        """Return the ``pg_class.relkind`` of the table ('r' plain, 'p' partitioned), or None."""
+        cursor.execute('SELECT relkind FROM pg_class WHERE oid = to_regclass(%s)', (regclass_name(self.table_name),))
+        row = cursor.fetchone()
+        return row[0] if row else None
+
+    def _partitions(self, cursor):
+        """List the partitions of the table with their bounds."""
+        cursor.execute("""
+            SELECT c.relname, pg_get_expr(c.relpartbound, c.oid), c.reltuples::bigint
+            FROM pg_inherits i JOIN pg_class c ON c.oid = i.inhrelid
+            WHERE i.inhparent = %s::regclass
+        """, (regclass_name(self.table_name),))
+        partitions = []
+        for name, bound, estimated_rows in cursor.fetchall():
+            lower, upper = parse_partition_bound(bound)
+            partitions.append({'name': name, 'lower': lower, 'upper': upper,
+                               'estimated_rows': max(estimated_rows, 0)})
+        # The default partition goes last
+        return sorted(partitions, key=lambda partition: (partition['lower'] is None, partition['lower'] or 0))
+
+    def _create_partitions(self, cursor, last_id, ahead, skip_handed_out=True):
+        """
+        Create the partitions above the highest existing one up to ``ahead`` past ``last_id``.
+
+        Rows of a new range that went to the default partition are moved into the new
+        partition, which is then attached; creating it with ``PARTITION OF`` would fail
+        while the default partition holds rows of its range.
+        Args:
+            cursor: Cursor of the transaction creating the partitions.
+            last_id (int): Last ID handed out by the sequence.
+            ahead (int): Partitions to create beyond the one holding ``last_id``.
+            skip_handed_out (bool): Skip ranges below ``last_id`` that have no rows in the
+                default partition, such as purged ones.
+        Returns:
+            list: Names of the partitions created.
+        """
+        partitions = self._partitions(cursor)
+        highest = max((partition['upper'] for partition in partitions if partition['upper'] is not None), default=0)
+        default = next((partition['name'] for partition in partitions if partition['lower'] is None), None)
+        created = []
+        for index in range(highest // self.partition_size, last_id // self.partition_size + ahead + 1):
+            # Starts at the highest bound, in case it was created with another partition size
+            lower, upper = max(index * self.partition_size, highest), (index + 1) * self.partition_size
+            if lower >= upper:
+                continue
+
+            stranded = False
+            if default is not None:
+                cursor.execute(sql.SQL('SELECT EXISTS (SELECT 1 FROM {default} WHERE id >= %s AND id < %s)').format(
+                    default=sql.Identifier(default)), (lower, upper))
+                stranded = cursor.fetchone()[0]
+            if skip_handed_out and upper <= last_id + 1 and not stranded:
+                continue  # No new ID will fall into this range
+
+            name = self.partition_name(index)
+            if stranded:
+                cursor.execute(sql.SQL("""
+                    CREATE TABLE IF NOT EXISTS {partition} (LIKE {table_name} INCLUDING CONSTRAINTS);
+                    WITH moved AS (
+                        DELETE FROM {default} WHERE id >= {lower} AND id < {upper}
+                        RETURNING id, name, address, age, number
+                    )
+                    INSERT INTO {partition} (id, name, address, age, number) SELECT * FROM moved;
+                    ALTER TABLE {table_name} ATTACH PARTITION {partition} FOR VALUES FROM ({lower}) TO ({upper});
+                """).format(partition=sql.Identifier(name),
+                            table_name=sql.Identifier(self.table_name),
+                            default=sql.Identifier(default),
+                            lower=sql.Literal(lower),
+                            upper=sql.Literal(upper)))
+            else:
+                cursor.execute(sql.SQL("""
+                    CREATE TABLE IF NOT EXISTS {partition} PARTITION OF {table_name}
+                    FOR VALUES FROM ({lower}) TO ({upper})
+                """).format(partition=sql.Identifier(name),
+                            table_name=sql.Identifier(self.table_name),
+                            lower=sql.Literal(lower),
+                            upper=sql.Literal(upper)))
+            created.append(name)
+        return created
+
+
+def main():
+    """Inspect, extend, convert or purge a partitioned student table from the command line."""
+    from crud_operations.db import create_connection_with_retry
+
+    parser = argparse.ArgumentParser(description='Manage the ID range partitions of a student table.')
+    parser.add_argument('command', choices=('status', 'ensure', 'convert', 'purge'))
+    parser.add_argument('range', type=int, nargs='*', metavar='ID', help='First and last ID to purge')
+    parser.add_argument('--table', default='students2_1')
+    parser.add_argument('--partition-size', type=int, default=PARTITION_SIZE or 1_000_000)
+    parser.add_argument('--ahead', type=int, default=PARTITIONS_AHEAD, help='Empty partitions kept ready')
+    parser.add_argument('--drop-old', action='store_true', help='With convert, drop the unpartitioned table')
+    args = parser.parse_args()
+    if args.command == 'purge' and len(args.range) != 2:
+        parser.error('purge needs the first and last ID of the range')
+
+    connection = create_connection_with_retry(retries=1)
+    if not connection:
+        raise SystemExit('Could not connect to the database.')
+
+    try:
+        manager = PartitionManager(connection, args.table, args.partition_size)
+        if args.command == 'status':
+            result = manager.partitions()
+        elif args.command == 'ensure':
+            result = {'created': manager.ensure_partitions(args.ahead)}
+        elif args.command == 'convert':
+            result = {'copied': manager.convert_table(args.drop_old)}
+        else:
+            result = manager.purge_range(*args.range)
+        print(json.dumps(result, indent=2))
+    finally:
+        connection.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,140 @@
+import itertools
+import os
+import re
+import threading
+import weakref
+
+from psycopg2 import errors, sql
+
+# Server-side prepared statements can be turned off with PREPARED_STATEMENTS=0, e.g. behind
+# a PgBouncer in transaction pooling mode, where consecutive statements may reach different sessions
+USE_PREPARED_STATEMENTS = os.environ.get('PREPARED_STATEMENTS', '1') != '0'
+
+# psycopg2 placeholders, rewritten to the $n parameters of PREPARE
+_PLACEHOLDER = re.compile(r'%[s%]')
+
+
+def count_placeholders(query):
+    """Return the number of ``%s`` placeholders in the SQL fragments of a composed statement."""
+    if isinstance(query, sql.Composed):
+        return sum(count_placeholders(part) for part in query)
+    if isinstance(query, sql.SQL):
+        return sum(1 for match in _PLACEHOLDER.finditer(query.string) if match.group() == '%s')
+    return 0
+
+
+class PreparedStatement:
+    """A statement composed once for a table, and prepared on each connection that runs it."""
+
+    __slots__ = ('name', 'query', 'param_count')
+
+    def __init__(self, name, query, param_count):
+        """
+        Args:
+            name (str): Server-side name of the statement, unique within the registry.
+            query (sql.Composable): The statement with ``%s`` placeholders.
+            param_count (int): Number of ``%s`` placeholders in the statement.
+        """
+        self.name = name
+        self.query = query
+        self.param_count = param_count
+
+    def prepare_sql(self, cursor):
+        """Return the ``PREPARE`` statement for this query, rendered with the cursor's connection."""
+        counter = itertools.count(1)
+        text = _PLACEHOLDER.sub(lambda match: '%' if match.group() == '%%' else f'${next(counter)}',
+                                self.query.as_string(cursor))
+        return f'PREPARE {self.name} AS {text}'
+
+    def execute_sql(self):
+        """Return the ``EXECUTE`` statement taking the parameters as ``%s`` placeholders."""
+        if not self.param_count:
+            return f'EXECUTE {self.name}'
+        return f'EXECUTE {self.name} ({", ".join(["%s"] * self.param_count)})'
+
+
+class StatementRegistry:
+    """
+    Thread-safe registry of the hot CRUD statements.
+
+    Each statement is composed once per key (operation, table name and any variant such as
+    the updated column) instead of on every call. When ``enabled``, it is also prepared on
+    the server the first time a connection runs it, and later calls only send ``EXECUTE``
+    with the parameters, so the server skips parsing and planning. The names prepared on
+    each connection are tracked weakly, so closed connections are forgotten with them.
+    """
+
+    def __init__(self, enabled=USE_PREPARED_STATEMENTS):
+        """
+        Initialize an empty registry.
+        Args:
+            enabled (bool): Use PREPARE/EXECUTE; if False the composed statements are executed directly.
+        """
+        self.enabled = enabled
+        self._statements = {}
+        self._prepared = weakref.WeakKeyDictionary()  # connection -> names prepared on it
+        self._names = itertools.count(1)
+        self._lock = threading.Lock()
+
+    def statement(self, key, build):
+        """
+        Return the statement registered under ``key``, composing it the first time.
+        Args:
+            key (tuple): Identifies the statement, e.g. ``('add_student', table_name)``.
+            build (callable): Returns the ``sql.Composable`` statement with ``%s`` placeholders.
+        Returns:
+            PreparedStatement: The registered statement.
+        """
+        statement = self._statements.get(key)
+        if statement is None:
+            query = build()
+            param_count = count_placeholders(query)
+            with self._lock:
+                statement = self._statements.get(key)
+                if statement is None:
+                    name = f'{key[0]}_{next(self._names)}'
+                    statement = self._statements[key] = PreparedStatement(name, query, param_count)
+        return statement
+
+    def execute(self, cursor, statement, params):
+        """
+        Run a registered statement on a cursor, preparing it on the cursor's connection if needed.
+        Args:
+            cursor: Cursor of the connection to run the statement on.
+            statement (PreparedStatement): A statement returned by ``statement``.
+            params (tuple): The statement's parameters.
+        """
+        if not self.enabled:
+            cursor.execute(statement.query, params)
+            return
+
+        connection = cursor.connection
+        with self._lock:
+            prepared = self._prepared.setdefault(connection, set())
+            is_prepared = statement.name in prepared
+
+        if not is_prepared:
+            cursor.execute(statement.prepare_sql(cursor))
+            with self._lock:
+                prepared.add(statement.name)
+
+        try:
+            cursor.execute(statement.execute_sql(), params)
+        except errors.InvalidSqlStatementName:
+            # The session lost its prepared statements (e.g. DISCARD ALL); prepare them again next time
+            self.forget(connection)
+            raise
+
+    def forget(self, connection):
+        """Forget which statements are prepared on a connection, e.g. after it was reset."""
+        with self._lock:
+            self._prepared.pop(connection, None)
+
+    def prepared_names(self, connection):
+        """Return the names of the statements prepared on a connection."""
+        with self._lock:
+            return set(self._prepared.get(connection, ()))
+
+
+# Registry shared by every CRUD class of the application
+prepared_statements = StatementRegistry()
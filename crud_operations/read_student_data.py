@@ -1,5 +1,14 @@
+import itertools
+import logging
+
 import psycopg2
-from tkinter import messagebox
+from psycopg2 import sql
+
+from crud_operations.connection_pool import borrow_connection
+from crud_operations.exceptions import DatabaseOperationError
+
+# Sequence used to give every server-side cursor a unique name
+_stream_cursor_ids = itertools.count(1)
 
 
 class StudentDataReader:
@@ -7,33 +16,216 @@ class StudentDataReader:
     Class for querying and fetching student data from the database.
     """
 
-    def __init__(self, db_connection, table_name='students2_1'):
+    def __init__(self, db_connection, table_name='students2_1', cache=None):
         """
         Initialize with a database connection and table name.
         Args:
-            db_connection: Active database connection.
+            db_connection: Active database connection or connection pool.
             table_name (str): Name of the database table.
+            cache (StudentCache): Optional cache serving repeated reads locally.
         """
         self.connection = db_connection
         self.table_name = table_name  # Stores the name of the table from which the data will be fetched.
+        self.cache = cache
 
     def fetch_records(self):
-        """Retrieve all records from the table in the database"""
-        try:
-            # Initialize a cursor to interact with the database
-            cursor = self.connection.cursor()
+        """
+        Retrieve all records from the table in the database.
+        Raises:
+            DatabaseOperationError: If the query failed.
+        """
+        if self.cache:
+            cached = self.cache.get_query(('all',))
+            if cached is not None:
+                return cached
+            version = self.cache.version  # Read before querying so concurrent changes are not hidden
+
+        with borrow_connection(self.connection) as connection:
+            try:
+                # Initialize a cursor to interact with the database
+                cursor = connection.cursor()
+
+                # Execute the SQL query to retrieve all rows in the table
+                cursor.execute(f"SELECT * FROM {self.table_name};")
+
+                # Fetch all results from the query
+                students = cursor.fetchall()
+                if self.cache:
+                    self.cache.put_query(('all',), students, version)
+                return students
+
+            except psycopg2.DatabaseError as error:
+                connection.rollback()
+                raise DatabaseOperationError(f'Failed to fetch records: {error}') from error
+
+            finally:
+                # Close the cursor
+                cursor.close()
+
+    def fetch_page(self, after_id=0, limit=200):
+        """
+        Retrieve one page of records ordered by ID using keyset pagination.
+
+        Only rows with an ID greater than ``after_id`` are returned, so each page is
+        an index range scan on the primary key no matter how deep into the table it is.
+        Args:
+            after_id (int): ID of the last row of the previous page (0 for the first page).
+            limit (int): Maximum number of rows to return.
+        Returns:
+            list: Up to ``limit`` student rows ordered by ID.
+        Raises:
+            DatabaseOperationError: If the query failed.
+        """
+        if self.cache:
+            cached = self.cache.get_query(('page', after_id, limit))
+            if cached is not None:
+                return cached
+            version = self.cache.version  # Read before querying so concurrent changes are not hidden
+
+        query = sql.SQL("""
+            SELECT id, name, address, age, number FROM {table_name}
+            WHERE id > %s
+            ORDER BY id
+            LIMIT %s
+        """).format(table_name=sql.Identifier(self.table_name))
+
+        with borrow_connection(self.connection) as connection:
+            try:
+                with connection.cursor() as cursor:
+                    cursor.execute(query, (after_id, limit))
+                    students = cursor.fetchall()
+
+                if self.cache:
+                    self.cache.put_query(('page', after_id, limit), students, version)
+                return students
+
+            except psycopg2.DatabaseError as error:
+                connection.rollback()
+                raise DatabaseOperationError(f'Failed to fetch records: {error}') from error
+
+    def fetch_page_before(self, before_id, limit=200):
+        """
+        Retrieve the page of records just before ``before_id``, ordered by ID.
+
+        The counterpart of ``fetch_page`` for scrolling back up: the rows are read
+        backwards from ``before_id`` on the primary key index, then returned in ID order.
+        Args:
+            before_id (int): ID of the first row of the following page.
+            limit (int): Maximum number of rows to return.
+        Returns:
+            list: Up to ``limit`` student rows ordered by ID.
+        Raises:
+            DatabaseOperationError: If the query failed.
+        """
+        if self.cache:
+            cached = self.cache.get_query(('page_before', before_id, limit))
+            if cached is not None:
+                return cached
+            version = self.cache.version  # Read before querying so concurrent changes are not hidden
+
+        query = sql.SQL("""
+            SELECT id, name, address, age, number FROM (
+                SELECT id, name, address, age, number FROM {table_name}
+                WHERE id < %s
+                ORDER BY id DESC
+                LIMIT %s
+            ) AS page
+            ORDER BY id
+        """).format(table_name=sql.Identifier(self.table_name))
+
+        with borrow_connection(self.connection) as connection:
+            try:
+                with connection.cursor() as cursor:
+                    cursor.execute(query, (before_id, limit))
+                    students = cursor.fetchall()
+
+                if self.cache:
+                    self.cache.put_query(('page_before', before_id, limit), students, version)
+                return students
+
+            except psycopg2.DatabaseError as error:
+                connection.rollback()
+                raise DatabaseOperationError(f'Failed to fetch records: {error}') from error
+
+    def fetch_by_ids(self, student_ids):
+        """
+        Retrieve the current rows of specific students in one query.
+        Args:
+            student_ids (list[int]): IDs of the students to fetch.
+        Returns:
+            list: The rows of the students that still exist, ordered by ID.
+        Raises:
+            DatabaseOperationError: If the query failed.
+        """
+        query = sql.SQL("""
+            SELECT id, name, address, age, number FROM {table_name}
+            WHERE id = ANY(%s)
+            ORDER BY id
+        """).format(table_name=sql.Identifier(self.table_name))
+        if self.cache:
+            version = self.cache.version  # Read before querying so concurrent changes are not hidden
+
+        with borrow_connection(self.connection) as connection:
+            try:
+                with connection.cursor() as cursor:
+                    cursor.execute(query, (list(student_ids),))
+                    students = cursor.fetchall()
+
+                if self.cache:
+                    self.cache.put_many(students, version)
+                return students
+
+            except psycopg2.DatabaseError as error:
+                connection.rollback()
+                raise DatabaseOperationError(f'Failed to fetch records: {error}') from error
+
+    def stream_records(self, itersize=2000):
+        """
+        Yield all records from the table one by one using a server-side cursor.
+
+        A named cursor keeps the result set on the server and transfers it in
+        batches of ``itersize`` rows, so memory use stays constant regardless of
+        the table size.
+        Args:
+            itersize (int): Number of rows fetched from the server per network round trip.
+        Yields:
+            tuple: One student row at a time, ordered by ID.
+        Raises:
+            DatabaseOperationError: If the query failed.
+        """
+        query = sql.SQL("""
+            SELECT id, name, address, age, number FROM {table_name}
+            ORDER BY id
+        """).format(table_name=sql.Identifier(self.table_name))
 
-            # Execute the SQL query to retrieve all rows in the table
-            cursor.execute(f"SELECT * FROM {self.table_name};")
+        with borrow_connection(self.connection) as connection:
+            # Named cursors are server-side cursors and live inside a transaction
+            cursor = connection.cursor(name=f'{self.table_name}_stream_{next(_stream_cursor_ids)}')
+            cursor.itersize = itersize
+            finished = False
+            try:
+                try:
+                    cursor.execute(query)
+                    yield from cursor
+                finally:
+                    # psycopg2 can only close a named cursor before the transaction holding it ends
+                    try:
+                        cursor.close()
+                    except psycopg2.Error as error:
+                        # The transaction is already aborted; the rollback below drops the cursor,
+                        # and the error that aborted it is the one worth reporting
+                        logging.warning(f'Could not close the streaming cursor: {error}')
 
-            # Fetch all results from the query
-            students = cursor.fetchall()
-            return students
+                # End the read-only transaction that held the cursor open
+                connection.commit()
+                finished = True
 
-        except psycopg2.DatabaseError as error:
-            messagebox.showerror('Database Error', f'Failed to fetch records: {error}')
-            return []
+            except psycopg2.DatabaseError as error:
+                connection.rollback()
+                finished = True
+                raise DatabaseOperationError(f'Failed to stream records: {error}') from error
 
-        finally:
-            # Close the cursor
-            cursor.close()
+            finally:
+                # End the transaction if the consumer stopped iterating early
+                if not finished:
+                    connection.rollback()
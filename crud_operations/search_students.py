@@ -0,0 +1,104 @@
+import psycopg2
+from psycopg2 import sql
+
+from crud_operations.connection_pool import borrow_connection
+from crud_operations.exceptions import DatabaseOperationError
+
+
+def escape_like(text):
+    """Escape the LIKE wildcards in user input so it is matched literally."""
+    return text.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+
+
+class StudentSearch:
+    """
+    Class for looking up students by name, address, age and phone number.
+
+    The filters are written so PostgreSQL can answer them from the indexes created by
+    ``CreateStudent.create_student_table``: trigram GIN indexes for the name prefix and
+    address substring, and btree indexes for the age range and phone number.
+    """
+
+    def __init__(self, db_connection, table_name='students2_1'):
+        """
+        Initialize with a database connection and table name.
+        Args:
+            db_connection: Active database connection or connection pool.
+            table_name (str): Name of the database table.
+        """
+        self.connection = db_connection
+        self.table_name = table_name
+
+    def search(self, name_prefix=None, address_contains=None, min_age=None, max_age=None,
+               number=None, after_id=0, limit=200, before_id=None):
+        """
+        Retrieve the students matching every given filter, ordered by ID.
+
+        Filters left as None (or empty) are not applied. Results are paginated with
+        the same keyset scheme as ``StudentDataReader.fetch_page``, or
+        ``StudentDataReader.fetch_page_before`` when ``before_id`` is given.
+        Args:
+            name_prefix (str): Case-insensitive prefix of the student's name.
+            address_contains (str): Case-insensitive substring of the address.
+            min_age (int): Minimum age, inclusive.
+            max_age (int): Maximum age, inclusive.
+            number (str): Exact phone number.
+            after_id (int): ID of the last row of the previous page (0 for the first page).
+            limit (int): Maximum number of rows to return.
+            before_id (int): Return the last matching rows before this ID instead of the first ones.
+        Returns:
+            list: Matching student rows ordered by ID.
+        Raises:
+            DatabaseOperationError: If the query failed.
+        """
+        conditions = [sql.SQL('id > %s')]
+        params = [after_id]
+
+        if name_prefix:
+            conditions.append(sql.SQL('name ILIKE %s'))
+            params.append(escape_like(name_prefix) + '%')
+        if address_contains:
+            conditions.append(sql.SQL('address ILIKE %s'))
+            params.append('%' + escape_like(address_contains) + '%')
+        if min_age is not None:
+            conditions.append(sql.SQL('age >= %s'))
+            params.append(min_age)
+        if max_age is not None:
+            conditions.append(sql.SQL('age <= %s'))
+            params.append(max_age)
+        if number:
+            conditions.append(sql.SQL('number = %s'))
+            params.append(number)
+
+        if before_id is None:
+            query = sql.SQL("""
+            SELECT id, name, address, age, number FROM {table_name}
+            WHERE {conditions}
+            ORDER BY id
+            LIMIT %s
+        """)
+        else:
+            conditions.append(sql.SQL('id < %s'))
+            params.append(before_id)
+            query = sql.SQL("""
+            SELECT id, name, address, age, number FROM (
+                SELECT id, name, address, age, number FROM {table_name}
+                WHERE {conditions}
+                ORDER BY id DESC
+                LIMIT %s
+            ) AS page
+            ORDER BY id
+        """)
+        query = query.format(table_name=sql.Identifier(self.table_name),
+                             conditions=sql.SQL(' AND ').join(conditions))
+        params.append(limit)
+
+        with borrow_connection(self.connection) as connection:
+            try:
+                with connection.cursor() as cursor:
+                    cursor.execute(query, params)
+                    return cursor.fetchall()
+
+            except psycopg2.DatabaseError as error:
+                connection.rollback()
+                raise DatabaseOperationError(f'Failed to search records: {error}') from error
@@ -0,0 +1,204 @@
+import threading
+import time
+from collections import OrderedDict
+
+
+class StudentCache:
+    """
+    Bounded, thread-safe LRU cache of student rows keyed by ID, with versioned query results.
+
+    Single rows are cached by ID. Results of whole queries (the full table or one page
+    of it) are cached together with the cache ``version``; every insert, update or
+    delete bumps the version, which invalidates all cached query results at once.
+    Every entry also expires after ``ttl`` seconds, which bounds how stale data
+    changed by other clients can be.
+
+    Rows read from the database are only stored if the version has not changed since
+    the read started, so a read racing a change cannot put the old row back.
+    """
+
+    def __init__(self, max_size=10000, ttl=30, max_queries=64, max_query_rows=5000):
+        """
+        Initialize an empty cache.
+        Args:
+            max_size (int): Maximum number of student rows kept.
+            ttl (float): Seconds after which a cached entry is treated as missing.
+            max_queries (int): Maximum number of query results kept.
+            max_query_rows (int): Query results with more rows than this are not cached.
+        """
+        self.max_size = max_size
+        self.ttl = ttl
+        self.max_queries = max_queries
+        self.max_query_rows = max_query_rows
+        self.version = 0  # Incremented on every change to the table
+        self.hits = 0
+        self.misses = 0
+        self._rows = OrderedDict()  # student ID -> (row, time stored)
+        self._queries = OrderedDict()  # query key -> (rows, version, time stored)
+        self._lock = threading.Lock()
+
+    def get(self, student_id):
+        """
+        Return the cached row of a student.
+        Args:
+            student_id (int): The student's ID.
+        Returns:
+            tuple: The cached row, or None on a miss.
+        """
+        with self._lock:
+            entry = self._rows.get(student_id)
+            if entry is None or self._expired(entry[1]):
+                self._rows.pop(student_id, None)
+                self.misses += 1
+                return None
+            self._rows.move_to_end(student_id)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, row, version=None):
+        """
+        Cache one student row, evicting the least recently used row if the cache is full.
+        Args:
+            row (tuple): The student row; its first element is the ID.
+            version (int): Cache version read before the row was queried; the row is not
+                stored if the table changed since then.
+        """
+        with self._lock:
+            if version is None or version == self.version:
+                self._store(row)
+
+    def put_many(self, rows, version=None):
+        """
+        Cache several student rows at once.
+        Args:
+            rows (iterable): Student rows.
+            version (int): Cache version read before the rows were queried; they are not
+                stored if the table changed since then.
+        """
+        with self._lock:
+            if version is not None and version != self.version:
+                return
+            for row in rows:
+                self._store(row)
+
+    def invalidate(self, student_id):
+        """
+        Drop a student's row after it was changed or deleted, and invalidate query results.
+        Args:
+            student_id (int): The student's ID.
+        """
+        with self._lock:
+            self._rows.pop(student_id, None)
+            self._bump_version()
+
+    def record_change(self, row=None):
+        """
+        Note that the table changed, optionally caching the new version of a row.
+        Args:
+            row (tuple): The inserted or updated row, if known.
+        """
+        with self._lock:
+            if row is not None:
+                self._store(row)
+            self._bump_version()
+
+    def clear(self):
+        """Drop every cached row and query result."""
+        with self._lock:
+            self._rows.clear()
+            self._bump_version()
+
+    def get_query(self, key):
+        """
+        Return a cached query result if the table has not changed since it was stored.
+        Args:
+            key (tuple): Identifies the query and its parameters.
+        Returns:
+            list: The cached rows, or None on a miss.
+        """
+        with self._lock:
+            entry = self._queries.get(key)
+            if entry is None or entry[1] != self.version or self._expired(entry[2]):
+                self._queries.pop(key, None)
+                self.misses += 1
+                return None
+            self._queries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put_query(self, key, rows, version):
+        """
+        Cache a query result and its rows.
+        Args:
+            key (tuple): Identifies the query and its parameters.
+            rows (list): Rows returned by the query.
+            version (int): Cache version read before the query was run, so a change
+                made while it ran keeps the result and its rows from being used.
+        """
+        with self._lock:
+            # The rows may predate a change made while the query ran
+            if version != self.version or len(rows) > self.max_query_rows:
+                return
+            for row in rows:
+                self._store(row)
+            self._queries[key] = (rows, version, time.monotonic())
+            self._queries.move_to_end(key)
+            while len(self._queries) > self.max_queries:
+                self._queries.popitem(last=False)
+
+    def invalidate_queries(self):
+        """Drop every cached query result, keeping the cached rows."""
+        with self._lock:
+            self._bump_version()
+
+    def stats(self):
+        """
+        Return hit/miss statistics.
+        Returns:
+            dict: Hits, misses, hit rate, cached row and query counts, and the current version.
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+                'rows': len(self._rows),
+                'queries': len(self._queries),
+                'version': self.version,
+            }
+
+    def _store(self, row):
+        """Insert a row while holding the lock."""
+        self._rows[row[0]] = (row, time.monotonic())
+        self._rows.move_to_end(row[0])
+        while len(self._rows) > self.max_size:
+            self._rows.popitem(last=False)
+
+    def _bump_version(self):
+        """Invalidate every cached query result while holding the lock."""
+        self.version += 1
+        self._queries.clear()
+
+    def _expired(self, stored_at):
+        """Return True if an entry stored at ``stored_at`` is older than the TTL."""
+        return time.monotonic() - stored_at > self.ttl
+
+
+# Caches shared by every window of the application, one per table
+_caches = {}
+_caches_lock = threading.Lock()
+
+
+def get_student_cache(table_name='students2_1'):
+    """
+    Return the application-wide cache of a table, creating it on first use.
+    Args:
+        table_name (str): Name of the database table.
+    Returns:
+        StudentCache: The shared cache.
+    """
+    with _caches_lock:
+        if table_name not in _caches:
+            _caches[table_name] = StudentCache()
+        return _caches[table_name]
@@ -0,0 +1,122 @@
+import psycopg2
+from psycopg2 import sql
+
+from crud_operations.connection_pool import borrow_connection
+from crud_operations.exceptions import DatabaseOperationError, ValidationError
+
+# Width in years of each bar of the age histogram
+AGE_BUCKET_WIDTH = 5
+
+# Cities and duplicate phone numbers listed, most frequent first
+TOP_ROWS = 20
+
+# The city is the last comma-separated part of the address ("12 Main Street, Hannover")
+CITY_EXPRESSION = sql.SQL("btrim(regexp_replace(address, '^.*,', ''))")
+
+
+class StudentStatistics:
+    """
+    Class for computing aggregate statistics of the student table.
+
+    Every figure is computed by PostgreSQL with aggregate queries, so only a few dozen
+    result rows are sent to the client however large the table is, instead of every
+    student being fetched and counted in Python.
+    """
+
+    def __init__(self, db_connection, table_name='students2_1'):
+        """
+        Initialize with a database connection and table name.
+        Args:
+            db_connection: Active database connection or connection pool.
+            table_name (str): Name of the database table.
+        """
+        self.connection = db_connection
+        self.table_name = table_name
+
+    def compute(self, age_bucket_width=AGE_BUCKET_WIDTH, top=TOP_ROWS):
+        """
+        Compute the statistics of the student table.
+
+        The queries run in one read-only repeatable read transaction, so all figures
+        describe the same snapshot of the table.
+        Args:
+            age_bucket_width (int): Width in years of each bar of the age histogram.
+            top (int): Number of cities and duplicate phone numbers to list.
+        Returns:
+            dict: 'count' of students; 'age' with its min, max, mean and standard deviation
+            (None for an empty table); 'age_histogram' as a list of {'from', 'to', 'count'};
+            'cities' with the number of 'distinct' cities and the 'top' ones as {'city', 'count'};
+            'duplicate_numbers' with the number of phone numbers shared by several students
+            ('numbers'), how many students share them ('students') and the 'top' ones as
+            {'number', 'count'}.
+        Raises:
+            ValidationError: If the bucket width or the number of listed rows is not positive.
+            DatabaseOperationError: If a query failed.
+        """
+        if age_bucket_width < 1 or top < 1:
+            raise ValidationError('The age bucket width and the number of listed rows must be positive.')
+
+        table_name = sql.Identifier(self.table_name)
+
+        with borrow_connection(self.connection) as connection:
+            try:
+                with connection.cursor() as cursor:
+                    cursor.execute('SET TRANSACTION ISOLATION LEVEL REPEATABLE READ, READ ONLY')
+
+                    cursor.execute(sql.SQL("""
+                        SELECT count(*), min(age), max(age), avg(age), stddev_pop(age) FROM {table_name}
+                    """).format(table_name=table_name))
+                    count, min_age, max_age, mean_age, stddev_age = cursor.fetchone()
+
+                    cursor.execute(sql.SQL("""
+                        SELECT age / %s * %s AS bucket, count(*) FROM {table_name}
+                        GROUP BY bucket
+                        ORDER BY bucket
+                    """).format(table_name=table_name), (age_bucket_width, age_bucket_width))
+                    histogram = cursor.fetchall()
+
+                    # count(*) OVER () is the number of groups, computed before the LIMIT
+                    cursor.execute(sql.SQL("""
+                        SELECT {city} AS city, count(*), count(*) OVER () FROM {table_name}
+                        GROUP BY city
+                        ORDER BY count(*) DESC, city
+                        LIMIT %s
+                    """).format(city=CITY_EXPRESSION, table_name=table_name), (top,))
+                    cities = cursor.fetchall()
+
+                    cursor.execute(sql.SQL("""
+                        SELECT number, count(*), count(*) OVER (), sum(count(*)) OVER () FROM {table_name}
+                        GROUP BY number
+                        HAVING count(*) > 1
+                        ORDER BY count(*) DESC, number
+                        LIMIT %s
+                    """).format(table_name=table_name), (top,))
+                    duplicates = cursor.fetchall()
+
+                connection.commit()  # End the read-only transaction
+
+            except psycopg2.DatabaseError as error:
+                connection.rollback()
+                raise DatabaseOperationError(f'Failed to compute statistics: {error}') from error
+
+        return {
+            'count': count,
+            'age': {
+                'min': min_age,
+                'max': max_age,
+                'mean': round(float(mean_age), 2) if mean_age is not None else None,
+                'stddev': round(float(stddev_age), 2) if stddev_age is not None else None,
+            },
+            'age_histogram': [{'from': bucket, 'to': bucket + age_bucket_width - 1, 'count': bucket_count}
+                              for bucket, bucket_count in histogram],
+            'cities': {
+                'distinct': cities[0][2] if cities else 0,
+                'top': [{'city': city, 'count': city_count} for city, city_count, _ in cities],
+            },
+            'duplicate_numbers': {
+                'numbers': duplicates[0][2] if duplicates else 0,
+                'students': int(duplicates[0][3]) if duplicates else 0,
+                'top': [{'number': number, 'count': number_count}
+                        for number, number_count, _, _ in duplicates],
+            },
+        }
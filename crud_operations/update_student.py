@@ -1,72 +1,108 @@
 import psycopg2
 from psycopg2 import sql
-from tkinter import messagebox
 import logging
 
+from crud_operations.connection_pool import borrow_connection
+from crud_operations.exceptions import DatabaseOperationError, StudentNotFoundError
+from crud_operations.prepared_statements import prepared_statements
+from crud_operations.validation import validate_student
+
 logging.basicConfig(level=logging.INFO)
 
 
 class UpdateStudent:
 
-    def __init__(self, db_connection, table_name='students2_1'):
+    def __init__(self, db_connection, table_name='students2_1', cache=None):
         self.connection = db_connection
         self.table_name = table_name
+        self.cache = cache  # Optional StudentCache kept in sync with updates
 
     def update_all_student_fields(self, student_id, name, address, age, number):
         """ Update the fields of a student record identified by their student_id.
         This method updates the name, address, age, and number of a student.
+
+        Returns:
+            tuple: The updated student row.
+        Raises:
+            ValidationError: If a field is missing or invalid.
+            StudentNotFoundError: If no student has the given ID.
+            DatabaseOperationError: If the update failed.
         """
-        try:
-            # Initialize a cursor to interact with the database
-            cursor = self.connection.cursor()
+        # Validate input fields with the rules applied to new students and ensure age is an integer
+        age = validate_student(name, address, age, number)
+
+        with borrow_connection(self.connection) as connection:
+            try:
+                # Initialize a cursor to interact with the database
+                cursor = connection.cursor()
 
-            # Construct the update query
-            update_query = sql.SQL("""
-                 UPDATE {table_name} 
+                # Construct the update query, or reuse the one already prepared for this table
+                update_query = prepared_statements.statement(
+                    ('update_all_student_fields', self.table_name), lambda: sql.SQL("""
+                 UPDATE {table_name}
                  SET name = %s, address = %s, age = %s, number = %s
-                 WHERE id = %s 
-                    """).format(table_name=sql.Identifier(self.table_name))
+                 WHERE id = %s
+                 RETURNING id, name, address, age, number
+                    """).format(table_name=sql.Identifier(self.table_name)))
 
-            # Execute the query with the parameters
-            cursor.execute(update_query, (name, address, age, number, student_id))
+                # Execute the query with the parameters
+                prepared_statements.execute(cursor, update_query, (name, address, age, number, student_id))
+                updated_student = cursor.fetchone()
 
-            # Check if the student was updated
-            if cursor.rowcount > 0:
-                logging.info(f'Student woth ID {student_id} updated successfully.')
-                messagebox.showinfo('Success',
-                                    f'Student with ID {student_id} updated successfully.')
-            else:
-                logging.warning(f'Student with ID {student_id} not found.')
-                messagebox.showwarning('Not Found', f'Student with ID {student_id} not found.')
+                # Commit the transaction to make sure the data is saved to the database
+                connection.commit()
 
-            # Commit the transaction to make sure the data is saved to the database
-            self.connection.commit()
+            except psycopg2.Error as e:
+                logging.error(f'Database error: {e}')
+                connection.rollback()
+                raise DatabaseOperationError(f'Could not update student: {e}') from e
 
-            print("Data updated successfully.")
+            finally:
+                # Close the cursor
+                cursor.close()
 
-        except psycopg2.Error as e:
-            logging.error(f'Database error: {e}')
-            self.connection.rollback()
-            messagebox.showerror('Database Error', f'Could not update student: {e}')
+        # Check if the student was updated
+        if not updated_student:
+            logging.warning(f'Student with ID {student_id} not found.')
+            raise StudentNotFoundError(student_id)
 
-        finally:
-            # Close the cursor
-            cursor.close()
+        logging.info(f'Student with ID {student_id} updated successfully.')
+        if self.cache:
+            self.cache.record_change(updated_student)
+        return updated_student
 
     def find_student_by_id(self, student_id):
-        """Check if a student exists by ID."""
+        """
+        Fetch a student by ID.
+
+        Returns the full row so the update form can be pre-filled without another query.
+        Returns:
+            tuple: The (id, name, address, age, number) row, or None if the student does not exist.
+        Raises:
+            DatabaseOperationError: If the query failed.
+        """
+        if self.cache:
+            cached = self.cache.get(int(student_id))
+            if cached is not None:
+                return cached
+            version = self.cache.version  # Read before querying so concurrent changes are not hidden
+
         query = sql.SQL("""
-            SELECT id FROM {table_name}
+            SELECT id, name, address, age, number FROM {table_name}
             WHERE id = %s
         """).format(table_name=sql.Identifier(self.table_name))
-        try:
-            with self.connection.cursor() as cursor:
-                cursor.execute(query, (student_id,))
-                return cursor.fetchone() is not None
-
-        except psycopg2.Error as e:
-            # Handle errors and rollback transaction if necessary
-            self.connection.rollback()
-            messagebox.showerror('Database Error', f'Could not fetch student: {e}')
-            logging.error(f'Database error: {e}')
-            return False
+        with borrow_connection(self.connection) as connection:
+            try:
+                with connection.cursor() as cursor:
+                    cursor.execute(query, (student_id,))
+                    student = cursor.fetchone()
+
+                if self.cache and student:
+                    self.cache.put(student, version)
+                return student
+
+            except psycopg2.Error as e:
+                # Handle errors and rollback transaction if necessary
+                connection.rollback()
+                logging.error(f'Database error: {e}')
+                raise DatabaseOperationError(f'Could not fetch student: {e}') from e
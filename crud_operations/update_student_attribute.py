@@ -1,8 +1,14 @@
 import logging
-from tkinter import messagebox
+from typing import Optional
 
 import psycopg2
 from psycopg2 import sql
+from psycopg2.extras import execute_values
+
+from crud_operations.connection_pool import borrow_connection
+from crud_operations.exceptions import DatabaseOperationError, StudentNotFoundError
+from crud_operations.prepared_statements import prepared_statements
+from crud_operations.validation import FIELD_TYPES, validate_field_value, validate_student_id
 
 logging.basicConfig(level=logging.INFO)
 
@@ -12,15 +18,17 @@ class UpdateStudentAttribute:
     Provides methods for updating specific student attributes in the database.
     """
 
-    def __init__(self, db_connection, table_name='students2_1'):
+    def __init__(self, db_connection, table_name='students2_1', cache=None):
         """
         Initialize the UpdateStudentAttribute class.
         Args:
-            db_connection: Active connection to the PostgreSQL database.
+            db_connection: Active connection or connection pool for the PostgreSQL database.
             table_name (str): Name of the student records table.
+            cache (StudentCache): Optional row cache kept in sync with updates.
         """
         self.connection = db_connection
         self.table_name = table_name
+        self.cache = cache
 
     def update_student_field(self, student_id: int, field_choice: str, value):
         """
@@ -30,68 +38,154 @@ class UpdateStudentAttribute:
             student_id (int): ID of the student to update.
             field_choice (str): Field to be updated ('name', 'address', 'age', 'number').
             value: New value for the field.
+
+        Returns:
+            tuple: The updated student row.
+
+        Raises:
+            ValidationError: If the field cannot be updated or the value is invalid.
+            StudentNotFoundError: If no student has the given ID.
+            DatabaseOperationError: If the update failed.
         """
-        valid_fields = ['name', 'address', 'age', 'number']
-
-        if field_choice not in valid_fields:
-            logging.error(f'Invalid field choice: {field_choice}')
-            messagebox.showerror('Error', f'Invalid field: {field_choice}. Please choose a valid field.')
-            return
-
-        try:
-            # Prepare SQL query to update the selected field
-            query = sql.SQL("""
-                UPDATE {table_name}
-                SET {field} = %s
-                WHERE id = %s
-            """).format(
-                table_name=sql.Identifier(self.table_name),
-                field=sql.Identifier(field_choice)
-            )
-
-            # Execute the query
-            with self.connection.cursor() as cursor:
-                cursor.execute(query, (value, student_id))
-
-                # Commit the transaction to make sure the data is saved to the database
-                self.connection.commit()
-
-                # Provide feedback to the user
-                if cursor.rowcount > 0:
-                    logging.info(f'{field_choice.capitalize()} updated successfully for student with ID: {student_id}.')
-                    messagebox.showinfo('Success', f'{field_choice.capitalize()} updated successfully!')
-                else:
-                    logging.warning(f'No student found with ID {student_id}.')
-                    messagebox.showerror('Error', f'Student with ID {student_id} not found.')
-
-        except psycopg2.Error as e:
-            logging.error(f'Database error during update: {e}')
-            self.connection.rollback()
-            messagebox.showerror('Database Error', f'Could not update student attribute: {e}')
-
-    def find_student_by_id(self, student_id: int) -> bool:
+        value = validate_field_value(field_choice, value)
+
+        # Prepare SQL query to update the selected field, composed once per table and field
+        query = prepared_statements.statement(('update_student_field', self.table_name, field_choice),
+                                              lambda: sql.SQL("""
+            UPDATE {table_name}
+            SET {field} = %s
+            WHERE id = %s
+            RETURNING id, name, address, age, number
+        """).format(
+            table_name=sql.Identifier(self.table_name),
+            field=sql.Identifier(field_choice)
+        ))
+
+        with borrow_connection(self.connection) as connection:
+            try:
+                # Execute the query
+                with connection.cursor() as cursor:
+                    prepared_statements.execute(cursor, query, (value, student_id))
+                    updated_student = cursor.fetchone()
+
+                    # Commit the transaction to make sure the data is saved to the database
+                    connection.commit()
+
+            except psycopg2.Error as e:
+                logging.error(f'Database error during update: {e}')
+                connection.rollback()
+                raise DatabaseOperationError(f'Could not update student attribute: {e}') from e
+
+        if not updated_student:
+            logging.warning(f'No student found with ID {student_id}.')
+            raise StudentNotFoundError(student_id)
+
+        logging.info(f'{field_choice.capitalize()} updated successfully for student with ID: {student_id}.')
+        if self.cache:
+            self.cache.record_change(updated_student)
+        return updated_student
+
+    def update_students_fields(self, updates):
         """
-        Check if a student exists by ID.
+        Apply many attribute updates in a single transaction.
+
+        Updates are grouped per field and each group is applied with one
+        ``UPDATE ... FROM (VALUES ...)`` statement. When the same field of the same
+        student appears more than once, the last value wins.
+
+        Args:
+            updates (iterable): ``(student_id, field, value)`` tuples.
+
+        Returns:
+            dict: 'matched' and 'unmatched' counts of distinct student IDs, and the sorted
+            'unmatched_ids'.
+
+        Raises:
+            ValidationError: If one of the IDs or fields cannot be updated or one of the values
+                is invalid; nothing is updated.
+            DatabaseOperationError: If the update failed; nothing is updated.
+        """
+        # Group the new values per field, keyed by student ID
+        values_by_field = {}
+        for student_id, field_choice, value in updates:
+            value = validate_field_value(field_choice, value)
+            values_by_field.setdefault(field_choice, {})[validate_student_id(student_id)] = value
+
+        requested_ids = {student_id for values in values_by_field.values() for student_id in values}
+        matched_ids = set()
+
+        with borrow_connection(self.connection) as connection:
+            try:
+                with connection.cursor() as cursor:
+                    for field_choice, values in values_by_field.items():
+                        query = sql.SQL("""
+                            UPDATE {table_name} AS s
+                            SET {field} = v.value
+                            FROM (VALUES %s) AS v(id, value)
+                            WHERE s.id = v.id
+                            RETURNING s.id
+                        """).format(
+                            table_name=sql.Identifier(self.table_name),
+                            field=sql.Identifier(field_choice)
+                        )
+                        template = f'(%s::int, %s::{FIELD_TYPES[field_choice]})'
+                        updated = execute_values(cursor, query, list(values.items()),
+                                                 template=template, page_size=len(values), fetch=True)
+                        matched_ids.update(row[0] for row in updated)
+
+                # Commit every field group at once
+                connection.commit()
+                if self.cache:
+                    for student_id in matched_ids:
+                        self.cache.invalidate(student_id)
+
+            except psycopg2.Error as e:
+                logging.error(f'Database error during batch update: {e}')
+                connection.rollback()
+                raise DatabaseOperationError(f'Could not update student attributes: {e}') from e
+
+        unmatched_ids = sorted(requested_ids - matched_ids)
+        logging.info(f'Batch update matched {len(matched_ids)} students, {len(unmatched_ids)} not found.')
+        return {'matched': len(matched_ids), 'unmatched': len(unmatched_ids), 'unmatched_ids': unmatched_ids}
+
+    def find_student_by_id(self, student_id: int) -> Optional[tuple]:
+        """
+        Fetch a student by ID.
 
         Args:
             student_id (int): The student's ID.
 
         Returns:
-            bool: True if the student exists, False otherwise.
+            tuple: The (id, name, address, age, number) row, or None if the student does not exist.
+
+        Raises:
+            ValidationError: If the ID is not a whole number.
+            DatabaseOperationError: If the query failed.
         """
+        student_id = validate_student_id(student_id)  # IDs typed in the GUI arrive as strings
+        if self.cache:
+            cached = self.cache.get(student_id)
+            if cached is not None:
+                return cached
+            version = self.cache.version  # Read before querying so concurrent changes are not hidden
+
         query = sql.SQL("""
-                SELECT id FROM {table_name}
+                SELECT id, name, address, age, number FROM {table_name}
                 WHERE id = %s
             """).format(table_name=sql.Identifier(self.table_name))
 
-        try:
-            with self.connection.cursor() as cursor:
-                cursor.execute(query, (student_id,))
-                return cursor.fetchone() is not None
-
-        except psycopg2.Error as e:
-            # Handle errors and rollback transaction if necessary
-            logging.error(f'Error checking student existence: {e}')
-            self.connection.rollback()
-            messagebox.showerror('Database Error', f'Could not check student ID: {e}')
-            return False
+        with borrow_connection(self.connection) as connection:
+            try:
+                with connection.cursor() as cursor:
+                    cursor.execute(query, (student_id,))
+                    student = cursor.fetchone()
+
+                if self.cache and student:
+                    self.cache.put(student, version)
+                return student
+
+            except psycopg2.Error as e:
+                # Handle errors and rollback transaction if necessary
+                logging.error(f'Error checking student existence: {e}')
+                connection.rollback()
+                raise DatabaseOperationError(f'Could not check student ID: {e}') from e
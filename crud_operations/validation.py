@@ -0,0 +1,111 @@
+from crud_operations.exceptions import ValidationError
+
+# SQL types of the updatable fields, also used to cast the values of batch updates
+FIELD_TYPES = {'name': 'text', 'address': 'text', 'age': 'int', 'number': 'text'}
+
+
+def is_valid_phone_number(number):
+    """Validates that the phone number has 10 digits."""
+    return isinstance(number, str) and len(number) == 10 and number.isdigit()
+
+
+def validate_student(name, address, age, number):
+    """
+    Check the fields of a new student.
+    Args:
+        name (str): Name of the student.
+        address (str): Address of the student.
+        age: Age of the student, as an int or a numeric string.
+        number (str): Contact number of the student.
+    Returns:
+        int: The age converted to an integer.
+    Raises:
+        ValidationError: If a field is missing or invalid.
+    """
+    if not name or not address or not age:
+        raise ValidationError('Please fill out all fields.', title='Missing Fields')
+
+    if not isinstance(name, str) or not isinstance(address, str):
+        raise ValidationError('Name and address must be text.', title='Invalid Input')
+
+    if not is_valid_phone_number(number):
+        raise ValidationError('Please enter a valid phone number.', title='Invalid Phone Number')
+
+    return validate_age(age)
+
+
+def validate_student_id(student_id):
+    """
+    Check a student ID and convert it to an integer.
+    Args:
+        student_id: ID of the student, as an int or a numeric string.
+    Returns:
+        int: The ID converted to an integer.
+    Raises:
+        ValidationError: If the ID is not a whole number.
+    """
+    try:
+        return int(student_id)
+    except (TypeError, ValueError):
+        raise ValidationError(f'Invalid student ID: {student_id}.', title='Invalid ID') from None
+
+
+def validate_age(age):
+    """
+    Check an age and convert it to an integer.
+    Args:
+        age: Age of the student, as an int or a numeric string.
+    Returns:
+        int: The age converted to an integer.
+    Raises:
+        ValidationError: If the age is not a number or is negative.
+    """
+    try:
+        age = int(age)
+    except (TypeError, ValueError):
+        raise ValidationError('Please enter a valid number for age.', title='Invalid Age') from None
+
+    # Mirrors the CHECK constraint on the table, so the database is not left to reject it
+    if age < 0:
+        raise ValidationError('Age cannot be negative.', title='Invalid Age')
+    return age
+
+
+def validate_field(field_choice):
+    """
+    Check that a field can be updated.
+    Args:
+        field_choice (str): Name of the field.
+    Raises:
+        ValidationError: If the field is not one of ``FIELD_TYPES``.
+    """
+    if field_choice not in FIELD_TYPES:
+        raise ValidationError(f'Invalid field: {field_choice}. Please choose a valid field.')
+
+
+def validate_field_value(field_choice, value):
+    """
+    Check a field and the new value for it, with the rules ``validate_student`` applies to a new student.
+    Args:
+        field_choice (str): Name of the field.
+        value: New value for the field.
+    Returns:
+        The value converted to the type of the field (an int for the age).
+    Raises:
+        ValidationError: If the field cannot be updated or the value is missing or invalid.
+    """
+    validate_field(field_choice)
+
+    if value is None or value == '':
+        raise ValidationError(f'Please enter a value for {field_choice}.', title='Missing Fields')
+
+    if field_choice == 'age':
+        return validate_age(value)
+
+    if field_choice == 'number':
+        if not is_valid_phone_number(value):
+            raise ValidationError('Please enter a valid phone number.', title='Invalid Phone Number')
+    elif not isinstance(value, str):
+        raise ValidationError(f'{field_choice.capitalize()} must be text.', title='Invalid Input')
+
+    return value
@@ -2,6 +2,11 @@ import tkinter as tk
 from tkinter import messagebox
 
 from crud_operations.add_student import AddStudent
+from crud_operations.exceptions import ValidationError
+from crud_operations.student_cache import get_student_cache
+from crud_operations.validation import validate_student
+from gui.db_executor import BusyIndicator, get_db_executor
+from gui.dialogs import show_error
 
 
 class CreateStudentWindow:
@@ -12,7 +17,7 @@ class CreateStudentWindow:
         Initialize a new window for creating a student.
         Args:
             master (Tkinter.Tk): The parent Tkinter window (usually the root window).
-            db_connection: A live connection to the PostgreSQL database used to add the student.
+            db_connection: A live connection or connection pool for the PostgreSQL database used to add the student.
         """
         # Create a new top-level window (a child window of the main root window)
         self.top = tk.Toplevel(master)
@@ -21,6 +26,10 @@ class CreateStudentWindow:
         # Store the database connection for use in submitting student data
         self.db_connection = db_connection
 
+        # Database calls run in the background while the busy indicator is shown
+        self.executor = get_db_executor(master)
+        self.busy_indicator = BusyIndicator(self.top)
+
         # Call the method to create and display form fields
         self.create_form_fields()
 
@@ -59,7 +68,8 @@ class CreateStudentWindow:
         self.number_entry.pack(pady=5)
 
         # Submit button to trigger the student creation process
-        tk.Button(self.top, text='Submit', command=self.submit_student).pack(pady=10)
+        self.submit_button = tk.Button(self.top, text='Submit', command=self.submit_student)
+        self.submit_button.pack(pady=10)
 
     def submit_student(self):
         """
@@ -72,21 +82,37 @@ class CreateStudentWindow:
         number = self.number_entry.get()
         age = self.age_entry.get()
 
-        # Validate name, address, and number fields
-        if not name or not address or not age:
-            messagebox.showerror('Missing Fields',
-                                 'Please fill out all fields.')
+        # Validate all fields before going to the database
+        try:
+            validate_student(name, address, age, number)
+        except ValidationError as error:
+            show_error(error)
             return
 
-        # Validate phone number
-        if not number.isdigit():
-            messagebox.showerror('Invalid Phone Number',
-                                 'Please enter a valid phone number.')
-            return
+        # Disable the button so the student is not submitted twice while the insert runs
+        self.submit_button.config(state='disabled')
 
-        # Create AddStudent instance and add student data to the database
-        create_student_instance = AddStudent(self.db_connection)
-        create_student_instance.add_student(name, address, age, number)
+        # Create AddStudent instance and add student data to the database in the background
+        create_student_instance = AddStudent(self.db_connection, cache=get_student_cache())
+        self.executor.submit(create_student_instance.add_student, name, address, age, number,
+                             on_success=self.on_student_added,
+                             on_error=self.on_submit_error,
+                             busy=self.busy_indicator)
 
-        # Close the student creation window after submission
+    def on_student_added(self, student):
+        """
+        Confirm the insert and close the window.
+        Args:
+            student (tuple): The inserted student row.
+        """
+        messagebox.showinfo('Success', 'Student added successfully!')
         self.top.destroy()
+
+    def on_submit_error(self, error):
+        """
+        Report an error from the background insert and re-enable the form.
+        Args:
+            error (Exception): The exception raised while adding the student.
+        """
+        show_error(error)
+        self.submit_button.config(state='normal')
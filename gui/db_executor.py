@@ -0,0 +1,133 @@
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from tkinter import ttk
+
+
+class DatabaseExecutor:
+    """
+    Runs database calls on background worker threads so the Tk main loop never blocks.
+
+    Results are handed back to the Tk thread by polling the pending futures with
+    ``after()``, so callbacks are free to update widgets.
+    """
+
+    def __init__(self, master, max_workers=4, poll_interval=50):
+        """
+        Initialize the executor.
+        Args:
+            master (tk.Tk): The root Tkinter window whose event loop receives the results.
+            max_workers (int): Number of worker threads (and so concurrent connections in use).
+            poll_interval (int): Milliseconds between checks for finished calls.
+        """
+        self.master = master
+        self.poll_interval = poll_interval
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='db-worker')
+        self._pending = []  # Tuples of (future, on_success, on_error, busy indicator)
+        self._poll_job = None  # ID of the scheduled after() callback, if any
+
+    def submit(self, func, *args, on_success=None, on_error=None, busy=None):
+        """
+        Run ``func(*args)`` on a worker thread.
+
+        Args:
+            func (callable): The database call to run.
+            *args: Positional arguments passed to ``func``.
+            on_success (callable): Called on the Tk thread with the return value of ``func``.
+            on_error (callable): Called on the Tk thread with the exception raised by ``func``.
+            busy (BusyIndicator): Indicator shown while the call is running.
+        """
+        if busy:
+            busy.start()
+        future = self._executor.submit(func, *args)
+        self._pending.append((future, on_success, on_error, busy))
+
+        if self._poll_job is None:
+            self._poll_job = self.master.after(self.poll_interval, self._poll)
+
+    def shutdown(self):
+        """Stop polling and discard calls that have not started yet."""
+        if self._poll_job is not None:
+            self.master.after_cancel(self._poll_job)
+            self._poll_job = None
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _poll(self):
+        """Dispatch the callbacks of finished calls and reschedule while calls are pending."""
+        self._poll_job = None
+        still_pending = []
+
+        for item in self._pending:
+            future, on_success, on_error, busy = item
+            if not future.done():
+                still_pending.append(item)
+                continue
+
+            if busy:
+                busy.stop()
+            try:
+                error = future.exception()
+                if error is None:
+                    if on_success:
+                        on_success(future.result())
+                elif on_error:
+                    on_error(error)
+                else:
+                    logging.error(f'Unhandled error in background database call: {error}')
+            except Exception as e:
+                # A callback may touch a window the user already closed
+                logging.error(f'Error in database callback: {e}')
+
+        self._pending = still_pending
+        if self._pending:
+            self._poll_job = self.master.after(self.poll_interval, self._poll)
+
+
+class BusyIndicator:
+    """
+    Indeterminate progress bar shown in a window while background database calls run.
+    """
+
+    def __init__(self, parent):
+        """
+        Initialize the indicator (hidden until started).
+        Args:
+            parent (tk.Widget): The window or frame that displays the progress bar.
+        """
+        self.parent = parent
+        self.progress_bar = ttk.Progressbar(parent, mode='indeterminate')
+        self._active = 0  # Number of calls currently running
+
+    def start(self):
+        """Show the progress bar for a newly started call."""
+        self._active += 1
+        if self._active == 1 and self.parent.winfo_exists():
+            self.progress_bar.pack(fill='x', padx=10, pady=5)
+            self.progress_bar.start(10)
+
+    def stop(self):
+        """Hide the progress bar once every running call has finished."""
+        self._active = max(self._active - 1, 0)
+        if self._active == 0 and self.parent.winfo_exists():
+            self.progress_bar.stop()
+            self.progress_bar.pack_forget()
+
+    @property
+    def busy(self):
+        """bool: True while at least one call is running."""
+        return self._active > 0
+
+
+def get_db_executor(master):
+    """
+    Return the executor shared by every window of an application, creating it on first use.
+    Args:
+        master (tk.Misc): Any widget of the application.
+    Returns:
+        DatabaseExecutor: The executor bound to the application's root window.
+    """
+    root = master._root()
+    executor = getattr(root, '_db_executor', None)
+    if executor is None:
+        executor = DatabaseExecutor(root)
+        root._db_executor = executor
+    return executor
@@ -2,6 +2,9 @@ import tkinter as tk
 from tkinter import messagebox
 
 from crud_operations.delete_student import DeleteStudent
+from crud_operations.student_cache import get_student_cache
+from gui.db_executor import BusyIndicator, get_db_executor
+from gui.dialogs import show_error
 
 
 class DeleteStudentWindow:
@@ -14,7 +17,7 @@ class DeleteStudentWindow:
         Initialize a new window for deleting a student.
         Args:
             master (tk.Tk): The parent Tkinter window.
-            db_connection: A live database connection.
+            db_connection: A live database connection or connection pool.
         """
         # Create a new top-level window (child window of the main root window)
         self.top = tk.Toplevel(master)
@@ -23,6 +26,10 @@ class DeleteStudentWindow:
         # Store the database connection
         self.db_connection = db_connection
 
+        # Database calls run in the background while the busy indicator is shown
+        self.executor = get_db_executor(master)
+        self.busy_indicator = BusyIndicator(self.top)
+
         # Form fields for entering student datails
         self.initialize_form_fields()
 
@@ -32,12 +39,13 @@ class DeleteStudentWindow:
         """
 
         # Student ID input
-        tk.Label(self.top, text="Enter Student ID: ").pack(pady=5)
+        tk.Label(self.top, text="Enter Student ID (e.g. 7, 3,5,8 or 10-20): ").pack(pady=5)
         self.id_entry = tk.Entry(self.top)
         self.id_entry.pack(pady=5)
 
         # Submit button
-        tk.Button(self.top, text='Delete', command=self.delete_student).pack(pady=10)
+        self.delete_button = tk.Button(self.top, text='Delete', command=self.delete_student)
+        self.delete_button.pack(pady=10)
 
     def delete_student(self):
         """
@@ -46,22 +54,91 @@ class DeleteStudentWindow:
         # Trim whitespace for robustness
         student_id = self.id_entry.get().strip()
 
+        # A comma-separated list or a range deletes several students in one statement
+        if ',' in student_id or '-' in student_id:
+            self.delete_students(student_id)
+            return
+
         # Validate ID input
         if not student_id.isdigit():
             messagebox.showerror('Invalid Input', 'Student ID must be a positive number.')
             return
 
-        # Attempt to delete the student using the DeleteStudent class
-        try:
-            delete_student_instance = DeleteStudent(self.db_connection)
-            success = delete_student_instance.delete_student(int(student_id))
-            if success:
-                messagebox.showinfo('Success',
-                                    f'Student with ID: {student_id} has been deleted.')
-            else:
-                messagebox.showerror('Error', f'Student with ID: {student_id} does not exist.')
-        except Exception as e:
-            messagebox.showerror('Error', f'An error occurred: {e}')
-
-        finally:
-            self.top.destroy()
+        # Attempt to delete the student using the DeleteStudent class in the background
+        self.delete_button.config(state='disabled')
+        delete_student_instance = DeleteStudent(self.db_connection, cache=get_student_cache())
+        self.executor.submit(delete_student_instance.delete_student, int(student_id),
+                             on_success=lambda success: self.on_delete_finished(student_id, success),
+                             on_error=self.on_delete_error,
+                             busy=self.busy_indicator)
+
+    def delete_students(self, id_text):
+        """
+        Handle the deletion of a list (``3,5,8``) or an inclusive range (``10-20``) of students.
+        Args:
+            id_text (str): The IDs entered by the user.
+        """
+        delete_student_instance = DeleteStudent(self.db_connection, cache=get_student_cache())
+
+        if ',' in id_text:
+            ids = [part.strip() for part in id_text.split(',') if part.strip()]
+            if not ids or not all(part.isdigit() for part in ids):
+                messagebox.showerror('Invalid Input', 'Student IDs must be positive numbers separated by commas.')
+                return
+            delete_call = delete_student_instance.delete_students
+            args = ([int(part) for part in ids],)
+        else:
+            first_id, _, last_id = (part.strip() for part in id_text.partition('-'))
+            if not first_id.isdigit() or not last_id.isdigit() or int(first_id) > int(last_id):
+                messagebox.showerror('Invalid Input', 'Please enter a range such as 10-20.')
+                return
+            delete_call = delete_student_instance.delete_student_range
+            args = (int(first_id), int(last_id))
+
+        self.delete_button.config(state='disabled')
+        self.executor.submit(delete_call, *args,
+                             on_success=self.on_batch_delete_finished,
+                             on_error=self.on_delete_error,
+                             busy=self.busy_indicator)
+
+    def on_batch_delete_finished(self, result):
+        """
+        Report the outcome of a list or range deletion, closing the window if students were deleted.
+        Args:
+            result: (deleted_ids, missing_ids) for a list, or the deleted IDs for a range.
+        """
+        deleted_ids, missing_ids = result if isinstance(result, tuple) else (result, [])
+        if not deleted_ids:
+            messagebox.showerror('Error', 'None of the students exist.')
+            self.delete_button.config(state='normal')
+            return
+
+        message = f'{len(deleted_ids)} student(s) have been deleted.'
+        if missing_ids:
+            message += f' IDs not found: {", ".join(map(str, missing_ids))}.'
+        messagebox.showinfo('Success', message)
+        self.top.destroy()
+
+    def on_delete_finished(self, student_id, success):
+        """
+        Report the outcome of the deletion, closing the window if the student was deleted.
+        Args:
+            student_id (str): ID of the student that was deleted.
+            success (bool): True if the student existed and was deleted.
+        """
+        if not success:
+            messagebox.showerror('Error', f'Student with ID: {student_id} does not exist.')
+            self.delete_button.config(state='normal')
+            return
+
+        messagebox.showinfo('Success', f'Student with ID: {student_id} has been deleted.')
+        self.top.destroy()
+
+    def on_delete_error(self, error):
+        """
+        Report an error from the deletion and re-enable the form.
+        Args:
+            error (Exception): The exception raised while deleting the student.
+        """
+        show_error(error)
+        self.delete_button.config(state='normal')
@@ -0,0 +1,18 @@
+from tkinter import messagebox
+
+from crud_operations.exceptions import StudentServiceError
+
+
+def show_error(error):
+    """
+    Show an error raised by a background database call.
+
+    Errors raised by the ``crud_operations`` classes carry their own title and
+    user-facing message; anything else is reported as an unexpected error.
+    Args:
+        error (Exception): The exception raised by the call.
+    """
+    if isinstance(error, StudentServiceError):
+        messagebox.showerror(error.title, str(error))
+    else:
+        messagebox.showerror('Error', f'An error occurred: {error}')
@@ -0,0 +1,194 @@
+import cProfile
+import functools
+import importlib
+import json
+import threading
+import time
+
+from crud_operations.instrumentation import query_stats
+from gui.db_executor import DatabaseExecutor
+
+# Window methods timed by default: window construction and every Treeview update
+PROFILED_METHODS = {
+    'gui.create_student_window.CreateStudentWindow': ('__init__',),
+    'gui.delete_student_window.DeleteStudentWindow': ('__init__',),
+    'gui.update_student_window.UpdateStudentWindow': ('__init__', 'create_form_fields'),
+    'gui.update_student_attribute_window.UpdateStudentAttributeWindow': ('__init__', 'show_attributes_menu'),
+    'gui.statistics_window.StatisticsWindow': ('__init__', 'show_statistics'),
+    'gui.read_student_window.ReadStudentWindow': (
+        '__init__', 'load_data', 'on_page_loaded', 'on_rows_reloaded', 'on_changed_rows_loaded',
+        'apply_changes', 'on_students_deleted'),
+}
+
+# Most stalls kept in the report, longest first
+MAX_REPORTED_STALLS = 50
+
+
+def summarize_durations(durations):
+    """
+    Summarise the durations of one timed call.
+    Args:
+        durations (list): Seconds taken by each call.
+    Returns:
+        dict: Call count and total, mean, p95 and max time in milliseconds.
+    """
+    ordered = sorted(durations)
+    count = len(ordered)
+    if not count:
+        return {'calls': 0, 'total_ms': 0.0, 'mean_ms': 0.0, 'p95_ms': 0.0, 'max_ms': 0.0}
+    total = sum(ordered)
+    return {
+        'calls': count,
+        'total_ms': round(total * 1000, 3),
+        'mean_ms': round(total * 1000 / count, 3),
+        'p95_ms': round(ordered[min(count - 1, max(0, round(0.95 * count) - 1))] * 1000, 3),
+        'max_ms': round(ordered[-1] * 1000, 3),
+    }
+
+
+class GuiProfiler:
+    """
+    Opt-in profiler separating Tk rendering time from database time.
+
+    While installed it times:
+        - window construction and Treeview population methods, on the Tk thread;
+        - every call handed to ``DatabaseExecutor``, on its worker thread (database time),
+          and its ``on_success``/``on_error`` callback on the Tk thread (rendering time);
+        - event loop stalls, detected as lateness of a periodic ``after()`` heartbeat.
+    The report also includes the per-statement timings collected by ``query_stats``.
+    """
+
+    def __init__(self, root, heartbeat_ms=50, stall_threshold_ms=100, cprofile_path=None):
+        """
+        Initialize the profiler; nothing is measured until ``install`` is called.
+        Args:
+            root (tk.Tk): The root window whose event loop is watched.
+            heartbeat_ms (int): Interval of the heartbeat used to detect stalls.
+            stall_threshold_ms (int): Lateness of the heartbeat counted as a stall.
+            cprofile_path (str): If set, the Tk thread is also run under cProfile and the
+                statistics are dumped to this file by ``write_report``.
+        """
+        self.root = root
+        self.heartbeat_ms = heartbeat_ms
+        self.stall_threshold_ms = stall_threshold_ms
+        self.cprofile_path = cprofile_path
+        self._profile = cProfile.Profile() if cprofile_path else None
+        self._tk_calls = {}  # label -> list of durations on the Tk thread
+        self._background_calls = {}  # label -> list of durations on worker threads
+        self._stalls = []  # (lateness in seconds, time since install) of each stall
+        self._lock = threading.Lock()
+        self._patches = []  # (owner, attribute, original) restored by uninstall
+        self._heartbeat_job = None
+        self._last_beat = None
+        self._started = None
+
+    def install(self):
+        """Start measuring; call before the windows to be profiled are created."""
+        self._started = time.perf_counter()
+        for path, methods in PROFILED_METHODS.items():
+            module_name, class_name = path.rsplit('.', 1)
+            window_class = getattr(importlib.import_module(module_name), class_name)
+            for method in methods:
+                self._patch(window_class, method, self._timed(getattr(window_class, method),
+                                                              f'{class_name}.{method}', self._tk_calls))
+
+        self._patch(DatabaseExecutor, 'submit', self._profiled_submit(DatabaseExecutor.submit))
+
+        self._last_beat = time.perf_counter()
+        self._heartbeat_job = self.root.after(self.heartbeat_ms, self._heartbeat)
+        if self._profile:
+            self._profile.enable()
+
+    def uninstall(self):
+        """Stop measuring and restore the original methods."""
+        if self._profile:
+            self._profile.disable()
+        if self._heartbeat_job is not None:
+            try:
+                self.root.after_cancel(self._heartbeat_job)
+            except Exception:
+                pass  # The root window is already destroyed
+            self._heartbeat_job = None
+        for owner, attribute, original in reversed(self._patches):
+            setattr(owner, attribute, original)
+        self._patches = []
+
+    def report(self):
+        """
+        Build the profiling report.
+        Returns:
+            dict: Tk thread and background timings per label, event loop stalls and
+            per-statement database timings.
+        """
+        with self._lock:
+            tk_calls = {label: summarize_durations(d) for label, d in sorted(self._tk_calls.items())}
+            background_calls = {label: summarize_durations(d)
+                                for label, d in sorted(self._background_calls.items())}
+            stalls = sorted(self._stalls, reverse=True)
+
+        return {
+            'session_seconds': round(time.perf_counter() - self._started, 3) if self._started else 0.0,
+            'tk_thread': tk_calls,
+            'database_workers': background_calls,
+            'event_loop_stalls': {
+                'threshold_ms': self.stall_threshold_ms,
+                'count': len(stalls),
+                'total_ms': round(sum(lateness for lateness, _ in stalls) * 1000, 3),
+                'longest': [{'lateness_ms': round(lateness * 1000, 3), 'at_seconds': round(at, 3)}
+                            for lateness, at in stalls[:MAX_REPORTED_STALLS]],
+            },
+            'queries': query_stats.snapshot(),
+        }
+
+    def write_report(self, path):
+        """
+        Write the report as JSON, and the cProfile statistics if enabled.
+        Args:
+            path (str): File receiving the JSON report.
+        """
+        with open(path, 'w', encoding='utf-8') as report_file:
+            json.dump(self.report(), report_file, indent=2)
+        if self._profile:
+            self._profile.dump_stats(self.cprofile_path)
+
+    def _patch(self, owner, attribute, replacement):
+        """Replace an attribute, remembering the original for ``uninstall``."""
+        self._patches.append((owner, attribute, owner.__dict__[attribute]))
+        setattr(owner, attribute, replacement)
+
+    def _timed(self, func, label, timings):
+        """Wrap ``func`` so the duration of every call is added to ``timings[label]``."""
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            started = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                duration = time.perf_counter() - started
+                with self._lock:
+                    timings.setdefault(label, []).append(duration)
+        return wrapper
+
+    def _profiled_submit(self, submit):
+        """Wrap ``DatabaseExecutor.submit`` to time the call and its callbacks separately."""
+        profiler = self
+
+        @functools.wraps(submit)
+        def profiled_submit(executor, func, *args, on_success=None, on_error=None, busy=None):
+            label = getattr(func, '__qualname__', type(func).__name__)
+            return submit(
+                executor, profiler._timed(func, label, profiler._background_calls), *args,
+                on_success=on_success and profiler._timed(on_success, f'{label} -> on_success', profiler._tk_calls),
+                on_error=on_error and profiler._timed(on_error, f'{label} -> on_error', profiler._tk_calls),
+                busy=busy)
+        return profiled_submit
+
+    def _heartbeat(self):
+        """Record how late the heartbeat fired; lateness means the event loop was blocked."""
+        now = time.perf_counter()
+        lateness = now - self._last_beat - self.heartbeat_ms / 1000
+        if lateness * 1000 >= self.stall_threshold_ms:
+            with self._lock:
+                self._stalls.append((lateness, now - self._started))
+        self._last_beat = now
+        self._heartbeat_job = self.root.after(self.heartbeat_ms, self._heartbeat)
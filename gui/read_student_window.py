@@ -1,7 +1,42 @@
+import bisect
+import logging
 import tkinter as tk
-from tkinter import messagebox, ttk, Frame
+from tkinter import filedialog, messagebox, ttk, Frame
 
+from crud_operations.change_listener import RELOAD, StudentChangeListener
+from crud_operations.delete_student import DeleteStudent
+from crud_operations.export_student_data import StudentDataExporter
 from crud_operations.read_student_data import StudentDataReader
+from crud_operations.search_students import StudentSearch
+from crud_operations.student_cache import get_student_cache
+from gui.db_executor import BusyIndicator, get_db_executor
+from gui.dialogs import show_error
+
+
+def diff_rows(displayed, rows):
+    """
+    Compute the changes that turn the displayed rows into a freshly fetched set of rows.
+    Args:
+        displayed (dict): Maps the ID of every displayed student to its row values.
+        rows (list): Fetched student rows ordered by ID.
+    Returns:
+        tuple: (removed_ids, changed_rows, added_rows), where added_rows holds
+        ``(index, row)`` pairs giving each new row's position in ``rows``.
+    """
+    fetched_ids = set()
+    changed_rows = []
+    added_rows = []
+    for index, row in enumerate(rows):
+        row = tuple(row)
+        fetched_ids.add(row[0])
+        current = displayed.get(row[0])
+        if current is None:
+            added_rows.append((index, row))
+        elif current != row:
+            changed_rows.append(row)
+
+    removed_ids = [student_id for student_id in displayed if student_id not in fetched_ids]
+    return removed_ids, changed_rows, added_rows
 
 
 class ReadStudentWindow:
@@ -9,17 +44,33 @@ class ReadStudentWindow:
     This class creates a GUI window to display student records fetched from the database.
     """
 
-    def __init__(self, master, db_connection):
+    # Milliseconds to wait after the last keystroke before searching
+    SEARCH_DELAY = 300
+
+    # Milliseconds between checks of the change feed
+    CHANGE_POLL_INTERVAL = 500
+
+    # Above this many changes at once the loaded rows are reloaded instead of patched
+    MAX_INCREMENTAL_CHANGES = 500
+
+    # Pages kept in the Treeview; rows further out of view are evicted and fetched again when scrolled back to
+    MAX_LOADED_PAGES = 5
+
+    def __init__(self, master, db_connection, page_size=200):
         """
         Initialize a new GUI window for reading student data.
         Args:
             master (tk.Tk): The parent Tkinter window that serves as the root of the application.
-            db_connection: A live database connection used to fetch student data.
+            db_connection: A live database connection or connection pool used to fetch student data.
+            page_size (int): Number of rows fetched from the database per page.
         """
         # Create a new top-level window (a child window of the main root window)
         self.top = tk.Toplevel(master)
         self.top.title('Student Records')
-        self.top.geometry('1000x400')
+        self.top.geometry('1000x450')
+
+        # Search bar: every filter is optional and applied as the user types
+        self.create_search_bar()
 
         # Frame to contain the Treeview and its scrollbars
         tree_frame = Frame(self.top)
@@ -34,12 +85,31 @@ class ReadStudentWindow:
         self.tree_scroll_x.pack(side='bottom', fill='x')
 
         self.db_connection = db_connection
+        self.reader = StudentDataReader(self.db_connection, cache=get_student_cache())
+        self.student_search = StudentSearch(self.db_connection)
+        self._search_filters = None  # Active search filters, or None to page through the whole table
+        self._search_job = None  # ID of the pending debounced search, if any
+
+        # Database calls run in the background while the busy indicator is shown
+        self.executor = get_db_executor(master)
+        self.busy_indicator = BusyIndicator(self.top)
+
+        # Keyset pagination state: rows are fetched page by page as the user scrolls
+        self.page_size = page_size
+        self.last_seen_id = 0  # ID of the last row loaded into the Treeview
+        self.has_more = True  # False once the last page has been fetched
+        self.has_previous = False  # True once rows before the first displayed one have been evicted
+        self._loading = False  # Guards against overlapping page fetches
+        self._generation = 0  # Incremented on refresh so late pages of an old load are dropped
+        self._items = {}  # Maps the ID of every displayed student to its (iid, row values)
+        self._ids = []  # IDs of the displayed students in ascending order, as they appear in the Treeview
 
         # Create a Treeview widget to display data in a table format
         self.tree = ttk.Treeview(tree_frame,
                                  columns=('id', 'name', 'address', 'age', 'number'),
                                  show='headings',
-                                 yscrollcommand=self.tree_scroll_y.set,
+                                 selectmode='extended',  # Allow selecting several rows for deletion
+                                 yscrollcommand=self.on_tree_scroll,
                                  xscrollcommand=self.tree_scroll_x.set)
         # Configure Treeview column headings
         self.tree.heading('id', text='ID')
@@ -61,31 +131,514 @@ class ReadStudentWindow:
         self.tree_scroll_y.config(command=self.tree.yview)
         self.tree_scroll_x.config(command=self.tree.xview)
 
+        button_frame = Frame(self.top)
+        button_frame.pack(pady=10)
+
         # Add a button to refresh the data displayed in the Treeview
-        tk.Button(self.top, text='Refresh Data', command=self.load_data).pack(pady=10)
+        tk.Button(button_frame, text='Refresh Data', command=self.refresh_data).pack(side='left', padx=5)
+
+        # Add a button to export the whole table to a file
+        tk.Button(button_frame, text='Export Data', command=self.export_data).pack(side='left', padx=5)
+
+        # Add a button to delete every selected row in one statement
+        tk.Button(button_frame, text='Delete Selected', command=self.delete_selected).pack(side='left', padx=5)
 
         # Initially load the data when the window is created
         self.load_data()
 
+        # Keep the view live by applying changes published by the database trigger
+        self.change_listener = None
+        self._change_poll_job = None
+        self.top.protocol('WM_DELETE_WINDOW', self.close)
+        self.start_change_listener()
+
+    def create_search_bar(self):
+        """Create the search inputs; typing in any of them schedules a debounced search."""
+        search_frame = Frame(self.top)
+        search_frame.pack(fill='x', padx=10, pady=(10, 0))
+
+        self.search_entries = {}
+        for key, label, width in (('name', 'Name starts with:', 15),
+                                  ('address', 'Address contains:', 15),
+                                  ('min_age', 'Age from:', 5),
+                                  ('max_age', 'to:', 5),
+                                  ('number', 'Number:', 12)):
+            tk.Label(search_frame, text=label).pack(side='left', padx=(5, 2))
+            entry = tk.Entry(search_frame, width=width)
+            entry.pack(side='left')
+            entry.bind('<KeyRelease>', self.schedule_search)
+            self.search_entries[key] = entry
+
+    def schedule_search(self, event=None):
+        """Restart the debounce timer so only the last keystroke triggers a query."""
+        if self._search_job is not None:
+            self.top.after_cancel(self._search_job)
+        self._search_job = self.top.after(self.SEARCH_DELAY, self.apply_search)
+
+    def apply_search(self):
+        """Read the search inputs and reload the Treeview with the matching students."""
+        self._search_job = None
+        values = {key: entry.get().strip() for key, entry in self.search_entries.items()}
+
+        filters = {}
+        if values['name']:
+            filters['name_prefix'] = values['name']
+        if values['address']:
+            filters['address_contains'] = values['address']
+        # Ages that are not (yet) whole numbers are ignored rather than reported while typing
+        if values['min_age'].isdigit():
+            filters['min_age'] = int(values['min_age'])
+        if values['max_age'].isdigit():
+            filters['max_age'] = int(values['max_age'])
+        if values['number']:
+            filters['number'] = values['number']
+
+        new_filters = filters or None
+        if new_filters != self._search_filters:
+            self._search_filters = new_filters
+            self.load_data()  # A different result set starts again from the first page
+
+    def fetch_page(self, after_id, limit, before_id=None):
+        """
+        Fetch a page of the whole table, or of the search results while a search is active.
+        Args:
+            after_id (int): ID of the last row of the previous page.
+            limit (int): Maximum number of rows to return.
+            before_id (int): Fetch the page just before this ID instead, when scrolling back up.
+        Returns:
+            list: Student rows ordered by ID.
+        """
+        if self._search_filters:
+            return self.student_search.search(after_id=after_id, limit=limit, before_id=before_id,
+                                              **self._search_filters)
+        if before_id is not None:
+            return self.reader.fetch_page_before(before_id, limit)
+        return self.reader.fetch_page(after_id, limit)
+
+    def refresh_data(self):
+        """Re-read the loaded rows from the database, bypassing cached pages."""
+        self.reader.cache.invalidate_queries()
+        self.reload_loaded_rows()
+
+    def reload_loaded_rows(self):
+        """
+        Fetch again as many rows as are currently displayed and apply only the differences.
+
+        Unchanged rows cost no Tk calls, so refreshing a large unchanged view is near-instant.
+        """
+        if not self._items:
+            self.load_data()
+            return
+
+        self._generation += 1
+        self._loading = True
+        generation = self._generation
+        limit = max(len(self._items), self.page_size)
+        # Rows evicted above the view stay evicted
+        after_id = self._ids[0] - 1 if self.has_previous else 0
+
+        self.executor.submit(self.fetch_page, after_id, limit,
+                             on_success=lambda records: self.on_rows_reloaded(generation, limit, records),
+                             on_error=lambda error: self.on_page_error(generation, error),
+                             busy=self.busy_indicator)
+
+    def on_rows_reloaded(self, generation, limit, records):
+        """
+        Patch the Treeview so it shows the re-fetched rows.
+        Args:
+            generation (int): Load generation the rows were requested for.
+            limit (int): Number of rows that was requested.
+            records (list): Fetched student rows ordered by ID.
+        """
+        if generation != self._generation:
+            return
+
+        self._loading = False
+        displayed = {student_id: values for student_id, (_, values) in self._items.items()}
+        removed_ids, changed_rows, added_rows = diff_rows(displayed, records)
+
+        # Delete every removed row with a single Tk call
+        if removed_ids:
+            self.tree.delete(*(self._items.pop(student_id)[0] for student_id in removed_ids))
+            self.forget_ids(removed_ids)
+
+        for row in changed_rows:
+            iid = self._items[row[0]][0]
+            self.tree.item(iid, values=row)
+            self._items[row[0]] = (iid, row)
+
+        # Added rows are inserted in ID order, so each index is already correct when it is used
+        for index, row in added_rows:
+            self.insert_row(row, index)
+
+        self.last_seen_id = records[-1][0] if records else 0
+        self.has_more = len(records) == limit
+
+    def insert_row(self, row, index='end'):
+        """
+        Insert a student row into the Treeview and remember its item ID.
+        Args:
+            row (tuple): The student row.
+            index: Position in the Treeview ('end' to append).
+        """
+        row = tuple(row)
+        iid = self.tree.insert('', index, iid=str(row[0]), values=row)
+        self._items[row[0]] = (iid, row)
+        bisect.insort(self._ids, row[0])
+
+    def delete_rows(self, student_ids):
+        """
+        Remove the displayed rows of the given students with a single Tk call.
+        Args:
+            student_ids (iterable): IDs of the students to remove; unknown IDs are ignored.
+        """
+        removed_ids = [student_id for student_id in student_ids if student_id in self._items]
+        if removed_ids:
+            self.tree.delete(*(self._items.pop(student_id)[0] for student_id in removed_ids))
+            self.forget_ids(removed_ids)
+
+    def forget_ids(self, student_ids):
+        """
+        Remove the IDs of deleted rows from the sorted list of displayed IDs.
+        Args:
+            student_ids (list): IDs of the removed students.
+        """
+        if len(student_ids) == 1:
+            del self._ids[bisect.bisect_left(self._ids, student_ids[0])]
+        else:
+            removed = set(student_ids)
+            self._ids = [student_id for student_id in self._ids if student_id not in removed]
+
     def load_data(self):
-        """Fetch and display student data in the Treeview."""
-        # Clear any existing data in the Treeview
-        for row in self.tree.get_children():
-            self.tree.delete(row)
+        """Reset the Treeview and display the first page of student data."""
+        # Clear any existing data in the Treeview with a single Tk call
+        self.tree.delete(*self.tree.get_children())
+        self._items.clear()
+        self._ids.clear()
 
-        # Try to fetch records from the database using the StudentDataReader class
-        try:
-            read_student_instance = StudentDataReader(self.db_connection)
-            records = read_student_instance.fetch_records()
+        # Restart pagination from the beginning of the table
+        self.last_seen_id = 0
+        self.has_more = True
+        self.has_previous = False
+        self._loading = False
+        self._generation += 1
+
+        self.load_next_page()
+
+    def load_next_page(self):
+        """Fetch the next page of student data in the background."""
+        if self._loading or not self.has_more:
+            return
+
+        self._loading = True
+        generation = self._generation
+        after_id = self.last_seen_id
+
+        # Fetch records from the database using the StudentDataReader or StudentSearch class
+        self.executor.submit(self.fetch_page, after_id, self.page_size,
+                             on_success=lambda records: self.on_page_loaded(generation, after_id, records),
+                             on_error=lambda error: self.on_page_error(generation, error),
+                             busy=self.busy_indicator)
+
+    def on_page_loaded(self, generation, after_id, records):
+        """
+        Append a fetched page of student data to the Treeview.
+        Args:
+            generation (int): Load generation the page was requested for.
+            after_id (int): ID the page was fetched after (0 for the first page).
+            records (list): Student rows of the page.
+        """
+        if generation != self._generation:
+            return  # The data was refreshed while this page was loading
+
+        self._loading = False
+
+        top_id = self.top_visible_id()
+
+        # Insert each record into the Treeview, using the student ID as the item ID
+        for record in records:
+            self.insert_row(record)
+
+        if records:
+            self.last_seen_id = records[-1][0]
+        self.has_more = len(records) == self.page_size
 
-            # Check if no records were fetched and show a message
-            if not records:
-                messagebox.showinfo('No Data', 'No records found')
+        # Keep the Treeview small by evicting the rows far above the view
+        excess = len(self._ids) - self.page_size * self.MAX_LOADED_PAGES
+        if excess > 0:
+            self.delete_rows(self._ids[:excess])
+            self.has_previous = True
+            self.scroll_to_id(top_id)
 
-            # Insert each record into the Treeview
-            for record in records:
-                self.tree.insert("", "end", values=record)
+        # Check if no records were fetched and show a message (an empty search is not an error)
+        if after_id == 0 and not records and not self._search_filters:
+            messagebox.showinfo('No Data', 'No records found')
 
+    def load_previous_page(self):
+        """Fetch the page before the first displayed row in the background, after it was evicted."""
+        if self._loading or not self.has_previous or not self._ids:
+            return
+
+        self._loading = True
+        generation = self._generation
+        before_id = self._ids[0]
+
+        self.executor.submit(self.fetch_page, 0, self.page_size, before_id,
+                             on_success=lambda records: self.on_previous_page_loaded(generation, records),
+                             on_error=lambda error: self.on_page_error(generation, error),
+                             busy=self.busy_indicator)
+
+    def on_previous_page_loaded(self, generation, records):
+        """
+        Insert a page fetched while scrolling back up above the displayed rows.
+        Args:
+            generation (int): Load generation the page was requested for.
+            records (list): Student rows of the page, ordered by ID.
+        """
+        if generation != self._generation:
+            return
+
+        self._loading = False
+        top_id = self.top_visible_id()
+
+        for index, record in enumerate(records):
+            self.insert_row(record, index)
+        self.has_previous = len(records) == self.page_size
+
+        # Evict the rows far below the view; they are fetched again as the next page
+        excess = len(self._ids) - self.page_size * self.MAX_LOADED_PAGES
+        if excess > 0:
+            self.delete_rows(self._ids[-excess:])
+            self.last_seen_id = self._ids[-1]
+            self.has_more = True
+        self.scroll_to_id(top_id)
+
+    def top_visible_id(self):
+        """Return the ID of the row at the top of the visible area, or None if no row is displayed."""
+        if not self._ids:
+            return None
+        index = int(float(self.tree.yview()[0]) * len(self._ids))
+        return self._ids[min(index, len(self._ids) - 1)]
+
+    def scroll_to_id(self, student_id):
+        """
+        Scroll so the given row is at the top again after rows were inserted or evicted above it.
+        Args:
+            student_id (int): ID of the row, or None to leave the view alone.
+        """
+        if student_id in self._items:
+            self.tree.yview_moveto(bisect.bisect_left(self._ids, student_id) / len(self._ids))
+
+    def on_page_error(self, generation, error):
+        """
+        Show an error message if an exception occurs while fetching the records.
+        Args:
+            generation (int): Load generation the page was requested for.
+            error (Exception): The exception raised while fetching the page.
+        """
+        if generation != self._generation:
+            return
+
+        self._loading = False
+        self.has_more = False
+        show_error(error)
+
+    def on_tree_scroll(self, first, last):
+        """
+        Update the vertical scrollbar and fetch more rows when the view nears the bottom or,
+        after rows were evicted, the top.
+        Args:
+            first (str): Fraction of the list at the top of the visible area.
+            last (str): Fraction of the list at the bottom of the visible area.
+        """
+        self.tree_scroll_y.set(first, last)
+
+        # Prefetch the next page once the user has scrolled through most of the loaded rows
+        if float(last) >= 0.9 and self.has_more and not self._loading:
+            self.top.after_idle(self.load_next_page)
+        elif float(first) <= 0.1 and self.has_previous and not self._loading:
+            self.top.after_idle(self.load_previous_page)
+
+    def export_data(self):
+        """Stream the whole student table to a CSV, JSON Lines, Parquet or Arrow file chosen by the user."""
+        path = filedialog.asksaveasfilename(
+            parent=self.top,
+            title='Export Student Records',
+            defaultextension='.csv',
+            filetypes=[('CSV', '*.csv'), ('JSON Lines', '*.jsonl'),
+                       ('Gzip-compressed', '*.gz'), ('Parquet', '*.parquet'), ('Arrow', '*.arrow')])
+        if not path:
+            return  # The user cancelled the dialog
+
+        exporter = StudentDataExporter(self.db_connection)
+        if path.endswith(('.parquet', '.arrow')):
+            # Columnar formats compress each column themselves
+            export = exporter.export_parquet if path.endswith('.parquet') else exporter.export_arrow
+            args = (path,)
+        else:
+            # A trailing .gz selects compression, the extension before it selects the format
+            compress = path.endswith('.gz')
+            base_path = path[:-3] if compress else path
+            export = exporter.export_jsonl if base_path.endswith('.jsonl') else exporter.export_csv
+            args = (path, compress)
+
+        # Export in the background; large tables can take a while to write
+        self.executor.submit(
+            export, *args,
+            on_success=lambda exported: messagebox.showinfo('Export Complete',
+                                                            f'Exported {exported} records to {path}.'),
+            on_error=show_error,
+            busy=self.busy_indicator)
+
+    def delete_selected(self):
+        """Delete every student selected in the Treeview with a single batch statement."""
+        selected = self.tree.selection()
+        if not selected:
+            messagebox.showinfo('No Selection', 'Select one or more students to delete.')
+            return
+
+        if not messagebox.askyesno('Confirm Deletion',
+                                   f'Delete {len(selected)} selected student(s)?', parent=self.top):
+            return
+
+        student_ids = [int(iid) for iid in selected]
+        delete_student_instance = DeleteStudent(self.db_connection, cache=get_student_cache())
+        self.executor.submit(delete_student_instance.delete_students, student_ids,
+                             on_success=self.on_students_deleted,
+                             on_error=show_error,
+                             busy=self.busy_indicator)
+
+    def on_students_deleted(self, result):
+        """
+        Remove deleted students from the Treeview and report IDs that no longer existed.
+        Args:
+            result (tuple): (deleted_ids, missing_ids) returned by DeleteStudent.delete_students.
+        """
+        deleted_ids, missing_ids = result
+
+        # Rows that were already gone from the database are stale in the view as well
+        self.delete_rows(deleted_ids + missing_ids)
+
+        message = f'Deleted {len(deleted_ids)} student(s).'
+        if missing_ids:
+            message += f' IDs not found: {", ".join(map(str, missing_ids))}.'
+        messagebox.showinfo('Students Deleted', message)
+
+    def start_change_listener(self):
+        """Open a dedicated listening connection in the background, if the pool can provide one."""
+        open_connection = getattr(self.db_connection, 'open_dedicated_connection', None)
+        if open_connection is None:
+            return  # A single shared connection cannot be dedicated to LISTEN
+
+        def connect():
+            listener = StudentChangeListener(open_connection(), self.reader.table_name)
+            listener.start()
+            return listener
+
+        self.executor.submit(connect,
+                             on_success=self.on_listener_started,
+                             on_error=lambda error: logging.error(f'Could not start the change listener: {error}'))
+
+    def on_listener_started(self, listener):
+        """
+        Start polling the change feed once the listener is connected.
+        Args:
+            listener (StudentChangeListener): The started listener.
+        """
+        if not self.top.winfo_exists():
+            listener.close()  # The window was closed while connecting
+            return
+
+        self.change_listener = listener
+        self.poll_changes()
+
+    def poll_changes(self):
+        """Apply any changes received since the last poll and schedule the next one."""
+        self._change_poll_job = None
+        try:
+            changes = self.change_listener.poll()
         except Exception as e:
-            # Show an error message if an exception occurs while fetching or displaying the records
-            messagebox.showerror('Error', f'An error occurred: {e}')
+            logging.error(f'Change listener stopped: {e}')
+            self.change_listener.close()
+            self.change_listener = None
+            return
+
+        if changes:
+            self.apply_changes(changes)
+        self._change_poll_job = self.top.after(self.CHANGE_POLL_INTERVAL, self.poll_changes)
+
+    def apply_changes(self, changes):
+        """
+        Update only the Treeview items affected by a batch of changes.
+        Args:
+            changes (list): ``(op, student_id)`` tuples from the change feed.
+        """
+        # A bulk change is announced with a single RELOAD instead of one notification per row
+        if any(op == RELOAD for op, _ in changes):
+            if self.reader.cache:
+                self.reader.cache.clear()
+            self.reload_loaded_rows()
+            return
+
+        # Rows changed by other clients must not be served from the cache any more
+        if self.reader.cache:
+            for _, student_id in changes:
+                self.reader.cache.invalidate(student_id)
+
+        if len(changes) > self.MAX_INCREMENTAL_CHANGES:
+            self.reload_loaded_rows()  # A bulk change is cheaper to re-read than to patch row by row
+            return
+
+        # Only the last operation on each student matters
+        last_operation = {}
+        for op, student_id in changes:
+            last_operation[student_id] = op
+
+        self.delete_rows(student_id for student_id, op in last_operation.items() if op == 'DELETE')
+
+        changed_ids = [student_id for student_id, op in last_operation.items() if op != 'DELETE']
+        if changed_ids:
+            generation = self._generation
+            self.executor.submit(self.reader.fetch_by_ids, changed_ids,
+                                 on_success=lambda rows: self.on_changed_rows_loaded(generation, rows),
+                                 on_error=lambda error: logging.error(f'Could not load changed students: {error}'))
+
+    def on_changed_rows_loaded(self, generation, rows):
+        """
+        Update or insert the Treeview items of inserted and updated students.
+        Args:
+            generation (int): Load generation the rows were requested for.
+            rows (list): Current rows of the changed students.
+        """
+        if generation != self._generation:
+            return  # The view was reloaded in the meantime
+
+        for row in rows:
+            row = tuple(row)
+            if row[0] in self._items:
+                iid = self._items[row[0]][0]
+                self.tree.item(iid, values=row)
+                self._items[row[0]] = (iid, row)
+            elif (not self._search_filters and (row[0] < self.last_seen_id or not self.has_more)
+                  and not (self.has_previous and self._ids and row[0] < self._ids[0])):
+                # Rows beyond the loaded range arrive with the next or previous page instead
+                self.insert_row(row, self.insert_position(row[0]))
+                self.last_seen_id = max(self.last_seen_id, row[0])
+
+    def insert_position(self, student_id):
+        """
+        Return the Treeview index that keeps the rows ordered by ID.
+        Args:
+            student_id (int): ID of the row to insert.
+        """
+        if student_id > self.last_seen_id:
+            return 'end'
+        return bisect.bisect_left(self._ids, student_id)
+
+    def close(self):
+        """Stop following the change feed and close the window."""
+        if self._change_poll_job is not None:
+            self.top.after_cancel(self._change_poll_job)
+        if self.change_listener:
+            self.change_listener.close()
+        self.top.destroy()
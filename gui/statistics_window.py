@@ -0,0 +1,144 @@
+import tkinter as tk
+from tkinter import ttk
+
+from crud_operations.student_statistics import StudentStatistics
+from gui.db_executor import BusyIndicator, get_db_executor
+from gui.dialogs import show_error
+
+# Length in characters of the longest bar of the age histogram
+HISTOGRAM_BAR_LENGTH = 40
+
+
+def histogram_bar(count, largest):
+    """Return a text bar for one age bucket, scaled to the largest bucket."""
+    if not count:
+        return ''
+    return '█' * max(1, round(count * HISTOGRAM_BAR_LENGTH / largest))
+
+
+class StatisticsWindow:
+    """
+    A GUI window showing aggregate statistics of the student table.
+    """
+
+    def __init__(self, master, db_connection):
+        """
+        Initialize a new window with the statistics of the student table.
+        Args:
+            master (tk.Tk): The parent Tkinter window.
+            db_connection: A live database connection or connection pool.
+        """
+        # Create a new top-level window (child window of the main root window)
+        self.top = tk.Toplevel(master)
+        self.top.title('Student Statistics')
+        self.top.geometry('620x560')
+
+        # The statistics are computed by the database in the background
+        self.statistics = StudentStatistics(db_connection)
+        self.executor = get_db_executor(master)
+        self.busy_indicator = BusyIndicator(self.top)
+
+        self.create_widgets()
+        self.refresh()
+
+    def create_widgets(self):
+        """
+        Create the summary line, the tables of the age histogram, cities and duplicate
+        phone numbers, and the refresh button.
+        """
+        self.summary_label = tk.Label(self.top, text='Computing statistics...', justify='left')
+        self.summary_label.pack(pady=5, anchor='w')
+
+        notebook = ttk.Notebook(self.top)
+        notebook.pack(fill='both', expand=True, pady=5)
+
+        self.histogram_tree = self.create_table(notebook, 'Age distribution',
+                                                (('ages', 'Ages', 80), ('count', 'Students', 80),
+                                                 ('bar', '', 380)))
+        self.cities_tree = self.create_table(notebook, 'Cities',
+                                             (('city', 'City', 400), ('count', 'Students', 120)))
+        self.duplicates_tree = self.create_table(notebook, 'Duplicate numbers',
+                                                 (('number', 'Number', 400), ('count', 'Students', 120)))
+
+        self.refresh_button = tk.Button(self.top, text='Refresh', command=self.refresh)
+        self.refresh_button.pack(pady=10)
+
+    @staticmethod
+    def create_table(notebook, title, columns):
+        """
+        Add a tab holding a Treeview to the notebook.
+        Args:
+            notebook (ttk.Notebook): The notebook to add the tab to.
+            title (str): Title of the tab.
+            columns (tuple): (name, heading, width) of each column.
+        Returns:
+            ttk.Treeview: The Treeview of the tab.
+        """
+        frame = tk.Frame(notebook)
+        notebook.add(frame, text=title)
+
+        scrollbar = ttk.Scrollbar(frame, orient='vertical')
+        scrollbar.pack(side='right', fill='y')
+        tree = ttk.Treeview(frame, columns=[name for name, _, _ in columns], show='headings',
+                            yscrollcommand=scrollbar.set)
+        for name, heading, width in columns:
+            tree.heading(name, text=heading)
+            tree.column(name, width=width, anchor='w' if name in ('bar', 'city', 'number') else 'center')
+        tree.pack(fill='both', expand=True)
+        scrollbar.config(command=tree.yview)
+        return tree
+
+    def refresh(self):
+        """
+        Compute the statistics again in the background.
+        """
+        self.refresh_button.config(state='disabled')
+        self.executor.submit(self.statistics.compute,
+                             on_success=self.show_statistics,
+                             on_error=self.on_statistics_error,
+                             busy=self.busy_indicator)
+
+    def show_statistics(self, statistics):
+        """
+        Display the statistics computed by ``StudentStatistics.compute``.
+        Args:
+            statistics (dict): The computed statistics.
+        """
+        self.refresh_button.config(state='normal')
+
+        age = statistics['age']
+        duplicates = statistics['duplicate_numbers']
+        summary = f"Students: {statistics['count']}    Cities: {statistics['cities']['distinct']}"
+        if statistics['count']:
+            summary += (f"\nAge: min {age['min']}, max {age['max']}, mean {age['mean']:.2f}"
+                        f" (standard deviation {age['stddev']:.2f})")
+        summary += f"\nPhone numbers shared by several students: {duplicates['numbers']}" \
+                   f" ({duplicates['students']} students)"
+        self.summary_label.config(text=summary)
+
+        largest = max((bucket['count'] for bucket in statistics['age_histogram']), default=0)
+        self.fill_table(self.histogram_tree,
+                        [(f"{bucket['from']}-{bucket['to']}", bucket['count'],
+                          histogram_bar(bucket['count'], largest))
+                         for bucket in statistics['age_histogram']])
+        self.fill_table(self.cities_tree,
+                        [(city['city'], city['count']) for city in statistics['cities']['top']])
+        self.fill_table(self.duplicates_tree,
+                        [(number['number'], number['count']) for number in duplicates['top']])
+
+    @staticmethod
+    def fill_table(tree, rows):
+        """Replace the rows of a Treeview."""
+        tree.delete(*tree.get_children())
+        for row in rows:
+            tree.insert('', 'end', values=row)
+
+    def on_statistics_error(self, error):
+        """
+        Report an error from computing the statistics.
+        Args:
+            error (Exception): The exception raised while computing the statistics.
+        """
+        self.refresh_button.config(state='normal')
+        self.summary_label.config(text='The statistics could not be computed.')
+        show_error(error)
@@ -3,6 +3,9 @@ from tkinter import messagebox
 from typing import Optional
 
 from crud_operations.update_student_attribute import UpdateStudentAttribute
+from crud_operations.student_cache import get_student_cache
+from gui.db_executor import BusyIndicator, get_db_executor
+from gui.dialogs import show_error
 
 
 class UpdateStudentAttributeWindow:
@@ -16,7 +19,7 @@ class UpdateStudentAttributeWindow:
         Initialize the window for updating a student's attributes.
         Args:
             master (tk.Tk): Parent Tkinter window (usually the root window).
-            db_connection: Database connection object.
+            db_connection: Database connection or connection pool object.
         """
         self.master = master  # Store the reference to the parent window.
 
@@ -27,9 +30,14 @@ class UpdateStudentAttributeWindow:
         self.top.title("Update Student's Attribute")
         self.top.resizable(True, True)
 
-        self.update_student_instance = UpdateStudentAttribute(self.db_connection)
+        self.update_student_instance = UpdateStudentAttribute(self.db_connection, cache=get_student_cache())
+
+        # Database calls run in the background while the busy indicator is shown
+        self.executor = get_db_executor(self.master)
+        self.busy_indicator = BusyIndicator(self.top)
 
         self._update_form: Optional[tk.Frame] = None  # Placeholder for the update form frame.
+        self._student: Optional[tuple] = None  # Row of the student being updated.
 
         self.create_find_student_section()
 
@@ -53,8 +61,18 @@ class UpdateStudentAttributeWindow:
 
         student_id_int = int(student_id)
 
-        # Check if the student exists in the database
-        if self.update_student_instance.find_student_by_id(student_id_int):
+        # Check if the student exists in the database in the background
+        self.executor.submit(self.update_student_instance.find_student_by_id, student_id_int,
+                             on_success=lambda student: self.on_student_checked(student_id_int, student),
+                             on_error=self.on_database_error,
+                             busy=self.busy_indicator)
+
+    def on_student_checked(self, student_id_int: int, student: Optional[tuple]) -> None:
+        """Show the update options once the student's row has been fetched."""
+        student_id = str(student_id_int)
+
+        if student:
+            self._student = student  # Current values used to pre-fill the input field
             # If the update form is already open, bring it to focus.
             if self._update_form and self._update_form.winfo_exists():
                 messagebox.showinfo('Form Already Open',
@@ -108,6 +126,11 @@ class UpdateStudentAttributeWindow:
         input_entry = tk.Entry(self._update_form)  # Create an input field for the new value.
         input_entry.pack(pady=5)
 
+        # Pre-fill the input with the current value fetched when the student was found.
+        if self._student:
+            columns = ('id', 'name', 'address', 'age', 'number')
+            input_entry.insert(0, str(self._student[columns.index(field)]))
+
         # Command for submitting the update.
         update_command = lambda: self.submit_update(student_id, field, input_entry)
         tk.Button(self._update_form, text='Update', command=update_command).pack(pady=10)
@@ -128,13 +151,20 @@ class UpdateStudentAttributeWindow:
             messagebox.showerror('Invalid Phone Number', 'Please enter a valid numeric phone number.')
             return
 
-        try:
-            # Attempt to update the student record in the database.
-            self.update_student_instance.update_student_field(student_id, field, value)
-            self.top.destroy()  # Close the window after successful update.
-        except Exception as e:
-            # Show an error message if the update fails.
-            messagebox.showerror('Error', f'An error occurred: {e}')
+        # Attempt to update the student record in the database in the background.
+        self.executor.submit(self.update_student_instance.update_student_field, student_id, field, value,
+                             on_success=lambda _: self.on_field_updated(field),
+                             on_error=self.on_database_error,
+                             busy=self.busy_indicator)
+
+    def on_field_updated(self, field: str) -> None:
+        """Confirm the update and close the window."""
+        messagebox.showinfo('Success', f'{field.capitalize()} updated successfully!')
+        self.top.destroy()
+
+    def on_database_error(self, error: Exception) -> None:
+        """Show an error message if a background database call fails."""
+        show_error(error)
 
     def clear_update_form(self) -> None:
         """Clear any existing form elements from the update form."""
@@ -2,6 +2,9 @@ import tkinter as tk
 from tkinter import messagebox
 from typing import Optional
 from crud_operations.update_student import UpdateStudent
+from crud_operations.student_cache import get_student_cache
+from gui.db_executor import BusyIndicator, get_db_executor
+from gui.dialogs import show_error
 
 
 class UpdateStudentWindow:
@@ -12,7 +15,7 @@ class UpdateStudentWindow:
         Initialize a new window for updating a student.
         Args:
             master (Tkinter.Tk): The parent Tkinter window (usually the root window).
-            db_connection: Active database connection to the PostgreSQL database used to update the student.
+            db_connection: Active database connection or connection pool used to update the student.
         """
         # Create a new top-level window (a child window of the main root window)
         self.top = tk.Toplevel(master)
@@ -20,7 +23,11 @@ class UpdateStudentWindow:
 
         # Store the database connection for use in submitting student data
         self.db_connection = db_connection
-        self.update_student_instance = UpdateStudent(self.db_connection)
+        self.update_student_instance = UpdateStudent(self.db_connection, cache=get_student_cache())
+
+        # Database calls run in the background while the busy indicator is shown
+        self.executor = get_db_executor(master)
+        self.busy_indicator = BusyIndicator(self.top)
 
         self._update_form: Optional[tk.Frame] = None  # Track update form state
 
@@ -45,23 +52,37 @@ class UpdateStudentWindow:
             messagebox.showerror('Invalid ID', 'Please enter a valid numeric ID.')
             return
 
-        # Check if the student exists in the database
-        if self.update_student_instance.find_student_by_id(student_id):
+        # Check if the student exists in the database in the background
+        self.executor.submit(self.update_student_instance.find_student_by_id, student_id,
+                             on_success=lambda student: self.on_student_checked(student_id, student),
+                             on_error=self.on_database_error,
+                             busy=self.busy_indicator)
+
+    def on_student_checked(self, student_id: str, student: Optional[tuple]) -> None:
+        """
+        Open the update form once the student's existence has been confirmed.
+
+        Args:
+            student_id (str): The ID that was looked up.
+            student (tuple): The student's (id, name, address, age, number) row, or None if not found.
+        """
+        if student:
             # Ensure only one form exists
             if self._update_form and self._update_form.winfo_exists():
                 messagebox.showinfo('Form Already Open', 'The update form is already open.')
                 self._update_form.focus_set()  # Focus on the existing form
             else:
-                self.create_form_fields(student_id)
+                self.create_form_fields(student_id, student)
         else:
             messagebox.showerror('Student Not Found', f'No student found with ID: {student_id}')
 
-    def create_form_fields(self, student_id: str) -> None:
+    def create_form_fields(self, student_id: str, student: Optional[tuple] = None) -> None:
         """
-        Create form fields to update a student's details.
+        Create form fields to update a student's details, pre-filled with the current values.
 
         Args:
             student_id (str): The ID of the student to update.
+            student (tuple): The student's current (id, name, address, age, number) row.
         """
         self._update_form = tk.Frame(self.top)
         self._update_form.pack(pady=10)
@@ -88,6 +109,14 @@ class UpdateStudentWindow:
         self.number_entry = tk.Entry(self._update_form)
         self.number_entry.pack(pady=5)
 
+        # Pre-fill the form with the values fetched when the student was found
+        if student:
+            _, name, address, age, number = student
+            self.name_entry.insert(0, name)
+            self.age_entry.insert(0, str(age))
+            self.address_entry.insert(0, address)
+            self.number_entry.insert(0, number)
+
         # Submit button
         tk.Button(self._update_form, text='Update', command=lambda: self.update_student(student_id)).pack(pady=10)
 
@@ -118,12 +147,27 @@ class UpdateStudentWindow:
                                  'Please enter a valid numeric phone number.')
             return
 
-        try:
-            self.update_student_instance.update_all_student_fields(student_id,
-                                                                   name,
-                                                                   address,
-                                                                   age,
-                                                                   number)
-            self.top.destroy()  # Close the window after a successful update
-        except Exception as e:
-            messagebox.showerror('Error', f'An error occured: {e}')
+        self.executor.submit(self.update_student_instance.update_all_student_fields,
+                             student_id, name, address, age, number,
+                             on_success=self.on_student_updated,
+                             on_error=self.on_database_error,
+                             busy=self.busy_indicator)
+
+    def on_student_updated(self, student: tuple) -> None:
+        """
+        Confirm the update and close the window.
+
+        Args:
+            student (tuple): The updated student row.
+        """
+        messagebox.showinfo('Success', f'Student with ID {student[0]} updated successfully.')
+        self.top.destroy()
+
+    def on_database_error(self, error: Exception) -> None:
+        """
+        Show an error raised by a background database call.
+
+        Args:
+            error (Exception): The exception raised by the call.
+        """
+        show_error(error)
@@ -0,0 +1,158 @@
+import argparse
+import http.client
+import json
+import random
+import statistics
+import threading
+import time
+from urllib.parse import urlsplit
+
+# Share of each request type in the default mixed workload
+DEFAULT_MIX = {'list': 50, 'get': 30, 'add': 10, 'patch': 10}
+
+
+def percentile(sorted_values, fraction):
+    """Return the value below which ``fraction`` of the sorted values fall (nearest rank)."""
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, round(fraction * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+class LoadTestClient(threading.Thread):
+    """
+    One simulated client sending requests over a single kept-alive connection.
+
+    Each request type is picked at random according to the workload mix, and the
+    latency and status of every response are recorded.
+    """
+
+    def __init__(self, host, port, mix, deadline, known_ids):
+        """
+        Initialize the client.
+        Args:
+            host (str): Server host.
+            port (int): Server port.
+            mix (dict): Relative weight of each request type.
+            deadline (float): ``time.perf_counter()`` value at which the client stops.
+            known_ids (list): Student IDs that GET and PATCH requests pick from.
+        """
+        super().__init__(daemon=True)
+        self.host = host
+        self.port = port
+        self.kinds = list(mix)
+        self.weights = list(mix.values())
+        self.deadline = deadline
+        self.known_ids = known_ids
+        self.latencies = []
+        self.errors = 0
+        self.statuses = {}
+
+    def run(self):
+        connection = http.client.HTTPConnection(self.host, self.port, timeout=30)
+        try:
+            while time.perf_counter() < self.deadline:
+                method, path, body = self.next_request()
+                started = time.perf_counter()
+                try:
+                    connection.request(method, path, body=body,
+                                       headers={'Content-Type': 'application/json'} if body else {})
+                    response = connection.getresponse()
+                    response.read()
+                except (OSError, http.client.HTTPException):
+                    self.errors += 1
+                    connection.close()  # Reconnect on the next request
+                    continue
+                self.latencies.append(time.perf_counter() - started)
+                self.statuses[response.status] = self.statuses.get(response.status, 0) + 1
+        finally:
+            connection.close()
+
+    def next_request(self):
+        """Return the (method, path, body) of the next request of the workload."""
+        kind = random.choices(self.kinds, self.weights)[0]
+        student_id = random.choice(self.known_ids) if self.known_ids else 1
+
+        if kind == 'list':
+            return 'GET', f'/students?after_id={random.randint(0, student_id)}&limit=50', None
+        if kind == 'get':
+            return 'GET', f'/students/{student_id}', None
+        if kind == 'add':
+            body = {'name': f'Load Test {random.randint(0, 10 ** 6)}', 'address': 'Benchmark Street',
+                    'age': random.randint(18, 60), 'number': f'{random.randint(0, 10 ** 10 - 1):010d}'}
+            return 'POST', '/students', json.dumps(body)
+        return 'PATCH', f'/students/{student_id}', json.dumps({'field': 'age', 'value': random.randint(18, 60)})
+
+
+def fetch_known_ids(host, port, limit=1000):
+    """Return up to ``limit`` existing student IDs for the GET and PATCH requests."""
+    connection = http.client.HTTPConnection(host, port, timeout=30)
+    try:
+        connection.request('GET', f'/students?limit={limit}')
+        page = json.loads(connection.getresponse().read())
+        return [student['id'] for student in page['students']]
+    finally:
+        connection.close()
+
+
+def run_load_test(url, concurrency=16, duration=10.0, mix=None):
+    """
+    Send requests from concurrent clients for a fixed time and summarise the results.
+    Args:
+        url (str): Base URL of the server, e.g. ``http://127.0.0.1:8080``.
+        concurrency (int): Number of clients, each with its own kept-alive connection.
+        duration (float): Seconds to run for.
+        mix (dict): Relative weight of each request type ('list', 'get', 'add', 'patch').
+    Returns:
+        dict: Request and error counts, requests per second, latency percentiles in
+        milliseconds, and the count of each response status.
+    """
+    address = urlsplit(url)
+    host, port = address.hostname, address.port or 80
+    known_ids = fetch_known_ids(host, port)
+
+    deadline = time.perf_counter() + duration
+    started = time.perf_counter()
+    clients = [LoadTestClient(host, port, mix or DEFAULT_MIX, deadline, known_ids) for _ in range(concurrency)]
+    for client in clients:
+        client.start()
+    for client in clients:
+        client.join()
+    elapsed = time.perf_counter() - started
+
+    latencies = sorted(latency for client in clients for latency in client.latencies)
+    statuses = {}
+    for client in clients:
+        for status, count in client.statuses.items():
+            statuses[str(status)] = statuses.get(str(status), 0) + count
+
+    return {
+        'requests': len(latencies),
+        'errors': sum(client.errors for client in clients),
+        'seconds': round(elapsed, 3),
+        'requests_per_second': round(len(latencies) / elapsed, 1) if elapsed else 0.0,
+        'latency_ms': {
+            'mean': round(statistics.fmean(latencies) * 1000, 3) if latencies else 0.0,
+            'p50': round(percentile(latencies, 0.50) * 1000, 3),
+            'p95': round(percentile(latencies, 0.95) * 1000, 3),
+            'p99': round(percentile(latencies, 0.99) * 1000, 3),
+        },
+        'statuses': statuses,
+    }
+
+
+def main():
+    """Run a load test against a running student API server from the command line."""
+    parser = argparse.ArgumentParser(description='Measure requests/second of the student API.')
+    parser.add_argument('--url', default='http://127.0.0.1:8080')
+    parser.add_argument('--concurrency', type=int, default=16)
+    parser.add_argument('--duration', type=float, default=10.0, help='Seconds to run for')
+    parser.add_argument('--read-only', action='store_true', help='Only send list and get requests')
+    args = parser.parse_args()
+
+    mix = {'list': 60, 'get': 40} if args.read_only else DEFAULT_MIX
+    print(json.dumps(run_load_test(args.url, args.concurrency, args.duration, mix), indent=2))
+
+
+if __name__ == '__main__':
+    main()
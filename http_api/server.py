@@ -0,0 +1,418 @@
+import argparse
+import json
+import logging
+import re
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+from crud_operations.add_student import AddStudent
+from crud_operations.delete_student import DeleteStudent
+from crud_operations.exceptions import (DatabaseOperationError, StudentNotFoundError,
+                                        StudentServiceError, ValidationError)
+from crud_operations.instrumentation import query_stats
+from crud_operations.read_student_data import StudentDataReader
+from crud_operations.search_students import StudentSearch
+from crud_operations.student_statistics import AGE_BUCKET_WIDTH, TOP_ROWS, StudentStatistics
+from crud_operations.update_student import UpdateStudent
+from crud_operations.update_student_attribute import UpdateStudentAttribute
+
+# Set up logging
+logging.basicConfig(filename='app.log', level=logging.ERROR,
+                    format='%(asctime)s - %(levelname)s - %(message)s')
+
+STUDENT_FIELDS = ('id', 'name', 'address', 'age', 'number')
+
+# Largest page a client may request, and largest accepted request body in bytes
+MAX_PAGE_SIZE = 5000
+MAX_BODY_SIZE = 10 * 1024 * 1024
+
+# Rows buffered into each chunk of a streamed response
+STREAM_CHUNK_ROWS = 500
+
+# HTTP status reported for each service error
+ERROR_STATUS = {
+    ValidationError: 400,
+    StudentNotFoundError: 404,
+    DatabaseOperationError: 503,
+}
+
+
+def student_to_dict(row):
+    """Convert an (id, name, address, age, number) row to a JSON object."""
+    return dict(zip(STUDENT_FIELDS, row))
+
+
+class StudentAPIServer(HTTPServer):
+    """
+    HTTP server exposing the ``crud_operations`` classes as a JSON API.
+
+    Connections are handled by a fixed pool of worker threads instead of one thread
+    per connection, so the number of concurrent database calls never exceeds the size
+    of the connection pool. Responses use HTTP/1.1 keep-alive; a kept-alive connection
+    occupies its worker until the client closes it or stays idle for ``idle_timeout``;
+    connections accepted while every worker is busy wait in the executor's queue.
+    """
+
+    def __init__(self, server_address, db_connection, table_name='students2_1',
+                 workers=8, idle_timeout=15):
+        """
+        Bind the server and create the service objects.
+        Args:
+            server_address (tuple): (host, port) to listen on; port 0 picks a free port.
+            db_connection: Connection pool shared by all workers.
+            table_name (str): Name of the database table.
+            workers (int): Number of connections served at the same time.
+            idle_timeout (float): Seconds an idle kept-alive connection is held open.
+        """
+        super().__init__(server_address, StudentRequestHandler)
+        self.idle_timeout = idle_timeout
+        self.workers = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='student-api')
+
+        # The services are stateless apart from the pool, so every worker shares them
+        self.adder = AddStudent(db_connection, table_name)
+        self.reader = StudentDataReader(db_connection, table_name)
+        self.searcher = StudentSearch(db_connection, table_name)
+        self.updater = UpdateStudent(db_connection, table_name)
+        self.attribute_updater = UpdateStudentAttribute(db_connection, table_name)
+        self.deleter = DeleteStudent(db_connection, table_name)
+        self.statistics = StudentStatistics(db_connection, table_name)
+
+    def process_request(self, request, client_address):
+        """Hand a new connection to the worker pool."""
+        self.workers.submit(self.process_request_thread, request, client_address)
+
+    def process_request_thread(self, request, client_address):
+        """Serve one connection on a worker thread, as ``ThreadingMixIn`` does."""
+        try:
+            self.finish_request(request, client_address)
+        except Exception:
+            self.handle_error(request, client_address)
+        finally:
+            self.shutdown_request(request)
+
+    def server_close(self):
+        """Stop accepting connections and wait for the workers to finish."""
+        super().server_close()
+        self.workers.shutdown(wait=True)
+
+
+class StudentRequestHandler(BaseHTTPRequestHandler):
+    """
+    Routes the requests of one connection to the service objects of the server.
+
+    Endpoints:
+        GET    /students                 One page of students; ``after_id`` and ``limit`` page
+                                         through the table, ``name``, ``address``, ``min_age``,
+                                         ``max_age`` and ``number`` filter it.
+        GET    /students/stream          Every student as JSON Lines, sent in chunks; an error
+                                         after the first row is sent as a final ``{"error": ...}`` line.
+        GET    /students/statistics      Count, age histogram, cities and duplicate numbers;
+                                         ``age_bucket`` and ``top`` size the lists.
+        GET    /students/<id>            One student.
+        POST   /students                 Add a student.
+        PUT    /students/<id>            Replace every field of a student.
+        PATCH  /students/<id>            Update one field: ``{"field": ..., "value": ...}``.
+        DELETE /students/<id>            Delete a student.
+        POST   /students/batch-update    ``{"updates": [{"id", "field", "value"}, ...]}``
+        POST   /students/batch-delete    ``{"ids": [...]}``
+        GET    /stats                    Statement timings per operation, from ``query_stats``.
+    """
+
+    protocol_version = 'HTTP/1.1'  # Keep connections alive between requests
+    # Headers and body are written separately; with Nagle's algorithm the body would wait
+    # for the client's delayed ACK, adding ~40 ms to every kept-alive request
+    disable_nagle_algorithm = True
+    server_version = 'StudentAPI/1.0'
+
+    routes = [
+        ('GET', re.compile(r'^/students$'), 'list_students'),
+        ('GET', re.compile(r'^/students/stream$'), 'stream_students'),
+        ('GET', re.compile(r'^/students/statistics$'), 'get_statistics'),
+        ('GET', re.compile(r'^/students/(\d+)$'), 'get_student'),
+        ('POST', re.compile(r'^/students$'), 'add_student'),
+        ('POST', re.compile(r'^/students/batch-update$'), 'batch_update'),
+        ('POST', re.compile(r'^/students/batch-delete$'), 'batch_delete'),
+        ('PUT', re.compile(r'^/students/(\d+)$'), 'replace_student'),
+        ('PATCH', re.compile(r'^/students/(\d+)$'), 'update_attribute'),
+        ('DELETE', re.compile(r'^/students/(\d+)$'), 'delete_student'),
+        ('GET', re.compile(r'^/stats$'), 'get_stats'),
+    ]
+
+    def setup(self):
+        """Apply the idle timeout of kept-alive connections."""
+        self.timeout = self.server.idle_timeout
+        super().setup()
+
+    def do_GET(self):
+        self.dispatch('GET')
+
+    def do_POST(self):
+        self.dispatch('POST')
+
+    def do_PUT(self):
+        self.dispatch('PUT')
+
+    def do_PATCH(self):
+        self.dispatch('PATCH')
+
+    def do_DELETE(self):
+        self.dispatch('DELETE')
+
+    def dispatch(self, method):
+        """
+        Call the handler of the route matching the request, translating errors to status codes.
+        Args:
+            method (str): The HTTP method of the request.
+        """
+        url = urlsplit(self.path)
+        self.query = {key: values[-1] for key, values in parse_qs(url.query).items()}
+
+        try:
+            path_matched = False
+            for route_method, pattern, handler_name in self.routes:
+                match = pattern.match(url.path)
+                if not match:
+                    continue
+                path_matched = True
+                if route_method == method:
+                    getattr(self, handler_name)(*(int(group) for group in match.groups()))
+                    return
+
+            self.discard_body()
+            if path_matched:
+                self.send_json(405, {'error': f'Method {method} not allowed'})
+            else:
+                self.send_json(404, {'error': f'No route for {url.path}'})
+
+        except StudentServiceError as error:
+            status = next((code for error_type, code in ERROR_STATUS.items()
+                           if isinstance(error, error_type)), 500)
+            self.send_json(status, {'error': str(error), 'title': error.title})
+
+        except Exception as error:
+            logging.error(f'Unhandled error serving {method} {self.path}: {error}', exc_info=True)
+            self.send_json(500, {'error': 'Internal server error'})
+
+    # Endpoints
+
+    def list_students(self):
+        self.discard_body()
+        after_id = self.int_param('after_id', 0)
+        limit = min(self.int_param('limit', 200), MAX_PAGE_SIZE)
+        if limit < 1:
+            raise ValidationError('Query parameter "limit" must be a positive integer.')
+        if after_id < 0:
+            raise ValidationError('Query parameter "after_id" must not be negative.')
+        filters = {
+            'name_prefix': self.query.get('name'),
+            'address_contains': self.query.get('address'),
+            'min_age': self.int_param('min_age', None),
+            'max_age': self.int_param('max_age', None),
+            'number': self.query.get('number'),
+        }
+
+        if any(value not in (None, '') for value in filters.values()):
+            rows = self.server.searcher.search(after_id=after_id, limit=limit, **filters)
+        else:
+            rows = self.server.reader.fetch_page(after_id, limit)
+
+        # A full page means there may be more rows after the last one
+        next_after_id = rows[-1][0] if len(rows) == limit else None
+        self.send_json(200, {'students': [student_to_dict(row) for row in rows],
+                             'next_after_id': next_after_id})
+
+    def stream_students(self):
+        """Send every student as JSON Lines using chunked transfer encoding."""
+        self.discard_body()
+        rows = self.server.reader.stream_records()
+        first = next(rows, None)  # Errors before the first row can still be reported with a status
+
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/x-ndjson')
+        self.send_header('Transfer-Encoding', 'chunked')
+        self.end_headers()
+
+        batch = [] if first is None else [first]
+        try:
+            for row in rows:
+                batch.append(row)
+                if len(batch) >= STREAM_CHUNK_ROWS:
+                    self.write_chunk(batch)
+                    batch = []
+            if batch:
+                self.write_chunk(batch)
+            self.wfile.write(b'0\r\n\r\n')
+        except OSError as error:
+            # The client went away, so nothing more can be sent on this connection
+            logging.error(f'Student stream interrupted: {error}')
+            rows.close()
+            self.close_connection = True
+        except Exception as error:
+            # The status line is already sent, so the error is reported as the last line of a complete body
+            logging.error(f'Student stream interrupted: {error}', exc_info=True)
+            rows.close()
+            if isinstance(error, StudentServiceError):
+                message = {'error': str(error), 'title': error.title}
+            else:
+                message = {'error': 'Internal server error'}
+            try:
+                # The rows read before the error are still sent
+                self.write_lines([*(student_to_dict(row) for row in batch), message])
+                self.wfile.write(b'0\r\n\r\n')
+            except OSError:
+                self.close_connection = True
+
+    def get_statistics(self):
+        self.discard_body()
+        statistics = self.server.statistics.compute(self.int_param('age_bucket', AGE_BUCKET_WIDTH),
+                                                    min(self.int_param('top', TOP_ROWS), MAX_PAGE_SIZE))
+        self.send_json(200, statistics)
+
+    def get_student(self, student_id):
+        self.discard_body()
+        student = self.server.updater.find_student_by_id(student_id)
+        if student is None:
+            raise StudentNotFoundError(student_id)
+        self.send_json(200, student_to_dict(student))
+
+    def add_student(self):
+        body = self.read_json()
+        student = self.server.adder.add_student(body.get('name'), body.get('address'),
+                                                 body.get('age'), body.get('number'))
+        self.send_json(201, student_to_dict(student))
+
+    def replace_student(self, student_id):
+        body = self.read_json()
+        student = self.server.updater.update_all_student_fields(
+            student_id, body.get('name'), body.get('address'), body.get('age'), body.get('number'))
+        self.send_json(200, student_to_dict(student))
+
+    def update_attribute(self, student_id):
+        body = self.read_json()
+        student = self.server.attribute_updater.update_student_field(
+            student_id, body.get('field'), body.get('value'))
+        self.send_json(200, student_to_dict(student))
+
+    def delete_student(self, student_id):
+        self.discard_body()
+        if not self.server.deleter.delete_student(student_id):
+            raise StudentNotFoundError(student_id)
+        self.send_json(200, {'deleted': student_id})
+
+    def batch_update(self):
+        body = self.read_json()
+        try:
+            updates = [(int(update['id']), update['field'], update['value']) for update in body['updates']]
+        except (KeyError, TypeError, ValueError):
+            raise ValidationError('"updates" must be a list of {"id", "field", "value"} objects.') from None
+        self.send_json(200, self.server.attribute_updater.update_students_fields(updates))
+
+    def batch_delete(self):
+        body = self.read_json()
+        try:
+            student_ids = [int(student_id) for student_id in body['ids']]
+        except (KeyError, TypeError, ValueError):
+            raise ValidationError('"ids" must be a list of student IDs.') from None
+        deleted_ids, missing_ids = self.server.deleter.delete_students(student_ids)
+        self.send_json(200, {'deleted_ids': deleted_ids, 'missing_ids': missing_ids})
+
+    def get_stats(self):
+        self.discard_body()
+        self.send_json(200, query_stats.snapshot())
+
+    # Helpers
+
+    def int_param(self, name, default):
+        """Return an integer query parameter, raising ValidationError if it is not a number."""
+        value = self.query.get(name)
+        if value in (None, ''):
+            return default
+        try:
+            return int(value)
+        except ValueError:
+            raise ValidationError(f'Query parameter "{name}" must be an integer.') from None
+
+    def read_json(self):
+        """
+        Read and decode the JSON object in the request body.
+        Returns:
+            dict: The decoded body.
+        """
+        length = int(self.headers.get('Content-Length') or 0)
+        if length > MAX_BODY_SIZE:
+            self.close_connection = True  # The unread body would be taken for the next request
+            raise ValidationError('Request body is too large.')
+        try:
+            body = json.loads(self.rfile.read(length) or b'{}')
+        except ValueError:
+            raise ValidationError('Request body is not valid JSON.') from None
+        if not isinstance(body, dict):
+            raise ValidationError('Request body must be a JSON object.')
+        return body
+
+    def discard_body(self):
+        """Read and drop a request body, so the next request on the connection starts cleanly."""
+        length = int(self.headers.get('Content-Length') or 0)
+        if length > MAX_BODY_SIZE:
+            self.close_connection = True
+        elif length:
+            self.rfile.read(length)
+
+    def send_json(self, status, payload):
+        """Send a complete JSON response with a Content-Length, keeping the connection reusable."""
+        body = json.dumps(payload).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def write_chunk(self, rows):
+        """Write student rows as one chunk of JSON Lines."""
+        self.write_lines(student_to_dict(row) for row in rows)
+
+    def write_lines(self, objects):
+        """Write JSON objects as one chunk of JSON Lines."""
+        data = ''.join(json.dumps(obj) + '\n' for obj in objects).encode('utf-8')
+        self.wfile.write(b'%x\r\n%s\r\n' % (len(data), data))
+
+    def log_message(self, format, *args):
+        """Keep the access log out of stderr; failed requests are logged as errors elsewhere."""
+        logging.debug(f'{self.address_string()} - {format % args}')
+
+
+def main():
+    """Run the student API server from the command line."""
+    from crud_operations.create_student_table import CreateStudent
+    from crud_operations.db import create_connection_pool_with_retry
+
+    parser = argparse.ArgumentParser(description='Serve the student database as a JSON API.')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8080)
+    parser.add_argument('--workers', type=int, default=8,
+                        help='Connections served at the same time (and database connections pooled)')
+    parser.add_argument('--table', default='students2_1')
+    args = parser.parse_args()
+
+    pool = create_connection_pool_with_retry(minconn=1, maxconn=args.workers)
+    if not pool:
+        raise SystemExit('Could not connect to the database.')
+
+    server = None
+    try:
+        CreateStudent(pool, args.table).create_student_table()
+        server = StudentAPIServer((args.host, args.port), pool, args.table, workers=args.workers)
+        print(f'Serving the student API on http://{args.host}:{server.server_port} '
+              f'with {args.workers} workers.')
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if server:
+            server.server_close()
+        pool.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -1,13 +1,46 @@
+import argparse
 import logging
-from tkinter import Tk, Button, messagebox
+from tkinter import Tk, Button, Label
 
-from crud_operations.db import create_connection_with_retry, close_connection
-from gui.create_student_window import CreateStudentWindow
-from gui.delete_student_window import DeleteStudentWindow
-from gui.read_student_window import ReadStudentWindow
-from gui.update_student_window import UpdateStudentWindow
-from gui.update_student_attribute_window import UpdateStudentAttributeWindow
-from crud_operations.create_student_table import CreateStudent
+from gui.db_executor import BusyIndicator, get_db_executor
+
+# The window classes, psycopg2 and the CRUD classes are imported on first use rather than
+# here, so the main window appears without waiting for them or for the database.
+
+
+def connect_and_prepare_schema():
+    """
+    Open the connection pool and make sure the student table exists.
+
+    Runs on a background worker while the main window is already shown. The window
+    modules are imported here too, so opening the first window does not pause the GUI.
+    Returns:
+        StudentConnectionPool: The connection pool shared by all windows.
+    Raises:
+        ConnectionError: If the database could not be reached after the retries.
+    """
+    from crud_operations.db import create_connection_pool_with_retry
+    from crud_operations.create_student_table import CreateStudent
+
+    # Establish the database connection pool with retry logic
+    conn = create_connection_pool_with_retry(retries=3, delay=5)
+    if not conn:
+        raise ConnectionError('Could not connect to the database.')
+
+    try:
+        # Ensure the student table exists by calling CreateStudent
+        CreateStudent(conn).create_student_table()
+    except Exception:
+        conn.close()
+        raise
+
+    import gui.create_student_window  # noqa: F401
+    import gui.delete_student_window  # noqa: F401
+    import gui.read_student_window  # noqa: F401
+    import gui.statistics_window  # noqa: F401
+    import gui.update_student_attribute_window  # noqa: F401
+    import gui.update_student_window  # noqa: F401
+    return conn
 
 
 class MainWindow:
@@ -16,20 +49,28 @@ class MainWindow:
     Provides CRUD operations through buttons.
     """
 
-    def __init__(self, master, db_connection):
+    def __init__(self, master, db_connection=None):
         """
         Initialize the main application window with buttons to perform CRUD operations.
 
         Args:
             master (Tk): The root Tkinter window.
-            db_connection: Active database connection object.
+            db_connection: Connection pool shared by all windows and CRUD operations. If None,
+                the buttons stay disabled until ``connect`` has opened it in the background.
         """
         self.master = master  # The main Tkinter window
-        self.db_connection = db_connection  # Database connection object
+        self.db_connection = db_connection  # Database connection pool
+        self.buttons = []
         master.title('Student Database Management System')
 
         self.create_buttons()
 
+        # Status of the background connection and schema check
+        self.status_label = Label(master, text='Connected to the database.' if db_connection else '')
+        self.status_label.pack(pady=5)
+        self.retry_button = Button(master, text='Retry', command=self.connect)
+        self.busy = BusyIndicator(master)
+
     def create_buttons(self):
         """
         Creates and displays buttons for CRUD operations.
@@ -41,23 +82,54 @@ class MainWindow:
             ("Display Student", self.open_fetch_window),
             ("Update Student", self.open_update_window),
             ("Update Attribute", self.open_update_attribute_window),
+            ("Statistics", self.open_statistics_window),
         ]
 
-        # Pack buttons to make them visible in the GUI
+        # Pack buttons to make them visible in the GUI; they are enabled once the database is ready
         for text, command in buttons:
-            button = Button(self.master, text=text, command=command)
+            button = Button(self.master, text=text, command=command,
+                            state='normal' if self.db_connection else 'disabled')
             button.pack(pady=10)
+            self.buttons.append(button)
+
+    def connect(self) -> None:
+        """
+        Connect to the database and verify the schema on a background worker.
+        """
+        self.retry_button.pack_forget()
+        self.status_label.config(text='Connecting to the database...')
+        get_db_executor(self.master).submit(connect_and_prepare_schema, on_success=self.on_connected,
+                                            on_error=self.on_connection_failed, busy=self.busy)
+
+    def on_connected(self, db_connection) -> None:
+        """
+        Enable the buttons once the connection pool is open and the student table exists.
+        """
+        self.db_connection = db_connection
+        self.status_label.config(text='Connected to the database.')
+        for button in self.buttons:
+            button.config(state='normal')
+
+    def on_connection_failed(self, error) -> None:
+        """
+        Show why the database could not be initialized and offer to try again.
+        """
+        logging.error(f'Initialization error: {error}', exc_info=error)
+        self.status_label.config(text=f'Could not initialize the database: {error}')
+        self.retry_button.pack(pady=5)
 
     def open_create_window(self) -> None:
         """
         Opens the CreateStudentWindow when the user clicks the 'Create New Student' button.
         """
+        from gui.create_student_window import CreateStudentWindow
         CreateStudentWindow(self.master, self.db_connection)
 
     def open_delete_window(self) -> None:
         """
         Opens the DeleteStudentWindow when the user clicks the 'Delete Student' button.
         """
+        from gui.delete_student_window import DeleteStudentWindow
         DeleteStudentWindow(self.master, self.db_connection)
 
     def open_fetch_window(self) -> None:
@@ -65,56 +137,81 @@ class MainWindow:
         Opens the ReadStudentWindow when the user clicks the 'Display Student' button.
         Ensures only one window instance exists at a time.
         """
+        from gui.read_student_window import ReadStudentWindow
         ReadStudentWindow(self.master, self.db_connection)
 
     def open_update_window(self) -> None:
         """
         Opens the UpdateStudentWindow when the user clicks the 'Update Student' button.
         """
+        from gui.update_student_window import UpdateStudentWindow
         UpdateStudentWindow(self.master, self.db_connection)
 
     def open_update_attribute_window(self) -> None:
         """
         Opens the UpdateStudentAttributeWindow when the user clicks the 'Update Attribute' button.
         """
+        from gui.update_student_attribute_window import UpdateStudentAttributeWindow
         UpdateStudentAttributeWindow(self.master, self.db_connection)
 
+    def open_statistics_window(self) -> None:
+        """
+        Opens the StatisticsWindow when the user clicks the 'Statistics' button.
+        """
+        from gui.statistics_window import StatisticsWindow
+        StatisticsWindow(self.master, self.db_connection)
+
 
-def start_gui() -> None:
+def start_gui(profile_path=None, cprofile_path=None) -> None:
     """
     Initializes and starts the Tkinter GUI application.
-    This function sets up the root Tkinter window, establishes the database connection,
-    ensures the student table exists, and opens the main window for CRUD operations.
+    This function sets up the root Tkinter window and shows the main window right away.
+    The database connection is established and the student table created in the
+    background, and the CRUD buttons are enabled once that has finished.
+
+    Args:
+        profile_path (str): If set, Tk callbacks, database calls and event loop stalls are
+            profiled and a JSON report is written to this file on exit.
+        cprofile_path (str): If set together with ``profile_path``, a cProfile dump of the
+            Tk thread is written to this file as well.
     """
     root = Tk()  # Create the main Tkinter window (root window)
     root.title('Student Database Management System')
-    root.geometry('400x300')  # Define the initial size of the window
+    root.geometry('400x410')  # Define the initial size of the window
     root.config(padx=10, pady=10)  # Add padding around the window edges
 
+    profiler = None
+    if profile_path:
+        from gui.profiler import GuiProfiler
+        profiler = GuiProfiler(root, cprofile_path=cprofile_path)
+        profiler.install()  # Before any window is created, so construction is timed
+
     try:
-        # Establish the database connection with retry logic
-        conn = create_connection_with_retry(retries=3, delay=5)
-        if not conn:
-            # If the connection is not successful, show an error and exit
-            messagebox.showerror('Database Error', 'Could not connect to the database.')
-            return
+        main_window = MainWindow(root)
+        main_window.connect()  # Open the connection pool and check the schema in the background
+        executor = get_db_executor(root)  # Background workers shared by all windows
 
-        # Ensure the student table exists by calling CreateStudent
-        table_creator = CreateStudent(conn)
-        table_creator.create_student_table()  # Create the table if it doesn't exist.
+        def close():
+            executor.shutdown()
+            if main_window.db_connection:
+                main_window.db_connection.close()
+            root.destroy()
 
-        # After successful table creation, open the main window for CRUD operations
-        MainWindow(root, conn)
-        root.protocol('WM_DELETE_WINDOW',
-                      lambda: (close_connection(conn), root.destroy()))
+        root.protocol('WM_DELETE_WINDOW', close)
         root.mainloop()  # Start the Tkinter main event loop
 
-    except Exception as e:
-        # Handle any errors during the connection or table creation process
-        messagebox.showerror('Database Error', f'Could not initialize the database: {e}')
-        logging.error(f'Initialization error: {e}', exc_info=True)
-        root.destroy()  # Close the window if the connection or initialization fails
+    finally:
+        if profiler:
+            profiler.uninstall()
+            profiler.write_report(profile_path)
+            print(f'Profiling report written to {profile_path}.')
 
 
 if __name__ == '__main__':
-    start_gui()
+    parser = argparse.ArgumentParser(description='Student Database Management System')
+    parser.add_argument('--profile', metavar='REPORT_JSON',
+                        help='Profile Tk callbacks and database calls and write a report on exit')
+    parser.add_argument('--cprofile', metavar='PROF_FILE',
+                        help='With --profile, also write a cProfile dump of the Tk thread')
+    args = parser.parse_args()
+    start_gui(args.profile, args.cprofile)
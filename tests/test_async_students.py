@@ -0,0 +1,125 @@
+import unittest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from crud_operations.async_students import AsyncStudentDatabase, quote_identifier
+from crud_operations.student_cache import StudentCache
+
+
+class FakePool:
+    """Stand-in for an asyncpg pool that hands out a single mocked connection."""
+
+    def __init__(self, connection):
+        self.connection = connection
+
+    def acquire(self):
+        context = MagicMock()
+        context.__aenter__ = AsyncMock(return_value=self.connection)
+        context.__aexit__ = AsyncMock(return_value=False)
+        return context
+
+
+class TestAsyncStudentDatabase(unittest.IsolatedAsyncioTestCase):
+    """Unit test case for the asyncio data-access layer."""
+
+    def setUp(self):
+        self.connection = MagicMock()
+        self.connection.fetch = AsyncMock()
+        self.connection.fetchrow = AsyncMock()
+        self.connection.fetchval = AsyncMock()
+        self.connection.execute = AsyncMock()
+        transaction = MagicMock()
+        transaction.__aenter__ = AsyncMock()
+        transaction.__aexit__ = AsyncMock(return_value=False)
+        self.connection.transaction.return_value = transaction
+
+        self.cache = StudentCache()
+        self.db = AsyncStudentDatabase(FakePool(self.connection), 'students', cache=self.cache)
+
+    async def test_add_student(self):
+        self.connection.fetchrow.return_value = (1, 'Ann', 'Oslo', 20, '0123456789')
+
+        student = await self.db.add_student('Ann', 'Oslo', '20', '0123456789')
+
+        self.assertEqual(student, (1, 'Ann', 'Oslo', 20, '0123456789'))
+        query, *params = self.connection.fetchrow.call_args.args
+        self.assertIn('INSERT INTO "students"', query)
+        self.assertEqual(params, ['Ann', 'Oslo', 20, '0123456789'])
+        self.assertEqual(self.cache.get(1), student)
+
+    async def test_add_student_invalid_phone_number(self):
+        with self.assertRaises(ValueError):
+            await self.db.add_student('Ann', 'Oslo', 20, '123')
+        self.connection.fetchrow.assert_not_called()
+
+    async def test_fetch_page(self):
+        self.connection.fetch.return_value = [(3, 'Cy', 'Lima', 22, '0123456789')]
+
+        rows = await self.db.fetch_page(after_id=2, limit=1)
+
+        self.assertEqual(rows, [(3, 'Cy', 'Lima', 22, '0123456789')])
+        self.assertEqual(self.connection.fetch.call_args.args[1:], (2, 1))
+
+    async def test_find_student_uses_cache(self):
+        self.cache.put((5, 'Di', 'Kyiv', 23, '0123456789'))
+
+        student = await self.db.find_student_by_id('5')
+
+        self.assertEqual(student, (5, 'Di', 'Kyiv', 23, '0123456789'))
+        self.connection.fetchrow.assert_not_called()
+
+    async def test_update_student_field_not_found(self):
+        self.connection.fetchrow.return_value = None
+
+        self.assertIsNone(await self.db.update_student_field(9, 'age', '30'))
+        self.assertEqual(self.connection.fetchrow.call_args.args[1:], (30, 9))
+
+    async def test_update_student_field_invalid_field(self):
+        with self.assertRaises(ValueError):
+            await self.db.update_student_field(1, 'id', 2)
+
+    async def test_update_students_fields(self):
+        self.connection.fetch.side_effect = [[(1,), (2,)], [(1,)]]
+
+        result = await self.db.update_students_fields([
+            (1, 'name', 'Ann'), (2, 'name', 'Bob'), (1, 'age', '21'), (3, 'age', 30),
+        ])
+
+        self.assertEqual(result, {'matched': 2, 'unmatched': 1, 'unmatched_ids': [3]})
+        age_query, ids, values = self.connection.fetch.call_args_list[1].args
+        self.assertIn('unnest($1::int[], $2::int[])', age_query)
+        self.assertEqual((ids, values), ([1, 3], [21, 30]))
+        self.connection.transaction.assert_called_once()
+
+    async def test_delete_students(self):
+        self.cache.put((2, 'Bob', 'Rome', 21, '0123456789'))
+        self.connection.fetch.return_value = [(2,)]
+
+        deleted_ids, missing_ids = await self.db.delete_students([4, 2, 2])
+
+        self.assertEqual((deleted_ids, missing_ids), ([2], [4]))
+        self.assertEqual(self.connection.fetch.call_args.args[1], [2, 4])
+        self.assertIsNone(self.cache.get(2))
+
+    async def test_delete_student_not_found(self):
+        self.connection.fetchval.return_value = None
+        self.assertFalse(await self.db.delete_student(7))
+
+    @patch('crud_operations.create_student_table.CreateStudent')
+    async def test_create_student_table_applies_shared_migrations(self, mock_create_student):
+        mock_create_student.return_value.create_student_table.return_value = {'applied': [1, 2], 'skipped': []}
+        sync_connection = MagicMock()
+
+        result = await self.db.create_student_table(sync_connection, partition_size=1000)
+
+        # The schema is versioned in schema_migrations whichever layer creates it
+        self.assertEqual(result, {'applied': [1, 2], 'skipped': []})
+        mock_create_student.assert_called_once_with(sync_connection, 'students', 1000)
+        self.connection.execute.assert_not_called()
+        sync_connection.close.assert_not_called()
+
+    def test_quote_identifier(self):
+        self.assertEqual(quote_identifier('odd"name'), '"odd""name"')
+
+
+if __name__ == '__main__':
+    unittest.main()
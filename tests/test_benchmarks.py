@@ -0,0 +1,94 @@
+import tracemalloc
+import unittest
+from unittest.mock import MagicMock, patch
+
+from benchmarks.bench_crud import CrudBenchmark, summarize, time_calls
+from crud_operations.prepared_statements import prepared_statements
+
+
+class TestBenchmarkHelpers(unittest.TestCase):
+    """Unit test case for the timing helpers of the CRUD benchmark."""
+
+    def test_time_calls_counts_rows(self):
+        func = MagicMock(side_effect=[[(1,), (2,)], None, (3,)])
+
+        latencies, rows, memory = time_calls(func, [(1,), (2,), (3,)])
+
+        # A list counts its rows, any other result counts as one row
+        self.assertEqual(len(latencies), 3)
+        self.assertEqual(rows, 4)
+        self.assertEqual(func.call_count, 3)
+        self.assertIsNone(memory['peak_traced_mb'])  # tracemalloc is not tracing
+        self.assertGreaterEqual(memory['peak_rss_growth_mb'], 0)
+
+    def test_time_calls_consumes_generators(self):
+        consumed = []
+
+        def stream():
+            for row in range(5):
+                consumed.append(row)
+                yield (row,)
+
+        _, rows, _ = time_calls(stream, [(), ()])
+
+        self.assertEqual(rows, 10)
+        self.assertEqual(len(consumed), 10)
+
+    def test_time_calls_traces_the_memory_of_the_operation(self):
+        tracemalloc.start()
+        self.addCleanup(tracemalloc.stop)
+        kept = bytearray(4 * 1024 * 1024)  # Allocated before the operation, so not counted
+
+        _, _, memory = time_calls(lambda: bytearray(2 * 1024 * 1024), [()])
+
+        self.assertGreaterEqual(memory['peak_traced_mb'], 2.0)
+        self.assertLess(memory['peak_traced_mb'], 4.0)
+        del kept
+
+    def test_summarize(self):
+        summary = summarize([0.001, 0.002, 0.003, 0.004], rows=100,
+                            memory={'peak_rss_growth_mb': 12.0, 'peak_traced_mb': 1.5})
+
+        self.assertEqual(summary['calls'], 4)
+        self.assertEqual(summary['p50_ms'], 2.0)
+        self.assertEqual(summary['p99_ms'], 4.0)
+        self.assertEqual(summary['rows_per_second'], 10000.0)
+        self.assertEqual((summary['peak_rss_growth_mb'], summary['peak_traced_mb']), (12.0, 1.5))
+
+    def test_batch_rows_counts_passed_rows(self):
+        func = MagicMock(return_value={'matched': 2})
+
+        latencies, rows, _ = CrudBenchmark._batch_rows(func, [([1, 2],), ([3, 4, 5],)])
+
+        self.assertEqual((len(latencies), rows), (2, 5))
+
+    def test_compare_prepared_toggles_the_registry(self):
+        enabled = prepared_statements.enabled
+        modes = []
+        add = MagicMock(side_effect=lambda *args: modes.append(('add', prepared_statements.enabled)))
+        delete = MagicMock(side_effect=lambda *args: modes.append(('delete', prepared_statements.enabled, args)))
+
+        results = CrudBenchmark.compare_prepared({
+            'add_student': (add, [()]),
+            'delete_student': (delete, [(1,)], [(2,)]),
+        })
+
+        self.assertEqual(modes, [('add', False), ('add', True), ('delete', False, (1,)), ('delete', True, (2,))])
+        self.assertEqual(set(results['delete_student']), {'direct', 'prepared', 'mean_change_pct'})
+        self.assertEqual(prepared_statements.enabled, enabled)
+
+
+    @patch('benchmarks.bench_crud.SchemaMigrator')
+    def test_drop_table_drops_both_trigger_functions(self, mock_migrator):
+        connection = MagicMock()
+        cursor = connection.cursor.return_value.__enter__.return_value
+
+        CrudBenchmark(connection, 'bench').drop_table()
+
+        statement = repr(cursor.execute.call_args.args[0])
+        self.assertIn("Identifier('bench_notify_change')", statement)
+        self.assertIn("Identifier('bench_notify_changes')", statement)
+        mock_migrator.return_value.forget.assert_called_once()
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,98 @@
+import csv
+import os
+import tempfile
+import unittest
+from unittest.mock import MagicMock, patch
+
+import psycopg2
+
+from crud_operations.bulk_import_students import BulkStudentImporter
+
+
+class TestBulkStudentImporter(unittest.TestCase):
+    """Unit test case for the BulkStudentImporter class."""
+
+    def setUp(self):
+        self.mock_connection = MagicMock()
+        self.mock_cursor = MagicMock()
+        self.mock_connection.cursor.return_value.__enter__.return_value = self.mock_cursor
+
+        self.importer = BulkStudentImporter(self.mock_connection, 'test_table', batch_size=2)
+
+        # Temporary CSV input and reject files
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+        self.csv_path = os.path.join(self.tmp_dir.name, 'students.csv')
+        self.reject_path = os.path.join(self.tmp_dir.name, 'rejects.csv')
+
+    def write_csv(self, rows):
+        with open(self.csv_path, 'w', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(['name', 'address', 'age', 'number'])
+            writer.writerows(rows)
+
+    def read_rejects(self):
+        with open(self.reject_path, newline='') as f:
+            return list(csv.reader(f))[1:]
+
+    def test_import_csv_copies_valid_rows_and_rejects_invalid(self):
+        self.write_csv([
+            ['Na Stia', 'Hannover', '21', '1234567890'],
+            ['Se Honc', 'Hamburg', '22', '12345'],
+            ['Ju Lia', 'Berlin', 'abc', '1234567890'],
+            ['', 'Berlin', '23', '1234567890'],
+            ['Mi Ka', 'Bremen, Germany', '24', '0987654321'],
+            ['Jo Na', 'Kiel', '25', '1112223333'],
+        ])
+
+        summary = self.importer.import_csv(self.csv_path, self.reject_path)
+
+        self.assertEqual(summary['imported'], 3)
+        self.assertEqual(summary['rejected'], 3)
+
+        # Three valid rows in batches of two: two COPY calls and two commits
+        self.assertEqual(self.mock_cursor.copy_expert.call_count, 2)
+        self.assertEqual(self.mock_connection.commit.call_count, 2)
+
+        # The first COPY buffer contains the first two valid rows in CSV format
+        buffer = self.mock_cursor.copy_expert.call_args_list[0].args[1]
+        self.assertEqual(buffer.getvalue(),
+                         'Na Stia,Hannover,21,1234567890\r\nMi Ka,"Bremen, Germany",24,0987654321\r\n')
+
+        self.assertEqual(self.read_rejects(), [
+            ['3', 'Please enter a valid phone number.', 'Se Honc', 'Hamburg', '22', '12345'],
+            ['4', 'Please enter a valid number for age.', 'Ju Lia', 'Berlin', 'abc', '1234567890'],
+            ['5', 'Please fill out all fields.', '', 'Berlin', '23', '1234567890'],
+        ])
+
+    @patch('crud_operations.bulk_import_students.execute_values')
+    def test_import_csv_falls_back_to_execute_values(self, mock_execute_values):
+        self.write_csv([['Na Stia', 'Hannover', '21', '1234567890']])
+        self.mock_cursor.copy_expert.side_effect = psycopg2.NotSupportedError('COPY not supported')
+
+        summary = self.importer.import_csv(self.csv_path, self.reject_path)
+
+        self.assertEqual(summary['imported'], 1)
+        self.mock_connection.rollback.assert_called_once()
+        mock_execute_values.assert_called_once()
+        self.assertEqual(mock_execute_values.call_args.args[2], [('Na Stia', 'Hannover', 21, '1234567890')])
+
+    @patch('crud_operations.bulk_import_students.execute_values')
+    def test_import_csv_rejects_batch_refused_by_database(self, mock_execute_values):
+        self.write_csv([['Na Stia', 'Hannover', '21', '1234567890']])
+        mock_execute_values.side_effect = psycopg2.DatabaseError('Mocked database error')
+
+        summary = self.importer.import_csv(self.csv_path, self.reject_path, use_copy=False)
+
+        self.assertEqual(summary, {'imported': 0, 'rejected': 1, 'seconds': summary['seconds']})
+        self.mock_cursor.copy_expert.assert_not_called()
+        self.assertEqual(self.read_rejects(),
+                         [['2', 'Database error: Mocked database error',
+                           'Na Stia', 'Hannover', '21', '1234567890']])
+
+    def test_import_csv_missing_columns(self):
+        with open(self.csv_path, 'w') as f:
+            f.write('name,address\nNa Stia,Hannover\n')
+
+        with self.assertRaises(ValueError):
+            self.importer.import_csv(self.csv_path, self.reject_path)
@@ -0,0 +1,75 @@
+import unittest
+from collections import namedtuple
+from unittest.mock import MagicMock
+
+from psycopg2 import sql
+
+from crud_operations.change_listener import StudentChangeListener
+from crud_operations.create_student_table import CreateStudent
+from crud_operations.migrations import change_statement_triggers_query
+
+Notify = namedtuple('Notify', 'pid channel payload')
+
+
+class TestStudentChangeListener(unittest.TestCase):
+    """Unit test case for the StudentChangeListener class."""
+
+    def setUp(self):
+        self.mock_connection = MagicMock()
+        self.mock_connection.notifies = []
+        self.mock_cursor = MagicMock()
+        self.mock_connection.cursor.return_value.__enter__.return_value = self.mock_cursor
+
+        self.listener = StudentChangeListener(self.mock_connection, 'test_table')
+
+    def test_start_listens_on_table_channel(self):
+        self.listener.start()
+
+        self.assertTrue(self.mock_connection.autocommit)
+        self.mock_cursor.execute.assert_called_once_with(
+            sql.SQL('LISTEN {channel}').format(channel=sql.Identifier('test_table_changes')))
+
+    def test_poll_returns_changes_in_order(self):
+        self.mock_connection.notifies.extend([
+            Notify(1, 'test_table_changes', '{"op": "INSERT", "id": 7}'),
+            Notify(1, 'test_table_changes', 'not json'),
+            Notify(1, 'test_table_changes', '{"op": "DELETE", "id": 3}'),
+        ])
+
+        changes = self.listener.poll()
+
+        self.mock_connection.poll.assert_called_once()
+        self.assertEqual(changes, [('INSERT', 7), ('DELETE', 3)])
+        self.assertEqual(self.mock_connection.notifies, [])
+
+    def test_poll_reports_bulk_changes_as_reload(self):
+        self.mock_connection.notifies.append(Notify(1, 'test_table_changes', '{"op": "RELOAD"}'))
+
+        self.assertEqual(self.listener.poll(), [('RELOAD', None)])
+
+    def test_poll_without_changes(self):
+        self.assertEqual(self.listener.poll(), [])
+
+
+class TestCreateStudentChangeTrigger(unittest.TestCase):
+    """Unit test case for the change trigger installed with the student table."""
+
+    def test_create_student_table_installs_change_trigger(self):
+        mock_connection = MagicMock()
+        mock_cursor = MagicMock()
+        mock_connection.cursor.return_value.__enter__.return_value = mock_cursor
+        table_creator = CreateStudent(mock_connection, 'test_table')
+
+        # Raises DatabaseOperationError if any statement fails
+        table_creator.create_student_table()
+
+        mock_cursor.execute.assert_any_call(table_creator.change_trigger_query())
+
+    def test_statement_triggers_publish_a_reload_for_bulk_changes(self):
+        ddl = repr(change_statement_triggers_query('test_table'))
+
+        # One trigger per event, each reading the rows its statement changed
+        self.assertEqual(ddl.count('FOR EACH STATEMENT'), 3)
+        self.assertIn('REFERENCING OLD TABLE AS changed_rows', ddl)
+        self.assertIn("'op', 'RELOAD'", ddl)
+        self.assertIn("Identifier('test_table_notify_change_trigger')", ddl)
@@ -0,0 +1,72 @@
+import unittest
+from unittest.mock import MagicMock, patch
+
+import psycopg2
+
+from crud_operations.connection_pool import StudentConnectionPool, borrow_connection
+
+
+class TestStudentConnectionPool(unittest.TestCase):
+    """Unit test case for the StudentConnectionPool class."""
+
+    def setUp(self):
+        # Replace the psycopg2 pool so no real connections are opened
+        patcher = patch('crud_operations.connection_pool.pool.ThreadedConnectionPool')
+        self.mock_pool_class = patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.mock_pool = self.mock_pool_class.return_value
+        self.mock_pool.maxconn = 2
+
+        self.mock_connection = MagicMock()
+        self.mock_connection.closed = 0
+        self.mock_pool.getconn.return_value = self.mock_connection
+
+        self.connection_pool = StudentConnectionPool(1, 2, dbname='test')
+
+    def test_connection_borrow_and_return(self):
+        with self.connection_pool.connection() as conn:
+            self.assertIs(conn, self.mock_connection)
+
+        self.mock_pool_class.assert_called_once_with(1, 2, dbname='test')
+        self.mock_pool.putconn.assert_called_once_with(self.mock_connection)
+
+    def test_connection_recently_used_skips_health_check(self):
+        with self.connection_pool.connection():
+            pass
+        self.mock_connection.cursor.reset_mock()
+
+        with self.connection_pool.connection():
+            pass
+
+        # A connection returned moments ago is handed out without a ping
+        self.mock_connection.cursor.assert_not_called()
+
+    def test_connection_replaces_broken_connection(self):
+        broken_connection = MagicMock()
+        broken_connection.closed = 0
+        broken_connection.cursor.return_value.__enter__.return_value.execute.side_effect = \
+            psycopg2.OperationalError('server closed the connection')
+        self.mock_pool.getconn.side_effect = [broken_connection, self.mock_connection]
+
+        with self.connection_pool.connection() as conn:
+            self.assertIs(conn, self.mock_connection)
+
+        # The broken connection is closed and removed from the pool
+        self.mock_pool.putconn.assert_any_call(broken_connection, close=True)
+
+    def test_connection_closed_while_borrowed_is_discarded(self):
+        with self.connection_pool.connection() as conn:
+            conn.closed = 2
+
+        self.mock_pool.putconn.assert_called_once_with(self.mock_connection, close=True)
+
+    def test_borrow_connection_from_plain_connection(self):
+        plain_connection = MagicMock()
+
+        with borrow_connection(plain_connection) as conn:
+            self.assertIs(conn, plain_connection)
+
+    def test_borrow_connection_from_pool(self):
+        with borrow_connection(self.connection_pool) as conn:
+            self.assertIs(conn, self.mock_connection)
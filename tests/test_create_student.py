@@ -2,11 +2,17 @@ import unittest
 from unittest.mock import MagicMock, patch
 from psycopg2 import sql
 from crud_operations.add_student import AddStudent
+from crud_operations.exceptions import DatabaseOperationError, ValidationError
+from crud_operations.prepared_statements import prepared_statements
 
 
 class TestAddStudent(unittest.TestCase):
 
     def setUp(self):
+        # These tests check the composed SQL, so it is executed directly rather than through PREPARE
+        patcher = patch.object(prepared_statements, 'enabled', False)
+        patcher.start()
+        self.addCleanup(patcher.stop)
         self.mock_db_connection = MagicMock()
         self.add_student_instance = AddStudent(self.mock_db_connection)
 
@@ -18,18 +24,19 @@ class TestAddStudent(unittest.TestCase):
         address = "Hamburg"
         age = 21
         number = "1234567890"
+        mock_cursor.fetchone.return_value = (1, name, address, age, number)
 
-        with patch('crud_operations.add_student.messagebox.showinfo'), \
-                patch('crud_operations.add_student.messagebox.showerror'):
-            self.add_student_instance.add_student(name, address, age, number)
+        student = self.add_student_instance.add_student(name, address, age, number)
 
         expected_sql = sql.SQL("""
                  INSERT INTO {table_name} (name, address, age, number)
                  VALUES (%s, %s, %s, %s)
+                 RETURNING id, name, address, age, number
                     """).format(table_name=sql.Identifier('students2_1'))
 
         mock_cursor.execute.assert_called_once_with(expected_sql, (name, address, age, number))
         self.mock_db_connection.commit.assert_called_once()
+        self.assertEqual(student, (1, name, address, age, number))
 
     def test_add_student_invalid_phone_number(self):
         name = "Na Stia"
@@ -37,12 +44,12 @@ class TestAddStudent(unittest.TestCase):
         age = 21
         number = "12345"
 
-        with patch('crud_operations.add_student.messagebox.showinfo'), \
-                patch('crud_operations.add_student.messagebox.showerror') as mock_showerror:
+        with self.assertRaises(ValidationError) as context:
             self.add_student_instance.add_student(name, address, age, number)
 
-        mock_showerror.assert_called_once_with('Invalid Phone Number',
-                                               'Please enter a valid phone number.')
+        self.assertEqual(context.exception.title, 'Invalid Phone Number')
+        self.assertEqual(str(context.exception), 'Please enter a valid phone number.')
+        self.mock_db_connection.cursor.assert_not_called()
 
     def test_add_student_missing_fields(self):
         name = ""
@@ -50,11 +57,11 @@ class TestAddStudent(unittest.TestCase):
         age = 21
         number = "1234567890"
 
-        with patch('crud_operations.add_student.messagebox.showinfo'), \
-                patch('crud_operations.add_student.messagebox.showerror') as mock_showerror:
+        with self.assertRaises(ValidationError) as context:
             self.add_student_instance.add_student(name, address, age, number)
 
-        mock_showerror.assert_called_once_with('Missing Fields', 'Please fill out all fields.')
+        self.assertEqual(context.exception.title, 'Missing Fields')
+        self.assertEqual(str(context.exception), 'Please fill out all fields.')
 
     def test_add_student_database_error(self):
         mock_cursor = MagicMock()
@@ -67,9 +74,8 @@ class TestAddStudent(unittest.TestCase):
         age = 21
         number = "1234567890"
 
-        with patch('crud_operations.add_student.messagebox.showinfo'), \
-                patch('crud_operations.add_student.messagebox.showerror') as mock_showerror:
+        with self.assertRaises(DatabaseOperationError) as context:
             self.add_student_instance.add_student(name, address, age, number)
 
-        mock_showerror.assert_called_once_with('Database Error', 'Error inserting data: Database Error')
+        self.assertEqual(str(context.exception), 'Error inserting data: Database Error')
         self.mock_db_connection.rollback.assert_called_once()
@@ -0,0 +1,78 @@
+import threading
+import unittest
+from concurrent.futures import wait
+from unittest.mock import MagicMock
+
+from gui.db_executor import DatabaseExecutor
+
+
+class FakeMaster:
+    """Stand-in for a Tk root that records after() callbacks instead of scheduling them."""
+
+    def __init__(self):
+        self.scheduled = []
+
+    def after(self, delay, callback):
+        self.scheduled.append(callback)
+        return len(self.scheduled)
+
+    def after_cancel(self, job):
+        pass
+
+    def run_pending(self):
+        """Run the callbacks scheduled so far, as the Tk event loop would."""
+        scheduled, self.scheduled = self.scheduled, []
+        for callback in scheduled:
+            callback()
+
+
+class TestDatabaseExecutor(unittest.TestCase):
+    """Unit test case for the DatabaseExecutor class."""
+
+    def setUp(self):
+        self.master = FakeMaster()
+        self.executor = DatabaseExecutor(self.master, max_workers=2)
+        self.addCleanup(self.executor.shutdown)
+
+    def wait_for_callbacks(self):
+        # Let the workers finish, then poll as the Tk event loop would
+        wait([future for future, *_ in self.executor._pending], timeout=5)
+        self.master.run_pending()
+        self.assertEqual(self.executor._pending, [])
+
+    def test_submit_runs_call_off_the_main_thread(self):
+        on_success = MagicMock()
+        busy = MagicMock()
+
+        self.executor.submit(lambda x: (x * 2, threading.current_thread().name), 21,
+                             on_success=on_success, busy=busy)
+        self.wait_for_callbacks()
+
+        result, thread_name = on_success.call_args.args[0]
+        self.assertEqual(result, 42)
+        self.assertTrue(thread_name.startswith('db-worker'))
+        busy.start.assert_called_once()
+        busy.stop.assert_called_once()
+
+    def test_submit_reports_errors(self):
+        on_success = MagicMock()
+        on_error = MagicMock()
+        error = RuntimeError('Mocked database error')
+
+        def failing_call():
+            raise error
+
+        self.executor.submit(failing_call, on_success=on_success, on_error=on_error)
+        self.wait_for_callbacks()
+
+        on_success.assert_not_called()
+        on_error.assert_called_once_with(error)
+
+    def test_callback_errors_do_not_stop_polling(self):
+        second_callback = MagicMock()
+
+        self.executor.submit(lambda: 1, on_success=MagicMock(side_effect=RuntimeError('window closed')))
+        self.executor.submit(lambda: 2, on_success=second_callback)
+        self.wait_for_callbacks()
+
+        second_callback.assert_called_once_with(2)
@@ -4,10 +4,16 @@ from unittest.mock import MagicMock, patch
 from psycopg2 import sql
 
 from crud_operations.delete_student import DeleteStudent
+from crud_operations.exceptions import DatabaseOperationError
+from crud_operations.prepared_statements import prepared_statements
 
 
 class TestDeleteStudent(unittest.TestCase):
     def setUp(self):
+        # These tests check the composed SQL, so it is executed directly rather than through PREPARE
+        patcher = patch.object(prepared_statements, 'enabled', False)
+        patcher.start()
+        self.addCleanup(patcher.stop)
         # Mock the database connection and cursor
         self.mock_connection = MagicMock()
         self.mock_cursor = MagicMock()
@@ -22,32 +28,28 @@ class TestDeleteStudent(unittest.TestCase):
         self.mock_cursor.reset_mock()
         self.mock_connection.reset_mock()
 
-    @patch('tkinter.messagebox.showerror')
-    def test_delete_student_exception(self, mock_showerror):
+    def test_delete_student_exception(self):
         # Simulate an exception during cursor execution
         self.mock_cursor.execute.side_effect = Exception("Simulated database error")
 
-        result = self.delete_student.delete_student(student_id=1)
+        with self.assertRaises(DatabaseOperationError) as context:
+            self.delete_student.delete_student(student_id=1)
 
-        self.assertFalse(result, "Expected delete_student to return False on exception")
         self.mock_cursor.execute.assert_called_once()  # Ensure execute was attempted
         self.mock_connection.rollback.assert_called_once()  # Ensure rollback was called
-        mock_showerror.assert_called_once_with('Database Error', 'Error deleting student: Simulated database error')
+        self.assertEqual(str(context.exception), 'Error deleting student: Simulated database error')
 
-    @patch('tkinter.messagebox.showerror')
-    def test_delete_student_not_found(self, mock_showerror):
+    def test_delete_student_not_found(self):
         # Simulate no student found in the database
         self.mock_cursor.fetchone.return_value = None  # Student was found
 
         result = self.delete_student.delete_student(student_id=1)
 
         self.assertFalse(result, "Expected delete_student return False if student is not found")
-        self.mock_cursor.execute.assert_called_once()  # Ensure the SELECT query was executed
-        mock_showerror.assert_not_called()  # Ensure no error message is displayed
+        self.mock_cursor.execute.assert_called_once()  # Ensure the DELETE query was executed
         self.mock_connection.commit.assert_not_called()  # Ensure no commit occurred
 
-    @patch('tkinter.messagebox.showinfo')
-    def test_delete_student_success(self, mock_showinfo):
+    def test_delete_student_success(self):
         # Simulate finding the student and successful deletion
         self.mock_cursor.fetchone.return_value = (1,)  # Student exists
 
@@ -55,28 +57,63 @@ class TestDeleteStudent(unittest.TestCase):
 
         self.assertTrue(result, "Expected delete_student to return True on successful deletion")
 
-        expected_select_query = sql.SQL("""
-                             SELECT id FROM {table_name}
-                             WHERE id = %s
-                                """).format(
-            table_name=sql.Identifier(self.table_name)
-        )
-
         expected_delete_query = sql.SQL("""
-                     DELETE FROM {table_name} 
+                     DELETE FROM {table_name}
                      WHERE id = %s
+                     RETURNING id
                         """).format(
             table_name=sql.Identifier(self.table_name)
         )
 
-        # Ensure the SELECT query was executed
-        self.mock_cursor.execute.assert_any_call(expected_select_query, (1,))
-
-        # Ensure the DELETE query was executed
-        self.mock_cursor.execute.assert_any_call(expected_delete_query, (1,))
+        # Ensure only the DELETE ... RETURNING query was executed
+        self.mock_cursor.execute.assert_called_once_with(expected_delete_query, (1,))
 
         # Ensure commit occurred
         self.mock_connection.commit.assert_called_once()
 
-        # Ensure no error message is displayed
-        mock_showinfo.assert_not_called()
+    def test_delete_students_reports_missing_ids(self):
+        # Simulate two of the three requested students existing
+        self.mock_cursor.fetchall.return_value = [(3,), (1,)]
+
+        result = self.delete_student.delete_students([3, 1, 2, 3])
+
+        expected_query = sql.SQL("""
+            DELETE FROM {table_name}
+            WHERE id = ANY(%s)
+            RETURNING id
+        """).format(table_name=sql.Identifier(self.table_name))
+
+        # Ensure a single statement was executed with the de-duplicated IDs
+        self.mock_cursor.execute.assert_called_once_with(expected_query, ([1, 2, 3],))
+        self.mock_connection.commit.assert_called_once()
+        self.assertEqual(result, ([1, 3], [2]))
+
+    def test_delete_students_empty_list(self):
+        result = self.delete_student.delete_students([])
+
+        self.assertEqual(result, ([], []))
+        self.mock_cursor.execute.assert_not_called()
+
+    def test_delete_students_exception(self):
+        self.mock_cursor.execute.side_effect = Exception("Simulated database error")
+
+        with self.assertRaises(DatabaseOperationError) as context:
+            self.delete_student.delete_students([1, 2])
+
+        self.mock_connection.rollback.assert_called_once()
+        self.assertEqual(str(context.exception), 'Error deleting students: Simulated database error')
+
+    def test_delete_student_range(self):
+        self.mock_cursor.fetchall.return_value = [(11,), (10,)]
+
+        result = self.delete_student.delete_student_range(10, 12)
+
+        expected_query = sql.SQL("""
+            DELETE FROM {table_name}
+            WHERE id BETWEEN %s AND %s
+            RETURNING id
+        """).format(table_name=sql.Identifier(self.table_name))
+
+        self.mock_cursor.execute.assert_called_once_with(expected_query, (10, 12))
+        self.mock_connection.commit.assert_called_once()
+        self.assertEqual(result, [10, 11])
@@ -0,0 +1,54 @@
+import unittest
+from unittest.mock import MagicMock, patch
+
+from gui.delete_student_window import DeleteStudentWindow
+
+
+@patch('gui.delete_student_window.messagebox')
+class TestDeleteStudentWindow(unittest.TestCase):
+    """Unit test case for the results of the background deletion reported by the delete window."""
+
+    def setUp(self):
+        # The window is built without Tk; only the widgets the callbacks touch are mocked
+        self.window = DeleteStudentWindow.__new__(DeleteStudentWindow)
+        self.window.top = MagicMock()
+        self.window.delete_button = MagicMock()
+
+    def test_deleted_student_closes_the_window(self, mock_messagebox):
+        self.window.on_delete_finished('7', True)
+
+        mock_messagebox.showinfo.assert_called_once()
+        self.window.top.destroy.assert_called_once()
+
+    def test_missing_student_keeps_the_window_open(self, mock_messagebox):
+        self.window.on_delete_finished('7', False)
+
+        mock_messagebox.showerror.assert_called_once()
+        self.window.top.destroy.assert_not_called()
+        self.window.delete_button.config.assert_called_once_with(state='normal')
+
+    @patch('gui.delete_student_window.show_error')
+    def test_error_keeps_the_window_open(self, mock_show_error, mock_messagebox):
+        error = Exception('connection lost')
+
+        self.window.on_delete_error(error)
+
+        mock_show_error.assert_called_once_with(error)
+        self.window.top.destroy.assert_not_called()
+        self.window.delete_button.config.assert_called_once_with(state='normal')
+
+    def test_batch_without_deleted_students_keeps_the_window_open(self, mock_messagebox):
+        self.window.on_batch_delete_finished(([], [3, 5]))
+
+        mock_messagebox.showerror.assert_called_once()
+        self.window.top.destroy.assert_not_called()
+
+    def test_batch_deletion_closes_the_window(self, mock_messagebox):
+        self.window.on_batch_delete_finished(([3], [5]))
+
+        self.assertIn('IDs not found: 5', mock_messagebox.showinfo.call_args.args[1])
+        self.window.top.destroy.assert_called_once()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,176 @@
+import gzip
+import json
+import os
+import tempfile
+import unittest
+from unittest.mock import MagicMock, patch
+
+import psycopg2
+from psycopg2 import sql
+
+from crud_operations.exceptions import DatabaseOperationError
+from crud_operations.export_student_data import StudentDataExporter, pyarrow
+
+
+class NamedCursor:
+    """
+    Server-side cursor that, like psycopg2's, is no longer valid once its transaction has ended.
+    """
+
+    def __init__(self, connection, rows, error=None):
+        self.rows = rows
+        self.error = error
+        self.itersize = None
+        self.closed = False
+        self.transaction_ended = False
+        connection.commit.side_effect = self.end_transaction
+        connection.rollback.side_effect = self.end_transaction
+
+    def end_transaction(self):
+        self.transaction_ended = True
+
+    def execute(self, query):
+        pass
+
+    def __iter__(self):
+        yield from self.rows
+        if self.error:
+            raise self.error
+
+    def close(self):
+        if self.transaction_ended and not self.closed:
+            raise psycopg2.ProgrammingError("named cursor isn't valid anymore")
+        self.closed = True
+
+
+class TestStudentDataExporter(unittest.TestCase):
+    """Unit test case for the StudentDataExporter class."""
+
+    def setUp(self):
+        self.mock_connection = MagicMock()
+        self.mock_cursor = MagicMock()
+        self.mock_connection.cursor.return_value.__enter__.return_value = self.mock_cursor
+
+        self.exporter = StudentDataExporter(self.mock_connection, 'test_table')
+
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+
+    def test_export_csv_uses_copy_to_stdout(self):
+        path = os.path.join(self.tmp_dir.name, 'students.csv.gz')
+
+        # Simulate the server writing CSV data into the output file
+        def copy_expert(query, output):
+            output.write('id,name,address,age,number\n1,Na Stia,Hannover,21,1234567890\n')
+        self.mock_cursor.copy_expert.side_effect = copy_expert
+        self.mock_cursor.rowcount = 1
+
+        exported = self.exporter.export_csv(path, compress=True)
+
+        expected_query = sql.SQL("""
+            COPY (SELECT id, name, address, age, number FROM {table_name} ORDER BY id)
+            TO STDOUT WITH (FORMAT csv, HEADER)
+        """).format(table_name=sql.Identifier('test_table'))
+
+        self.assertEqual(self.mock_cursor.copy_expert.call_args.args[0], expected_query)
+        self.assertEqual(exported, 1)
+        with gzip.open(path, 'rt') as f:
+            self.assertEqual(f.read(), 'id,name,address,age,number\n1,Na Stia,Hannover,21,1234567890\n')
+
+    def test_failed_csv_export_is_wrapped_and_rolled_back(self):
+        path = os.path.join(self.tmp_dir.name, 'students.csv')
+        self.mock_cursor.copy_expert.side_effect = psycopg2.OperationalError('server closed the connection')
+
+        with self.assertRaises(DatabaseOperationError) as context:
+            self.exporter.export_csv(path)
+
+        self.assertIn('server closed the connection', str(context.exception))
+        self.mock_connection.rollback.assert_called_once()
+        self.mock_connection.commit.assert_not_called()
+        self.assertFalse(os.path.exists(path))
+
+    def test_export_jsonl_streams_records(self):
+        path = os.path.join(self.tmp_dir.name, 'students.jsonl')
+        named_cursor = self.stream([(1, 'Na Stia', 'Hannover', 21, '1234567890'),
+                                    (2, 'Se Honc', 'Hamburg', 22, '0987654321')])
+
+        exported = self.exporter.export_jsonl(path)
+
+        self.assertEqual(exported, 2)
+        self.assertTrue(named_cursor.closed)
+        self.mock_connection.commit.assert_called_once()
+        with open(path) as f:
+            lines = [json.loads(line) for line in f]
+        self.assertEqual(lines[0], {'id': 1, 'name': 'Na Stia', 'address': 'Hannover',
+                                    'age': 21, 'number': '1234567890'})
+        self.assertEqual(lines[1]['id'], 2)
+
+    def test_failed_export_removes_partial_file(self):
+        path = os.path.join(self.tmp_dir.name, 'students.jsonl')
+        self.stream([(1, 'Na Stia', 'Hannover', 21, '1234567890')],
+                    error=psycopg2.OperationalError('server closed the connection'))
+
+        with self.assertRaises(DatabaseOperationError):
+            self.exporter.export_jsonl(path)
+
+        self.assertFalse(os.path.exists(path))
+
+    def stream(self, rows, error=None):
+        """Serve the rows through a named cursor that behaves like psycopg2's."""
+        named_cursor = NamedCursor(self.mock_connection, rows, error)
+        self.mock_connection.cursor.return_value = named_cursor
+        return named_cursor
+
+    def test_columnar_export_requires_pyarrow(self):
+        with patch('crud_operations.export_student_data.pyarrow', None):
+            with self.assertRaises(RuntimeError):
+                self.exporter.export_parquet(os.path.join(self.tmp_dir.name, 'students.parquet'))
+
+    @unittest.skipUnless(pyarrow, 'pyarrow is not installed')
+    def test_export_parquet_writes_row_groups(self):
+        path = os.path.join(self.tmp_dir.name, 'students.parquet')
+        named_cursor = self.stream([(i, f'Student {i}', 'Hannover', 20 + i % 5, '1234567890') for i in range(1, 6)])
+
+        exported = self.exporter.export_parquet(path, row_group_size=2)
+
+        self.assertEqual(exported, 5)
+        self.assertTrue(named_cursor.closed)
+        parquet_file = pyarrow.parquet.ParquetFile(path)
+        self.assertEqual(parquet_file.metadata.num_row_groups, 3)
+        ages = parquet_file.read(columns=['age'])
+        self.assertEqual(ages.column_names, ['age'])
+        self.assertEqual(ages.column('age').to_pylist(), [21, 22, 23, 24, 20])
+
+    @unittest.skipUnless(pyarrow, 'pyarrow is not installed')
+    def test_export_arrow_writes_record_batches(self):
+        path = os.path.join(self.tmp_dir.name, 'students.arrow')
+        self.stream([(1, 'Na Stia', 'Hannover', 21, '1234567890'), (2, 'Se Honc', 'Hamburg', 22, '0987654321')])
+
+        exported = self.exporter.export_arrow(path, batch_size=1)
+
+        self.assertEqual(exported, 2)
+        with pyarrow.ipc.open_file(path) as reader:
+            self.assertEqual(reader.num_record_batches, 2)
+            self.assertEqual(reader.read_all().column('name').to_pylist(), ['Na Stia', 'Se Honc'])
+
+    @unittest.skipUnless(pyarrow, 'pyarrow is not installed')
+    def test_record_batches_run_to_exhaustion(self):
+        named_cursor = self.stream([(i, f'Student {i}', 'Hannover', 21, '1234567890') for i in range(1, 4)])
+
+        batches = list(self.exporter.record_batches(batch_size=2))
+
+        self.assertEqual([batch.num_rows for batch in batches], [2, 1])
+        self.assertTrue(named_cursor.closed)
+        self.mock_connection.commit.assert_called_once()
+        self.mock_connection.rollback.assert_not_called()
+
+    @unittest.skipUnless(pyarrow, 'pyarrow is not installed')
+    def test_failed_parquet_export_removes_partial_file(self):
+        path = os.path.join(self.tmp_dir.name, 'students.parquet')
+        self.stream([(i, f'Student {i}', 'Hannover', 21, '1234567890') for i in range(1, 4)],
+                    error=psycopg2.OperationalError('server closed the connection'))
+
+        with self.assertRaises(DatabaseOperationError):
+            self.exporter.export_parquet(path, row_group_size=2)
+
+        self.assertFalse(os.path.exists(path))
@@ -0,0 +1,98 @@
+import json
+import os
+import tempfile
+import time
+import unittest
+from concurrent.futures import wait
+
+from gui.db_executor import DatabaseExecutor
+from gui.profiler import GuiProfiler, summarize_durations
+from gui.read_student_window import ReadStudentWindow
+
+
+class FakeMaster:
+    """Stand-in for a Tk root that records after() callbacks instead of scheduling them."""
+
+    def __init__(self):
+        self.scheduled = []
+
+    def after(self, delay, callback):
+        self.scheduled.append(callback)
+        return len(self.scheduled)
+
+    def after_cancel(self, job):
+        pass
+
+    def run_pending(self):
+        """Run the callbacks scheduled so far, as the Tk event loop would."""
+        scheduled, self.scheduled = self.scheduled, []
+        for callback in scheduled:
+            callback()
+
+
+class TestGuiProfiler(unittest.TestCase):
+    """Unit test case for the opt-in GUI profiler."""
+
+    def setUp(self):
+        self.root = FakeMaster()
+        self.original_load_data = ReadStudentWindow.__dict__['load_data']
+        self.original_submit = DatabaseExecutor.__dict__['submit']
+        self.profiler = GuiProfiler(self.root, heartbeat_ms=50, stall_threshold_ms=100)
+        self.profiler.install()
+
+    def tearDown(self):
+        self.profiler.uninstall()
+
+    def test_uninstall_restores_methods(self):
+        self.assertIsNot(ReadStudentWindow.__dict__['load_data'], self.original_load_data)
+
+        self.profiler.uninstall()
+
+        self.assertIs(ReadStudentWindow.__dict__['load_data'], self.original_load_data)
+        self.assertIs(DatabaseExecutor.__dict__['submit'], self.original_submit)
+
+    def test_database_call_and_callback_are_timed_separately(self):
+        def fetch_rows():
+            time.sleep(0.01)
+            return [1, 2]
+
+        results = []
+        executor = DatabaseExecutor(self.root)
+        executor.submit(fetch_rows, on_success=results.append)
+        wait([future for future, *_ in executor._pending])
+        self.root.run_pending()  # Runs the executor poll and the heartbeat
+        executor.shutdown()
+
+        report = self.profiler.report()
+        label = fetch_rows.__qualname__
+        self.assertEqual(results, [[1, 2]])
+        self.assertGreaterEqual(report['database_workers'][label]['total_ms'], 10)
+        self.assertEqual(report['tk_thread'][f'{label} -> on_success']['calls'], 1)
+
+    def test_late_heartbeat_is_a_stall(self):
+        self.profiler._last_beat = time.perf_counter() - 0.4  # The loop was blocked for ~350 ms
+
+        self.profiler._heartbeat()
+
+        stalls = self.profiler.report()['event_loop_stalls']
+        self.assertEqual(stalls['count'], 1)
+        self.assertGreaterEqual(stalls['longest'][0]['lateness_ms'], 300)
+
+    def test_write_report(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'report.json')
+            self.profiler.write_report(path)
+            with open(path, encoding='utf-8') as report_file:
+                report = json.load(report_file)
+
+        self.assertEqual(set(report), {'session_seconds', 'tk_thread', 'database_workers',
+                                       'event_loop_stalls', 'queries'})
+
+    def test_summarize_durations(self):
+        summary = summarize_durations([0.002, 0.001, 0.003])
+        self.assertEqual((summary['calls'], summary['total_ms'], summary['max_ms']), (3, 6.0, 3.0))
+        self.assertEqual(summarize_durations([])['calls'], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,166 @@
+import http.client
+import json
+import threading
+import unittest
+from unittest.mock import MagicMock
+
+from crud_operations.exceptions import DatabaseOperationError, StudentNotFoundError
+from crud_operations.update_student import UpdateStudent
+from crud_operations.update_student_attribute import UpdateStudentAttribute
+from http_api.load_test import percentile
+from http_api.server import StudentAPIServer
+
+STUDENT = (1, 'Na Stia', 'Hannover', 21, '1234567890')
+
+
+class TestStudentAPIServer(unittest.TestCase):
+    """Unit test case for the HTTP API, with the service objects mocked."""
+
+    def setUp(self):
+        self.server = StudentAPIServer(('127.0.0.1', 0), MagicMock(), 'test_table', workers=2)
+        for name in ('adder', 'reader', 'searcher', 'updater', 'attribute_updater', 'deleter', 'statistics'):
+            setattr(self.server, name, MagicMock())
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+        self.connection = http.client.HTTPConnection('127.0.0.1', self.server.server_port, timeout=5)
+
+    def tearDown(self):
+        self.connection.close()
+        self.server.shutdown()
+        self.server.server_close()
+
+    def request(self, method, path, body=None):
+        self.connection.request(method, path, body=json.dumps(body) if body is not None else None)
+        response = self.connection.getresponse()
+        return response.status, response.read()
+
+    def test_list_students_pages_on_one_connection(self):
+        self.server.reader.fetch_page.side_effect = [[STUDENT], []]
+
+        status, body = self.request('GET', '/students?limit=1')
+        self.assertEqual(status, 200)
+        self.assertEqual(json.loads(body), {'students': [dict(zip(('id', 'name', 'address', 'age', 'number'),
+                                                                      STUDENT))],
+                                            'next_after_id': 1})
+
+        # The second request reuses the kept-alive connection
+        status, body = self.request('GET', '/students?after_id=1&limit=1')
+        self.assertEqual(json.loads(body)['next_after_id'], None)
+        self.assertEqual(self.server.reader.fetch_page.call_args.args, (1, 1))
+
+    def test_list_students_rejects_invalid_pages(self):
+        for path in ('/students?limit=0', '/students?limit=-5', '/students?after_id=-1'):
+            with self.subTest(path=path):
+                status, body = self.request('GET', path)
+
+                self.assertEqual(status, 400)
+                self.assertIn('error', json.loads(body))
+        self.server.reader.fetch_page.assert_not_called()
+
+    def test_list_students_with_filters_searches(self):
+        self.server.searcher.search.return_value = []
+
+        status, _ = self.request('GET', '/students?name=Na&min_age=18')
+
+        self.assertEqual(status, 200)
+        kwargs = self.server.searcher.search.call_args.kwargs
+        self.assertEqual((kwargs['name_prefix'], kwargs['min_age']), ('Na', 18))
+        self.server.reader.fetch_page.assert_not_called()
+
+    def test_statistics(self):
+        self.server.statistics.compute.return_value = {'count': 0}
+
+        status, body = self.request('GET', '/students/statistics?age_bucket=10&top=5')
+
+        self.assertEqual(status, 200)
+        self.assertEqual(json.loads(body), {'count': 0})
+        self.server.statistics.compute.assert_called_once_with(10, 5)
+
+    def test_add_student(self):
+        self.server.adder.add_student.return_value = STUDENT
+
+        status, body = self.request('POST', '/students', {'name': 'Na Stia', 'address': 'Hannover',
+                                                          'age': 21, 'number': '1234567890'})
+
+        self.assertEqual(status, 201)
+        self.assertEqual(json.loads(body)['id'], 1)
+        self.server.adder.add_student.assert_called_once_with('Na Stia', 'Hannover', 21, '1234567890')
+
+    def test_errors_map_to_status_codes(self):
+        self.server.attribute_updater.update_student_field.side_effect = StudentNotFoundError(9)
+        self.server.deleter.delete_student.side_effect = DatabaseOperationError('Connection lost')
+
+        status, body = self.request('PATCH', '/students/9', {'field': 'age', 'value': 30})
+        self.assertEqual(status, 404)
+        self.assertEqual(json.loads(body)['error'], 'Student with ID 9 not found.')
+
+        status, _ = self.request('DELETE', '/students/9')
+        self.assertEqual(status, 503)
+
+        status, _ = self.request('POST', '/students/batch-delete', {'ids': 'all'})
+        self.assertEqual(status, 400)
+
+        status, _ = self.request('PUT', '/students')
+        self.assertEqual(status, 405)
+
+    def test_batch_update(self):
+        self.server.attribute_updater.update_students_fields.return_value = {
+            'matched': 1, 'unmatched': 0, 'unmatched_ids': []}
+
+        status, _ = self.request('POST', '/students/batch-update',
+                                 {'updates': [{'id': 1, 'field': 'age', 'value': 22}]})
+
+        self.assertEqual(status, 200)
+        self.server.attribute_updater.update_students_fields.assert_called_once_with([(1, 'age', 22)])
+
+    def test_stream_students_is_chunked(self):
+        self.server.reader.stream_records.return_value = iter([STUDENT, (2, 'Se Honc', 'Hamburg', 22, '0987654321')])
+
+        self.connection.request('GET', '/students/stream')
+        response = self.connection.getresponse()
+        lines = response.read().decode().splitlines()
+
+        self.assertEqual(response.getheader('Transfer-Encoding'), 'chunked')
+        self.assertEqual([json.loads(line)['id'] for line in lines], [1, 2])
+
+    def test_stream_error_ends_the_body(self):
+        def rows():
+            yield STUDENT
+            raise DatabaseOperationError('Failed to stream records: connection lost')
+        self.server.reader.stream_records.return_value = rows()
+
+        self.connection.request('GET', '/students/stream')
+        response = self.connection.getresponse()
+        lines = [json.loads(line) for line in response.read().decode().splitlines()]
+
+        # The chunked body is terminated, so the client reads the error instead of a truncated stream
+        self.assertEqual(lines[0]['id'], 1)
+        self.assertEqual(lines[-1]['error'], 'Failed to stream records: connection lost')
+
+        # The kept-alive connection can still be used
+        status, _ = self.request('GET', '/students/stats')
+        self.assertEqual(status, 404)
+
+    def test_invalid_updates_are_bad_requests(self):
+        # The real service classes validate the values before any statement is sent
+        self.server.updater = UpdateStudent(MagicMock(), 'test_table')
+        self.server.attribute_updater = UpdateStudentAttribute(MagicMock(), 'test_table')
+
+        for body in ({'address': 'Hannover', 'age': 21, 'number': '1234567890'},
+                     {'name': 'Na Stia', 'address': 'Hannover', 'age': 'old', 'number': '1234567890'},
+                     {'name': 'Na Stia', 'address': 'Hannover', 'age': -1, 'number': '1234567890'}):
+            status, _ = self.request('PUT', '/students/1', body)
+            self.assertEqual(status, 400)
+
+        status, body = self.request('PATCH', '/students/1', {'field': 'age', 'value': 'old'})
+        self.assertEqual(status, 400)
+        self.assertEqual(json.loads(body)['title'], 'Invalid Age')
+
+    def test_percentile(self):
+        self.assertEqual(percentile([1, 2, 3, 4], 0.5), 2)
+        self.assertEqual(percentile([1, 2, 3, 4], 0.99), 4)
+        self.assertEqual(percentile([], 0.5), 0.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
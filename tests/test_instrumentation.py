@@ -0,0 +1,66 @@
+import sys
+import unittest
+from unittest.mock import MagicMock, patch
+
+from crud_operations.add_student import AddStudent
+from crud_operations.instrumentation import QueryStats, calling_operation
+from crud_operations.prepared_statements import prepared_statements
+
+
+class TestQueryStats(unittest.TestCase):
+    """Unit test case for the per-operation statement statistics."""
+
+    def setUp(self):
+        self.stats = QueryStats(slow_query_ms=100)
+
+    def test_record_aggregates_per_operation(self):
+        self.stats.record('AddStudent.add_student', 'INSERT ...', 0.0015, rows=1)
+        self.stats.record('AddStudent.add_student', 'INSERT ...', 0.030, rows=1, error=Exception('boom'))
+        self.stats.record('DeleteStudent.delete_students', 'DELETE ...', 0.004, rows=20)
+
+        snapshot = self.stats.snapshot()
+        add = snapshot['AddStudent.add_student']
+        self.assertEqual((add['calls'], add['errors'], add['rows'], add['round_trips']), (2, 1, 2, 2))
+        self.assertEqual(add['max_ms'], 30.0)
+        self.assertEqual(add['histogram']['<=2ms'], 1)
+        self.assertEqual(add['histogram']['<=50ms'], 1)
+        self.assertEqual(snapshot['DeleteStudent.delete_students']['rows'], 20)
+
+    @patch('crud_operations.instrumentation.slow_query_logger')
+    def test_slow_statements_are_logged(self, mock_logger):
+        statement = MagicMock(return_value='SELECT * FROM   students')
+
+        self.stats.record('StudentDataReader.fetch_records', statement, 0.050)
+        statement.assert_not_called()  # Fast statements are never rendered
+        mock_logger.warning.assert_not_called()
+
+        self.stats.record('StudentDataReader.fetch_records', statement, 0.250, rows=5000)
+        message = mock_logger.warning.call_args.args[0]
+        self.assertIn('Slow query in StudentDataReader.fetch_records: 250.0 ms, 5000 rows', message)
+        self.assertTrue(message.endswith('SELECT * FROM students'))
+
+    def test_listeners_receive_statements(self):
+        listener = MagicMock()
+        self.stats.add_listener(listener)
+
+        self.stats.record('op', lambda: 'SELECT 1', 0.001, rows=1)
+        self.stats.remove_listener(listener)
+        self.stats.record('op', 'SELECT 1', 0.001)
+
+        listener.assert_called_once_with('op', 'SELECT 1', 0.001, 1, 1, None)
+
+    @patch.object(prepared_statements, 'enabled', False)
+    def test_calling_operation_names_the_crud_method(self):
+        operations = []
+        mock_connection = MagicMock()
+        mock_cursor = mock_connection.cursor.return_value
+        mock_cursor.execute.side_effect = lambda *args: operations.append(calling_operation(sys._getframe(1)))
+
+        AddStudent(mock_connection).add_student('Na Stia', 'Hannover', 21, '1234567890')
+
+        self.assertEqual(operations, ['AddStudent.add_student'])
+        self.assertIsNone(calling_operation(sys._getframe()))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,121 @@
+import unittest
+from unittest.mock import MagicMock, patch
+
+from psycopg2 import errors, sql
+
+from crud_operations.exceptions import DatabaseOperationError
+from crud_operations.migrations import MIGRATIONS, Migration, SchemaMigrator
+
+
+class TestSchemaMigrator(unittest.TestCase):
+    """Unit test case for the versioned schema migrations."""
+
+    def setUp(self):
+        self.mock_connection = MagicMock()
+        self.mock_cursor = MagicMock()
+        self.mock_connection.cursor.return_value.__enter__.return_value = self.mock_cursor
+        self.recorded = []  # Rows of the metadata table, None if it does not exist
+        self.statements = []
+        self.mock_cursor.execute.side_effect = self.execute
+        self.mock_cursor.fetchall.side_effect = lambda: list(self.recorded)
+        self.migrations = (
+            Migration(1, 'Create', lambda table: sql.SQL('CREATE {table}').format(table=sql.Identifier(table))),
+            Migration(2, 'Index', lambda table: sql.SQL('INDEX {table}').format(table=sql.Identifier(table))),
+            Migration(3, 'Extension', lambda table: sql.SQL('EXTENSION'), optional=True),
+        )
+        self.migrator = SchemaMigrator(self.mock_connection, 'test_table', self.migrations)
+
+    def execute(self, query, params=None):
+        self.statements.append((query, params))
+        if self.recorded is None and 'SELECT version' in repr(query):
+            raise errors.UndefinedTable('relation "schema_migrations" does not exist')
+
+    def executed(self, query):
+        return [params for statement, params in self.statements if statement == query]
+
+    def test_up_to_date_table_sends_no_ddl(self):
+        self.recorded = [(1, 'applied', None), (2, 'applied', None), (3, 'skipped', None)]
+
+        result = self.migrator.migrate()
+
+        self.assertEqual(result, {'applied': [], 'skipped': []})
+        self.assertEqual(len(self.statements), 1)  # Only the SELECT of the recorded versions
+        self.assertIn('SELECT version', repr(self.statements[0][0]))
+
+    def test_pending_migrations_are_applied_in_order_and_recorded(self):
+        self.recorded = [(1, 'applied', None), (3, 'skipped', None)]
+
+        with patch('builtins.print'):
+            result = self.migrator.migrate()
+
+        self.assertEqual(result, {'applied': [2], 'skipped': []})
+        self.assertEqual(self.executed(sql.SQL('CREATE {table}').format(table=sql.Identifier('test_table'))), [])
+        self.assertEqual(len(self.executed(self.migrations[1].build('test_table'))), 1)
+        inserts = [params for statement, params in self.statements if 'INSERT INTO' in repr(statement)]
+        self.assertEqual(inserts, [('test_table', 2, 'Index', 'applied')])
+
+        # The advisory lock is released again
+        self.assertEqual(len(self.executed('SELECT pg_advisory_lock(hashtext(%s))')), 1)
+        self.assertEqual(len(self.executed('SELECT pg_advisory_unlock(hashtext(%s))')), 1)
+
+    def test_new_database_applies_every_migration(self):
+        self.recorded = None
+
+        with patch('builtins.print'):
+            result = self.migrator.migrate()
+
+        self.assertEqual(result, {'applied': [1, 2, 3], 'skipped': []})
+        self.mock_connection.rollback.assert_called()  # Ends the transaction of the failed SELECT
+
+        # Clients starting together on a new database do not race to create the metadata table
+        statements = [repr(statement) for statement, _ in self.statements]
+        lock = statements.index(repr('SELECT pg_advisory_lock(hashtext(%s))'))
+        create = next(i for i, statement in enumerate(statements) if 'CREATE TABLE IF NOT EXISTS' in statement)
+        self.assertLess(lock, create)
+
+    def test_failed_optional_migration_is_skipped(self):
+        original = self.execute
+
+        def execute(query, params=None):
+            original(query, params)
+            if query == sql.SQL('EXTENSION'):
+                raise errors.InsufficientPrivilege('permission denied to create extension "pg_trgm"')
+        self.mock_cursor.execute.side_effect = execute
+
+        with patch('builtins.print'):
+            result = self.migrator.migrate()
+
+        self.assertEqual(result, {'applied': [1, 2], 'skipped': [3]})
+
+    def test_failed_required_migration_raises_and_unlocks(self):
+        original = self.execute
+
+        def execute(query, params=None):
+            original(query, params)
+            if 'INDEX' in repr(query):
+                raise errors.DuplicateTable('relation already exists')
+        self.mock_cursor.execute.side_effect = execute
+
+        with patch('builtins.print'), self.assertRaises(DatabaseOperationError):
+            self.migrator.migrate()
+
+        inserts = [params for statement, params in self.statements if 'INSERT INTO' in repr(statement)]
+        self.assertEqual(inserts, [('test_table', 1, 'Create', 'applied')])
+        self.assertEqual(len(self.executed('SELECT pg_advisory_unlock(hashtext(%s))')), 1)
+
+    def test_status_lists_pending_migrations(self):
+        self.recorded = [(1, 'applied', '2026-01-01')]
+
+        status = self.migrator.status()
+
+        self.assertEqual([(migration['version'], migration['status']) for migration in status],
+                         [(1, 'applied'), (2, 'pending'), (3, 'pending')])
+
+    def test_versions_must_increase(self):
+        with self.assertRaises(ValueError):
+            SchemaMigrator(self.mock_connection, 'test_table', tuple(reversed(self.migrations)))
+        self.assertEqual([migration.version for migration in MIGRATIONS], [1, 2, 3, 4, 5])
+
+
+if __name__ == '__main__':
+    unittest.main()
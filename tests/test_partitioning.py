@@ -0,0 +1,143 @@
+import unittest
+from unittest.mock import MagicMock, patch
+
+from psycopg2 import sql
+
+from crud_operations.create_student_table import CreateStudent
+from crud_operations.exceptions import DatabaseOperationError
+from crud_operations.migrations import PARTITIONED_MIGRATIONS
+from crud_operations.partitioning import PartitionManager, parse_partition_bound
+
+
+class TestPartitionManager(unittest.TestCase):
+    """Unit test case for the ID range partitions of the student table."""
+
+    def setUp(self):
+        self.mock_connection = MagicMock()
+        self.mock_cursor = MagicMock()
+        self.mock_connection.cursor.return_value.__enter__.return_value = self.mock_cursor
+        self.manager = PartitionManager(self.mock_connection, 'test_table', partition_size=1000)
+        self.partition_rows = [
+            ('test_table_default', 'DEFAULT', 0),
+            ('test_table_p000001', 'FOR VALUES FROM (1000) TO (2000)', 950),
+            ('test_table_p000000', 'FOR VALUES FROM (0) TO (1000)', 999),
+        ]
+        self.mock_cursor.fetchall.return_value = self.partition_rows
+
+    def executed_sql(self):
+        return [call.args[0] for call in self.mock_cursor.execute.call_args_list]
+
+    def test_parse_partition_bound(self):
+        self.assertEqual(parse_partition_bound('FOR VALUES FROM (0) TO (1000000)'), (0, 1000000))
+        self.assertEqual(parse_partition_bound("FOR VALUES FROM ('5') TO ('10')"), (5, 10))
+        self.assertEqual(parse_partition_bound('DEFAULT'), (None, None))
+
+    def test_partitions_are_sorted_with_default_last(self):
+        partitions = self.manager.partitions()
+
+        self.assertEqual([partition['name'] for partition in partitions],
+                         ['test_table_p000000', 'test_table_p000001', 'test_table_default'])
+        self.assertEqual((partitions[1]['lower'], partitions[1]['upper']), (1000, 2000))
+
+    def test_ensure_partitions_creates_partitions_above_the_highest(self):
+        # Partitioned table, last ID handed out is 1500, no rows in the default partition
+        self.mock_cursor.fetchone.side_effect = [('p',), (1500,), (False,), (False,)]
+
+        created = self.manager.ensure_partitions(ahead=2)
+
+        # Partitions 2 and 3 are kept ready beyond partition 1, which holds ID 1500
+        self.assertEqual(created, ['test_table_p000002', 'test_table_p000003'])
+        create_statements = [statement for statement in self.executed_sql()
+                             if isinstance(statement, sql.Composed) and 'PARTITION OF' in repr(statement)]
+        self.assertEqual(len(create_statements), 2)
+        self.assertIn(sql.Literal(2000), create_statements[0])
+        self.assertIn(sql.Literal(3000), create_statements[0])
+        self.mock_connection.commit.assert_called_once()
+
+    def test_ensure_partitions_moves_rows_out_of_the_default_partition(self):
+        # IDs 2000-2499 were inserted while no partition covered them
+        self.mock_cursor.fetchone.side_effect = [('p',), (2499,), (True,), (False,)]
+
+        created = self.manager.ensure_partitions(ahead=1)
+
+        self.assertEqual(created, ['test_table_p000002', 'test_table_p000003'])
+        statements = [repr(statement) for statement in self.executed_sql() if isinstance(statement, sql.Composed)]
+        moved = [statement for statement in statements if 'ATTACH PARTITION' in statement]
+        self.assertEqual(len(moved), 1)
+        self.assertIn("Identifier('test_table_default')", moved[0])
+        self.assertIn("Identifier('test_table_p000002')", moved[0])
+        self.assertEqual(len([statement for statement in statements if 'PARTITION OF' in statement]), 1)
+        self.mock_connection.commit.assert_called_once()
+
+    def test_ensure_partitions_skips_handed_out_ranges(self):
+        # Partitions 0 and 1 were purged; every ID below 2500 has been handed out
+        self.mock_cursor.fetchall.return_value = [('test_table_default', 'DEFAULT', 0)]
+        self.mock_cursor.fetchone.side_effect = [('p',), (2499,), (False,), (False,), (False,), (False,)]
+
+        created = self.manager.ensure_partitions(ahead=1)
+
+        # The ranges 0 and 1 are not created again
+        self.assertEqual(created, ['test_table_p000002', 'test_table_p000003'])
+
+    def test_ensure_partitions_requires_a_partitioned_table(self):
+        self.mock_cursor.fetchone.side_effect = [('r',)]
+
+        with self.assertRaises(DatabaseOperationError) as context:
+            self.manager.ensure_partitions()
+
+        self.assertIn('convert', str(context.exception))
+        self.mock_connection.commit.assert_not_called()
+
+    def test_purge_range_drops_covered_partitions(self):
+        self.mock_cursor.rowcount = 12
+        cache = MagicMock()
+        self.manager.cache = cache
+
+        result = self.manager.purge_range(0, 1499)
+
+        # Partition 0 is dropped whole, the rows 1000-1499 of partition 1 are deleted
+        self.assertEqual(result, {'dropped_partitions': ['test_table_p000000'], 'deleted_rows': 12})
+        statements = self.executed_sql()
+        self.assertIn(sql.SQL('DROP TABLE {partition}').format(partition=sql.Identifier('test_table_p000000')),
+                      statements)
+        # Dropping a partition fires no trigger, so the listeners are told to reload
+        self.mock_cursor.execute.assert_any_call('SELECT pg_notify(%s, %s)',
+                                                 ('test_table_changes', '{"op": "RELOAD"}'))
+        self.mock_cursor.execute.assert_called_with(
+            sql.SQL('DELETE FROM {table_name} WHERE id BETWEEN %s AND %s').format(
+                table_name=sql.Identifier('test_table')), (0, 1499))
+        self.mock_connection.commit.assert_called_once()
+        cache.clear.assert_called_once()
+
+    def test_partition_size_must_be_positive(self):
+        with self.assertRaises(ValueError):
+            PartitionManager(self.mock_connection, 'test_table', partition_size=0)
+
+
+class TestCreatePartitionedStudentTable(unittest.TestCase):
+    """Unit test case for creating the student table with a partitioned layout."""
+
+    @patch('crud_operations.create_student_table.PartitionManager')
+    @patch('crud_operations.create_student_table.SchemaMigrator')
+    def test_partitioned_layout_uses_partitioned_migrations(self, mock_migrator, mock_manager):
+        mock_migrator.return_value.migrate.return_value = {'applied': [], 'skipped': []}
+        connection = MagicMock()
+
+        CreateStudent(connection, 'test_table', partition_size=1000).create_student_table()
+
+        mock_migrator.assert_called_once_with(connection, 'test_table', PARTITIONED_MIGRATIONS)
+        mock_manager.assert_called_once_with(connection, 'test_table', 1000)
+        mock_manager.return_value.ensure_partitions.assert_called_once()
+
+    @patch('crud_operations.create_student_table.PartitionManager')
+    @patch('crud_operations.create_student_table.SchemaMigrator')
+    def test_unpartitioned_layout_creates_no_partitions(self, mock_migrator, mock_manager):
+        mock_migrator.return_value.migrate.return_value = {'applied': [], 'skipped': []}
+
+        CreateStudent(MagicMock(), 'test_table', partition_size=0).create_student_table()
+
+        mock_manager.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,101 @@
+import unittest
+from unittest.mock import MagicMock, call, patch
+
+from psycopg2 import errors, sql
+
+from crud_operations.delete_student import DeleteStudent
+from crud_operations.prepared_statements import StatementRegistry, count_placeholders, prepared_statements
+
+
+def quote_ident(name, context):
+    """Quote identifiers without the server connection ``psycopg2.extensions.quote_ident`` needs."""
+    return '"' + name.replace('"', '""') + '"'
+
+
+@patch('psycopg2.sql.ext.quote_ident', quote_ident)
+class TestStatementRegistry(unittest.TestCase):
+    """Unit test case for the registry preparing the hot statements once per connection."""
+
+    def setUp(self):
+        self.registry = StatementRegistry(enabled=True)
+        self.build = MagicMock(side_effect=lambda: sql.SQL(
+            'UPDATE {table_name} SET age = %s WHERE id = %s AND name LIKE \'a%%\'').format(
+            table_name=sql.Identifier('test_table')))
+
+    def test_statement_is_composed_once_per_key(self):
+        first = self.registry.statement(('update_age', 'test_table'), self.build)
+        second = self.registry.statement(('update_age', 'test_table'), self.build)
+        other_table = self.registry.statement(('update_age', 'other_table'), self.build)
+
+        self.assertIs(first, second)
+        self.assertNotEqual(first.name, other_table.name)
+        self.assertEqual(self.build.call_count, 2)
+        self.assertEqual(first.param_count, 2)
+
+    def test_statement_is_prepared_once_per_connection(self):
+        statement = self.registry.statement(('update_age', 'test_table'), self.build)
+        cursor = MagicMock()
+
+        self.registry.execute(cursor, statement, (21, 1))
+        self.registry.execute(cursor, statement, (22, 2))
+
+        name = statement.name
+        self.assertEqual(cursor.execute.call_args_list, [
+            call(f'PREPARE {name} AS UPDATE "test_table" SET age = $1 WHERE id = $2 AND name LIKE \'a%\''),
+            call(f'EXECUTE {name} (%s, %s)', (21, 1)),
+            call(f'EXECUTE {name} (%s, %s)', (22, 2)),
+        ])
+        self.assertEqual(self.registry.prepared_names(cursor.connection), {name})
+
+        # Another connection prepares the statement again
+        other_cursor = MagicMock()
+        self.registry.execute(other_cursor, statement, (23, 3))
+        self.assertEqual(other_cursor.execute.call_count, 2)
+
+    def test_lost_statements_are_prepared_again(self):
+        statement = self.registry.statement(('update_age', 'test_table'), self.build)
+        cursor = MagicMock()
+        self.registry.execute(cursor, statement, (21, 1))
+
+        cursor.execute.side_effect = errors.InvalidSqlStatementName('prepared statement does not exist')
+        with self.assertRaises(errors.InvalidSqlStatementName):
+            self.registry.execute(cursor, statement, (22, 2))
+        self.assertEqual(self.registry.prepared_names(cursor.connection), set())
+
+        cursor.execute.reset_mock(side_effect=True)
+        self.registry.execute(cursor, statement, (22, 2))
+        self.assertTrue(cursor.execute.call_args_list[0].args[0].startswith('PREPARE'))
+
+    def test_disabled_registry_executes_the_composed_statement(self):
+        self.registry.enabled = False
+        statement = self.registry.statement(('update_age', 'test_table'), self.build)
+        cursor = MagicMock()
+
+        self.registry.execute(cursor, statement, (21, 1))
+
+        cursor.execute.assert_called_once_with(statement.query, (21, 1))
+
+    def test_crud_class_executes_prepared_statement(self):
+        mock_connection = MagicMock()
+        mock_cursor = mock_connection.cursor.return_value.__enter__.return_value
+        mock_cursor.connection = mock_connection
+        mock_cursor.fetchone.return_value = (7,)
+
+        with patch.object(prepared_statements, 'enabled', True):
+            deleter = DeleteStudent(mock_connection, 'test_table')
+            self.assertTrue(deleter.delete_student(7))
+            self.assertTrue(deleter.delete_student(8))
+
+        prepare, *executes = [args.args[0] for args in mock_cursor.execute.call_args_list]
+        self.assertTrue(prepare.startswith('PREPARE delete_student_'))
+        self.assertIn('DELETE FROM "test_table"', prepare)
+        self.assertEqual(len(executes), 2)
+        self.assertTrue(all(statement.startswith('EXECUTE delete_student_') for statement in executes))
+
+    def test_count_placeholders(self):
+        self.assertEqual(count_placeholders(self.build()), 2)
+        self.assertEqual(count_placeholders(sql.SQL('SELECT 1')), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
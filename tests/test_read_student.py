@@ -2,7 +2,9 @@ import unittest
 from unittest.mock import MagicMock, patch
 
 import psycopg2
+from psycopg2 import sql
 
+from crud_operations.exceptions import DatabaseOperationError
 from crud_operations.read_student_data import StudentDataReader
 
 
@@ -45,18 +47,16 @@ class TestStudentDataReader(unittest.TestCase):
 
         self.assertEqual(records, mock_data)
 
-    @patch('tkinter.messagebox.showerror')
-    def test_fetch_records_database_error(self, mock_showerror):
+    def test_fetch_records_database_error(self):
         # Simulate a database error by raising a DatabaseError exception
         self.mock_cursor.execute.side_effect = psycopg2.DatabaseError('Mocked database error')
 
-        records = self.reader.fetch_records()
-
-        # Verify that the showerror method was called with the correct error message
-        mock_showerror.assert_called_once_with('Database Error', 'Failed to fetch records: Mocked database error')
+        # Verify that the error is raised with the correct message
+        with self.assertRaises(DatabaseOperationError) as context:
+            self.reader.fetch_records()
 
-        # Verify that no records are returned
-        self.assertEqual(records, [])
+        self.assertEqual(str(context.exception), 'Failed to fetch records: Mocked database error')
+        self.mock_connection.rollback.assert_called_once()
 
     def tearDown(self):
         """
@@ -65,3 +65,110 @@ class TestStudentDataReader(unittest.TestCase):
         """
         # Verify that the cursor's close method was called
         self.mock_cursor.close.assert_called_once()
+
+
+class TestStudentDataReaderPagination(unittest.TestCase):
+    """Unit test case for the keyset pagination of StudentDataReader."""
+
+    def setUp(self):
+        self.mock_connection = MagicMock()
+        self.mock_cursor = MagicMock()
+        self.mock_connection.cursor.return_value.__enter__.return_value = self.mock_cursor
+        self.reader = StudentDataReader(self.mock_connection, 'test_table')
+
+    def test_fetch_page_success(self):
+        mock_data = [(11, 'Na Stia', 'Hannover', 21, '1234567890')]
+        self.mock_cursor.fetchall.return_value = mock_data
+
+        records = self.reader.fetch_page(after_id=10, limit=5)
+
+        expected_query = sql.SQL("""
+            SELECT id, name, address, age, number FROM {table_name}
+            WHERE id > %s
+            ORDER BY id
+            LIMIT %s
+        """).format(table_name=sql.Identifier('test_table'))
+
+        # Verify that the keyset query was executed with the last seen ID and page size
+        self.mock_cursor.execute.assert_called_once_with(expected_query, (10, 5))
+        self.assertEqual(records, mock_data)
+
+    def test_fetch_page_before(self):
+        self.mock_cursor.fetchall.return_value = [(8, 'Na Stia', 'Hannover', 21, '1234567890')]
+
+        records = self.reader.fetch_page_before(before_id=10, limit=5)
+
+        # The rows are read backwards from the first ID of the following page
+        query, params = self.mock_cursor.execute.call_args.args
+        self.assertIn('id < %s', repr(query))
+        self.assertIn('ORDER BY id DESC', repr(query))
+        self.assertEqual(params, (10, 5))
+        self.assertEqual(records, [(8, 'Na Stia', 'Hannover', 21, '1234567890')])
+
+    def test_fetch_page_database_error(self):
+        self.mock_cursor.execute.side_effect = psycopg2.DatabaseError('Mocked database error')
+
+        with self.assertRaises(DatabaseOperationError) as context:
+            self.reader.fetch_page()
+
+        self.assertEqual(str(context.exception), 'Failed to fetch records: Mocked database error')
+        self.mock_connection.rollback.assert_called_once()
+
+    def test_stream_records_uses_named_cursor(self):
+        mock_data = [(1, 'Na Stia', 'Hannover', 21, '1234567890'),
+                     (2, 'Se Honc', 'Hamburg', 22, '0987654321')]
+        named_cursor = MagicMock()
+        named_cursor.__iter__.return_value = iter(mock_data)
+        self.mock_connection.cursor.return_value = named_cursor
+        calls = self.record_transaction_calls(named_cursor)
+
+        records = list(self.reader.stream_records(itersize=500))
+
+        # Verify that a server-side cursor was requested and configured
+        self.mock_connection.cursor.assert_called_once()
+        self.assertTrue(self.mock_connection.cursor.call_args.kwargs['name'].startswith('test_table_stream_'))
+        self.assertEqual(named_cursor.itersize, 500)
+        self.assertEqual(records, mock_data)
+        self.mock_connection.commit.assert_called_once()
+        named_cursor.close.assert_called_once()
+        # The named cursor is no longer valid once the transaction has ended
+        self.assertEqual(calls, ['close', 'commit'])
+
+    def test_stream_records_stopped_early(self):
+        named_cursor = MagicMock()
+        named_cursor.__iter__.return_value = iter([(1,), (2,), (3,)])
+        self.mock_connection.cursor.return_value = named_cursor
+        calls = self.record_transaction_calls(named_cursor)
+
+        stream = self.reader.stream_records()
+        next(stream)
+        stream.close()
+
+        # Verify that the transaction holding the cursor was ended and the cursor closed
+        self.mock_connection.rollback.assert_called_once()
+        self.mock_connection.commit.assert_not_called()
+        named_cursor.close.assert_called_once()
+        self.assertEqual(calls, ['close', 'rollback'])
+
+    def test_stream_records_execute_error(self):
+        named_cursor = MagicMock()
+        named_cursor.execute.side_effect = psycopg2.OperationalError('statement timeout')
+        # Closing a named cursor in an aborted transaction fails as well
+        named_cursor.close.side_effect = psycopg2.InternalError('current transaction is aborted')
+        self.mock_connection.cursor.return_value = named_cursor
+
+        with self.assertRaises(DatabaseOperationError) as context:
+            list(self.reader.stream_records())
+
+        # The error that aborted the transaction is reported, not the one from closing the cursor
+        self.assertEqual(str(context.exception), 'Failed to stream records: statement timeout')
+        self.mock_connection.rollback.assert_called_once()
+        self.mock_connection.commit.assert_not_called()
+
+    def record_transaction_calls(self, named_cursor):
+        """Record the order in which the named cursor is closed and the transaction ended."""
+        calls = []
+        named_cursor.close.side_effect = lambda: calls.append('close')
+        self.mock_connection.commit.side_effect = lambda: calls.append('commit')
+        self.mock_connection.rollback.side_effect = lambda: calls.append('rollback')
+        return calls
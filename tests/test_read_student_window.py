@@ -0,0 +1,126 @@
+import unittest
+from unittest.mock import MagicMock
+
+from crud_operations.student_cache import StudentCache
+from gui.read_student_window import ReadStudentWindow, diff_rows
+
+
+class TestDiffRows(unittest.TestCase):
+    """Unit test case for the diff applied when the student Treeview is refreshed."""
+
+    def setUp(self):
+        self.displayed = {
+            1: (1, 'Ann', 'Oslo', 20, '123'),
+            2: (2, 'Bob', 'Rome', 21, '456'),
+            3: (3, 'Cy', 'Lima', 22, '789'),
+        }
+
+    def test_unchanged_rows(self):
+        # Lists coming from the database compare equal to the displayed tuples
+        rows = [list(row) for row in self.displayed.values()]
+        self.assertEqual(diff_rows(self.displayed, rows), ([], [], []))
+
+    def test_added_changed_and_removed_rows(self):
+        rows = [
+            (1, 'Ann', 'Oslo', 20, '123'),
+            (2, 'Bob', 'Paris', 21, '456'),
+            (4, 'Di', 'Kyiv', 23, '000'),
+        ]
+        removed_ids, changed_rows, added_rows = diff_rows(self.displayed, rows)
+
+        self.assertEqual(removed_ids, [3])
+        self.assertEqual(changed_rows, [(2, 'Bob', 'Paris', 21, '456')])
+        self.assertEqual(added_rows, [(2, (4, 'Di', 'Kyiv', 23, '000'))])
+
+    def test_empty_result_removes_everything(self):
+        self.assertEqual(diff_rows(self.displayed, []), ([1, 2, 3], [], []))
+
+
+class TestChangeFeedUpdates(unittest.TestCase):
+    """Unit test case for the Treeview updates driven by the change feed, without a Tk window."""
+
+    def setUp(self):
+        self.window = ReadStudentWindow.__new__(ReadStudentWindow)
+        self.window.tree = MagicMock()
+        self.window.tree.insert.side_effect = lambda parent, index, iid, values: iid
+        self.window.reader = MagicMock(cache=StudentCache())
+        self.window.reload_loaded_rows = MagicMock()
+        self.window._items = {}
+        self.window._ids = []
+        for student_id in (2, 5, 9):
+            self.window.insert_row((student_id, 'Ann', 'Oslo', 20, '123'))
+        self.window.last_seen_id = 9
+
+    def test_insert_position_keeps_rows_ordered_by_id(self):
+        self.assertEqual(self.window.insert_position(6), 2)
+        self.assertEqual(self.window.insert_position(10), 'end')
+
+        self.window.insert_row((6, 'Bob', 'Rome', 21, '456'), 2)
+        self.window.delete_rows([2, 9])
+
+        self.assertEqual(self.window._ids, [5, 6])
+        self.assertEqual(self.window.insert_position(7), 2)
+
+    def test_reload_notification_reloads_the_view(self):
+        self.window.reader.cache.put((5, 'Ann', 'Oslo', 20, '123'))
+
+        self.window.apply_changes([('UPDATE', 5), ('RELOAD', None)])
+
+        self.window.reload_loaded_rows.assert_called_once()
+        self.assertIsNone(self.window.reader.cache.get(5))
+
+
+class TestRowEviction(unittest.TestCase):
+    """Unit test case for keeping only the pages around the view in the Treeview."""
+
+    def setUp(self):
+        self.window = ReadStudentWindow.__new__(ReadStudentWindow)
+        self.window.tree = MagicMock()
+        self.window.tree.insert.side_effect = lambda parent, index, iid, values: iid
+        self.window.tree.yview.return_value = (0.9, 1.0)
+        self.window.page_size = 2
+        self.window.MAX_LOADED_PAGES = 2
+        self.window._items = {}
+        self.window._ids = []
+        self.window._generation = 1
+        self.window._loading = True
+        self.window._search_filters = None
+        self.window.last_seen_id = 0
+        self.window.has_more = True
+        self.window.has_previous = False
+
+    @staticmethod
+    def rows(*student_ids):
+        return [(student_id, 'Ann', 'Oslo', 20, '123') for student_id in student_ids]
+
+    def test_rows_far_above_the_view_are_evicted(self):
+        for after_id, page in ((0, (1, 2)), (2, (3, 4)), (4, (5, 6))):
+            self.window._loading = True
+            self.window.on_page_loaded(1, after_id, self.rows(*page))
+
+        # Only two pages stay loaded; the first one is fetched again when scrolling back up
+        self.assertEqual(self.window._ids, [3, 4, 5, 6])
+        self.assertEqual(set(self.window._items), {3, 4, 5, 6})
+        self.assertTrue(self.window.has_previous)
+        self.window.tree.yview_moveto.assert_called()
+
+    def test_previous_page_evicts_rows_below_the_view(self):
+        self.window._loading = False
+        for row in self.rows(3, 4, 5, 6):
+            self.window.insert_row(row)
+        self.window.last_seen_id = 6
+        self.window.has_previous = True
+        self.window.tree.yview.return_value = (0.0, 0.5)
+
+        self.window._loading = True
+        self.window.on_previous_page_loaded(1, self.rows(1, 2))
+
+        self.assertEqual(self.window._ids, [1, 2, 3, 4])
+        self.assertEqual([call.args[1] for call in self.window.tree.insert.call_args_list[-2:]], [0, 1])
+        self.assertEqual(self.window.last_seen_id, 4)
+        self.assertTrue(self.window.has_more)
+        self.assertTrue(self.window.has_previous)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,66 @@
+import unittest
+from unittest.mock import MagicMock
+
+import psycopg2
+from psycopg2 import sql
+
+from crud_operations.exceptions import DatabaseOperationError
+from crud_operations.search_students import StudentSearch, escape_like
+
+
+class TestStudentSearch(unittest.TestCase):
+    """Unit test case for the StudentSearch class."""
+
+    def setUp(self):
+        self.mock_connection = MagicMock()
+        self.mock_cursor = MagicMock()
+        self.mock_connection.cursor.return_value.__enter__.return_value = self.mock_cursor
+
+        self.student_search = StudentSearch(self.mock_connection, 'test_table')
+
+    def expected_query(self, *conditions):
+        return sql.SQL("""
+            SELECT id, name, address, age, number FROM {table_name}
+            WHERE {conditions}
+            ORDER BY id
+            LIMIT %s
+        """).format(table_name=sql.Identifier('test_table'),
+                    conditions=sql.SQL(' AND ').join([sql.SQL(c) for c in conditions]))
+
+    def test_search_all_filters(self):
+        mock_data = [(1, 'Na Stia', 'Hannover', 21, '1234567890')]
+        self.mock_cursor.fetchall.return_value = mock_data
+
+        records = self.student_search.search(name_prefix='Na', address_contains='hann',
+                                             min_age=18, max_age=25, number='1234567890',
+                                             after_id=0, limit=50)
+
+        self.mock_cursor.execute.assert_called_once_with(
+            self.expected_query('id > %s', 'name ILIKE %s', 'address ILIKE %s',
+                                'age >= %s', 'age <= %s', 'number = %s'),
+            [0, 'Na%', '%hann%', 18, 25, '1234567890', 50])
+        self.assertEqual(records, mock_data)
+
+    def test_search_without_filters_pages_by_id(self):
+        self.student_search.search(after_id=200, limit=100)
+
+        self.mock_cursor.execute.assert_called_once_with(self.expected_query('id > %s'), [200, 100])
+
+    def test_search_before_id_reads_backwards(self):
+        self.student_search.search(name_prefix='Na', before_id=200, limit=100)
+
+        query, params = self.mock_cursor.execute.call_args.args
+        self.assertIn('ORDER BY id DESC', repr(query))
+        self.assertEqual(params, [0, 'Na%', 200, 100])
+
+    def test_escape_like(self):
+        self.assertEqual(escape_like('50%_off\\'), '50\\%\\_off\\\\')
+
+    def test_search_database_error(self):
+        self.mock_cursor.execute.side_effect = psycopg2.DatabaseError('Mocked database error')
+
+        with self.assertRaises(DatabaseOperationError) as context:
+            self.student_search.search(name_prefix='Na')
+
+        self.mock_connection.rollback.assert_called_once()
+        self.assertEqual(str(context.exception), 'Failed to search records: Mocked database error')
@@ -0,0 +1,24 @@
+import unittest
+
+from benchmarks.bench_startup import LAZY_MODULES, probe_startup, summarize_ms
+
+
+class TestStartup(unittest.TestCase):
+    """Unit test case for the lazy imports of main.py and the startup benchmark."""
+
+    def test_main_imports_windows_and_database_lazily(self):
+        # A fresh interpreter, so modules imported by other tests do not count
+        probe = probe_startup(window=False)
+
+        self.assertEqual(probe['eagerly_imported'], [])
+        self.assertGreater(probe['import_ms'], 0)
+        self.assertIsNone(probe['window_ms'])
+        self.assertIn('psycopg2', LAZY_MODULES)
+
+    def test_summarize_ms(self):
+        self.assertEqual(summarize_ms([30.0, 10.0, None, 20.0]), {'mean_ms': 20.0, 'p50_ms': 20.0, 'max_ms': 30.0})
+        self.assertIsNone(summarize_ms([None]))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,121 @@
+import unittest
+from unittest.mock import MagicMock, patch
+
+from crud_operations.read_student_data import StudentDataReader
+from crud_operations.prepared_statements import prepared_statements
+from crud_operations.student_cache import StudentCache
+from crud_operations.update_student_attribute import UpdateStudentAttribute
+
+
+class TestStudentCache(unittest.TestCase):
+    """Unit test case for the StudentCache class."""
+
+    def setUp(self):
+        self.cache = StudentCache(max_size=2, ttl=30)
+
+    def test_get_and_put(self):
+        self.assertIsNone(self.cache.get(1))
+
+        self.cache.put((1, 'Na Stia', 'Hannover', 21, '1234567890'))
+
+        self.assertEqual(self.cache.get(1), (1, 'Na Stia', 'Hannover', 21, '1234567890'))
+        self.assertEqual(self.cache.stats()['hits'], 1)
+        self.assertEqual(self.cache.stats()['misses'], 1)
+        self.assertEqual(self.cache.stats()['hit_rate'], 0.5)
+
+    def test_least_recently_used_row_is_evicted(self):
+        self.cache.put((1,))
+        self.cache.put((2,))
+        self.cache.get(1)  # Student 1 becomes the most recently used
+        self.cache.put((3,))
+
+        self.assertIsNone(self.cache.get(2))
+        self.assertEqual(self.cache.get(1), (1,))
+        self.assertEqual(self.cache.get(3), (3,))
+
+    @patch('crud_operations.student_cache.time.monotonic')
+    def test_entries_expire_after_ttl(self, mock_monotonic):
+        mock_monotonic.return_value = 100.0
+        self.cache.put((1,))
+
+        mock_monotonic.return_value = 131.0
+
+        self.assertIsNone(self.cache.get(1))
+
+    def test_change_invalidates_query_results(self):
+        version = self.cache.version
+        self.cache.put_query(('all',), [(1,), (2,)], version)
+        self.assertEqual(self.cache.get_query(('all',)), [(1,), (2,)])
+
+        self.cache.invalidate(2)
+
+        self.assertIsNone(self.cache.get_query(('all',)))
+        self.assertIsNone(self.cache.get(2))
+        self.assertEqual(self.cache.get(1), (1,))
+
+    def test_query_result_from_before_a_change_is_not_cached(self):
+        version = self.cache.version
+        self.cache.record_change()  # A change lands while the query is running
+
+        self.cache.put_query(('all',), [(1,)], version)
+
+        self.assertIsNone(self.cache.get_query(('all',)))
+
+    def test_rows_read_before_a_change_are_not_cached(self):
+        version = self.cache.version
+        self.cache.record_change((1, 'Na Stia', 'Berlin', 22, '1234567890'))  # Lands while the page is read
+
+        self.cache.put_query(('page', 0, 200), [(1, 'Na Stia', 'Hannover', 21, '1234567890')], version)
+        self.cache.put_many([(1, 'Na Stia', 'Hannover', 21, '1234567890')], version)
+        self.cache.put((1, 'Na Stia', 'Hannover', 21, '1234567890'), version)
+
+        self.assertEqual(self.cache.get(1), (1, 'Na Stia', 'Berlin', 22, '1234567890'))
+
+    def test_large_query_results_are_not_cached(self):
+        cache = StudentCache(max_query_rows=2)
+
+        cache.put_query(('all',), [(1,), (2,), (3,)], cache.version)
+
+        self.assertIsNone(cache.get_query(('all',)))
+        self.assertEqual(cache.stats()['rows'], 0)
+
+
+class TestCachedCrudOperations(unittest.TestCase):
+    """Unit test case for the CRUD classes reading through and invalidating the cache."""
+
+    def setUp(self):
+        # These tests check the composed SQL, so it is executed directly rather than through PREPARE
+        patcher = patch.object(prepared_statements, 'enabled', False)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.mock_connection = MagicMock()
+        self.mock_cursor = MagicMock()
+        self.mock_connection.cursor.return_value.__enter__.return_value = self.mock_cursor
+        self.cache = StudentCache()
+
+    def test_find_student_by_id_reads_through_cache(self):
+        updater = UpdateStudentAttribute(self.mock_connection, 'test_table', cache=self.cache)
+        self.mock_cursor.fetchone.return_value = (1, 'Na Stia', 'Hannover', 21, '1234567890')
+
+        first = updater.find_student_by_id(1)
+        second = updater.find_student_by_id(1)
+
+        # Only the first lookup reaches the database
+        self.mock_cursor.execute.assert_called_once()
+        self.assertEqual(first, second)
+
+    def test_update_replaces_cached_row_and_invalidates_pages(self):
+        reader = StudentDataReader(self.mock_connection, 'test_table', cache=self.cache)
+        updater = UpdateStudentAttribute(self.mock_connection, 'test_table', cache=self.cache)
+
+        self.mock_cursor.fetchall.return_value = [(1, 'Na Stia', 'Hannover', 21, '1234567890')]
+        reader.fetch_page()
+        reader.fetch_page()
+        self.assertEqual(self.mock_cursor.execute.call_count, 1)  # Second page read served locally
+
+        self.mock_cursor.fetchone.return_value = (1, 'Na Stia', 'Berlin', 21, '1234567890')
+        updater.update_student_field(1, 'address', 'Berlin')
+        self.assertEqual(self.cache.get(1), (1, 'Na Stia', 'Berlin', 21, '1234567890'))
+
+        reader.fetch_page()
+        self.assertEqual(self.mock_cursor.execute.call_count, 3)  # The page is fetched again
@@ -0,0 +1,75 @@
+import unittest
+from decimal import Decimal
+from unittest.mock import MagicMock
+
+import psycopg2
+
+from crud_operations.exceptions import DatabaseOperationError, ValidationError
+from crud_operations.student_statistics import StudentStatistics
+
+
+class TestStudentStatistics(unittest.TestCase):
+    """Unit test case for the StudentStatistics class."""
+
+    def setUp(self):
+        self.mock_connection = MagicMock()
+        self.mock_cursor = MagicMock()
+        self.mock_connection.cursor.return_value.__enter__.return_value = self.mock_cursor
+
+        self.student_statistics = StudentStatistics(self.mock_connection, 'test_table')
+
+    def test_compute(self):
+        self.mock_cursor.fetchone.return_value = (5, 18, 31, Decimal('22.4'), Decimal('4.6303'))
+        self.mock_cursor.fetchall.side_effect = [
+            [(15, 1), (20, 3), (30, 1)],
+            [('Hannover', 3, 2), ('Berlin', 2, 2)],
+            [('1234567890', 3, 1, Decimal('3'))],
+        ]
+
+        statistics = self.student_statistics.compute(age_bucket_width=5, top=10)
+
+        self.assertEqual(statistics, {
+            'count': 5,
+            'age': {'min': 18, 'max': 31, 'mean': 22.4, 'stddev': 4.63},
+            'age_histogram': [{'from': 15, 'to': 19, 'count': 1}, {'from': 20, 'to': 24, 'count': 3},
+                              {'from': 30, 'to': 34, 'count': 1}],
+            'cities': {'distinct': 2, 'top': [{'city': 'Hannover', 'count': 3}, {'city': 'Berlin', 'count': 2}]},
+            'duplicate_numbers': {'numbers': 1, 'students': 3, 'top': [{'number': '1234567890', 'count': 3}]},
+        })
+
+        # One snapshot for every query, and nothing but aggregates is fetched
+        statements = [args.args for args in self.mock_cursor.execute.call_args_list]
+        self.assertEqual(statements[0], ('SET TRANSACTION ISOLATION LEVEL REPEATABLE READ, READ ONLY',))
+        self.assertEqual(len(statements), 5)
+        self.assertEqual(statements[2][1], (5, 5))
+        self.assertEqual(statements[3][1], (10,))
+        self.assertEqual(statements[4][1], (10,))
+        self.mock_connection.commit.assert_called_once()
+
+    def test_compute_empty_table(self):
+        self.mock_cursor.fetchone.return_value = (0, None, None, None, None)
+        self.mock_cursor.fetchall.side_effect = [[], [], []]
+
+        statistics = self.student_statistics.compute()
+
+        self.assertEqual(statistics['count'], 0)
+        self.assertEqual(statistics['age'], {'min': None, 'max': None, 'mean': None, 'stddev': None})
+        self.assertEqual(statistics['cities'], {'distinct': 0, 'top': []})
+        self.assertEqual(statistics['duplicate_numbers'], {'numbers': 0, 'students': 0, 'top': []})
+
+    def test_compute_invalid_arguments(self):
+        with self.assertRaises(ValidationError):
+            self.student_statistics.compute(age_bucket_width=0)
+        self.mock_cursor.execute.assert_not_called()
+
+    def test_compute_failure(self):
+        self.mock_cursor.execute.side_effect = psycopg2.DatabaseError('Database error')
+
+        with self.assertRaises(DatabaseOperationError):
+            self.student_statistics.compute()
+
+        self.mock_connection.rollback.assert_called_once()
+
+
+if __name__ == '__main__':
+    unittest.main()
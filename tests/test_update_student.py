@@ -4,6 +4,8 @@ from unittest.mock import MagicMock, patch
 import psycopg2
 from psycopg2 import sql
 
+from crud_operations.exceptions import DatabaseOperationError, StudentNotFoundError
+from crud_operations.prepared_statements import prepared_statements
 from crud_operations.update_student import UpdateStudent
 
 
@@ -18,6 +20,11 @@ class TestUpdateStudent(unittest.TestCase):
         Set up the test environment before each test method.
         This includes creating a mock database connection and cursor.
         """
+        # These tests check the composed SQL, so it is executed directly rather than through PREPARE
+        patcher = patch.object(prepared_statements, 'enabled', False)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
         # Create a mock database connection
         self.mock_connection = MagicMock()
 
@@ -33,58 +40,58 @@ class TestUpdateStudent(unittest.TestCase):
         # Create an instance of UpdateStudent with the mock connection and a test table name
         self.updater = UpdateStudent(self.mock_connection, 'test_table')
 
-    @patch('tkinter.messagebox.showinfo')
-    def test_update_student_success(self, mock_showinfo):
+    def test_update_student_success(self):
         """
         Test case for successfully updating a student record in the database.
         """
-        # Mock the update success by setting rowcount to 1
-        self.mock_cursor.rowcount = 1
+        # Mock the update success by returning the updated row
+        updated_row = (1, 'Na Stia', 'Hannover', 21, '1234567890')
+        self.mock_cursor.fetchone.return_value = updated_row
 
         # Call the method to update the student
-        self.updater.update_all_student_fields(1, 'Na Stia', 'Hannover', 21, '1234567890')
+        result = self.updater.update_all_student_fields(1, 'Na Stia', 'Hannover', 21, '1234567890')
 
         # Verify that the SQL update query was executed correctly
         self.mock_cursor.execute.assert_called_with(
             sql.SQL("""
-                 UPDATE {table_name} 
+                 UPDATE {table_name}
                  SET name = %s, address = %s, age = %s, number = %s
-                 WHERE id = %s 
+                 WHERE id = %s
+                 RETURNING id, name, address, age, number
                     """).format(table_name=sql.Identifier('test_table')),
             ('Na Stia', 'Hannover', 21, '1234567890', 1)
         )
         self.mock_connection.commit.assert_called_once()
 
-        # Verify that the info message was displayed
-        mock_showinfo.assert_called_once_with('Success', 'Student with ID 1 updated successfully.')
+        # Verify that the updated row was returned
+        self.assertEqual(result, updated_row)
 
-    @patch('tkinter.messagebox.showwarning')
-    def test_update_student_not_found(self, mock_showwarning):
+    def test_update_student_not_found(self):
         """
         Test case for handling the case when a student record is not found in the database.
         """
-        # Mock the student not found by setting rowcount to 0
-        self.mock_cursor.rowcount = 0
+        # Mock the student not found by returning no row
+        self.mock_cursor.fetchone.return_value = None
 
         # Call the method to update the student
-        self.updater.update_all_student_fields(1, 'Na Stia', 'Hannover', 21, '1234567890')
+        with self.assertRaises(StudentNotFoundError) as context:
+            self.updater.update_all_student_fields(1, 'Na Stia', 'Hannover', 21, '1234567890')
+        self.assertEqual(context.exception.student_id, 1)
 
         # Verify that the SQL update query was executed correctly
         self.mock_cursor.execute.assert_called_with(
             sql.SQL("""
-                 UPDATE {table_name} 
+                 UPDATE {table_name}
                  SET name = %s, address = %s, age = %s, number = %s
-                 WHERE id = %s 
+                 WHERE id = %s
+                 RETURNING id, name, address, age, number
                     """).format(table_name=sql.Identifier('test_table')),
             ('Na Stia', 'Hannover', 21, '1234567890', 1)
         )
         self.mock_connection.commit.assert_called_once()
+        self.assertEqual(str(context.exception), 'Student with ID 1 not found.')
 
-        # Verify that the warning message was displayed
-        mock_showwarning.assert_called_once_with('Not Found', 'Student with ID 1 not found.')
-
-    @patch('tkinter.messagebox.showerror')
-    def test_update_student_exception(self, mock_showerror):
+    def test_update_student_exception(self):
         """
         Test case for handling exceptions during the update process.
         """
@@ -93,13 +100,14 @@ class TestUpdateStudent(unittest.TestCase):
         self.mock_cursor.execute.side_effect = psycopg2.Error('Mocked exception')
 
         # Call the method to update the student
-        self.updater.update_all_student_fields(1, 'Na Stia', 'Hannover', 21, '1234567890')
+        with self.assertRaises(DatabaseOperationError) as context:
+            self.updater.update_all_student_fields(1, 'Na Stia', 'Hannover', 21, '1234567890')
 
         # Verify that the rollback was called
         self.mock_connection.rollback.assert_called_once()
 
-        # Verify that the error message was displayed
-        mock_showerror.assert_called_once_with('Database Error', 'Could not update student: Mocked exception')
+        # Verify that the error carries the database message
+        self.assertEqual(str(context.exception), 'Could not update student: Mocked exception')
 
     def tearDown(self):
         """
@@ -107,3 +115,38 @@ class TestUpdateStudent(unittest.TestCase):
         """
         # Verify that the cursor was closed
         self.mock_cursor.close.assert_called_once()
+
+
+class TestUpdateStudentFind(unittest.TestCase):
+    """
+    Unit test case for UpdateStudent.find_student_by_id.
+    """
+
+    def setUp(self):
+        self.mock_connection = MagicMock()
+        self.mock_cursor = MagicMock()
+        self.mock_connection.cursor.return_value.__enter__.return_value = self.mock_cursor
+        self.updater = UpdateStudent(self.mock_connection, 'test_table')
+
+    def test_find_student_by_id_returns_row(self):
+        """
+        Test case for fetching the full student row used to pre-fill the update form.
+        """
+        student_row = (1, 'Na Stia', 'Hannover', 21, '1234567890')
+        self.mock_cursor.fetchone.return_value = student_row
+
+        result = self.updater.find_student_by_id(1)
+
+        self.mock_cursor.execute.assert_called_once_with(
+            sql.SQL("""
+            SELECT id, name, address, age, number FROM {table_name}
+            WHERE id = %s
+        """).format(table_name=sql.Identifier('test_table')),
+            (1,)
+        )
+        self.assertEqual(result, student_row)
+
+    def test_find_student_by_id_not_found(self):
+        self.mock_cursor.fetchone.return_value = None
+
+        self.assertIsNone(self.updater.find_student_by_id(1))
@@ -0,0 +1,110 @@
+import unittest
+from unittest.mock import MagicMock, patch
+
+import psycopg2
+from psycopg2 import sql
+
+from crud_operations.exceptions import DatabaseOperationError, ValidationError
+from crud_operations.prepared_statements import prepared_statements
+from crud_operations.update_student_attribute import UpdateStudentAttribute
+
+
+class TestUpdateStudentAttribute(unittest.TestCase):
+    """
+    Unit test case for the UpdateStudentAttribute class.
+    """
+
+    def setUp(self):
+        # These tests check the composed SQL, so it is executed directly rather than through PREPARE
+        patcher = patch.object(prepared_statements, 'enabled', False)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        # Mock the database connection and cursor
+        self.mock_connection = MagicMock()
+        self.mock_cursor = MagicMock()
+        self.mock_connection.cursor.return_value.__enter__.return_value = self.mock_cursor
+
+        self.updater = UpdateStudentAttribute(self.mock_connection, 'test_table')
+
+    def test_update_student_field_success(self):
+        updated_row = (1, 'Na Stia', 'Berlin', 21, '1234567890')
+        self.mock_cursor.fetchone.return_value = updated_row
+
+        result = self.updater.update_student_field(1, 'address', 'Berlin')
+
+        self.mock_cursor.execute.assert_called_once_with(
+            sql.SQL("""
+            UPDATE {table_name}
+            SET {field} = %s
+            WHERE id = %s
+            RETURNING id, name, address, age, number
+        """).format(table_name=sql.Identifier('test_table'), field=sql.Identifier('address')),
+            ('Berlin', 1)
+        )
+        self.mock_connection.commit.assert_called_once()
+        self.assertEqual(result, updated_row)
+
+    def test_update_student_field_invalid_field(self):
+        with self.assertRaises(ValidationError) as context:
+            self.updater.update_student_field(1, 'id', 5)
+
+        self.mock_cursor.execute.assert_not_called()
+        self.assertEqual(str(context.exception), 'Invalid field: id. Please choose a valid field.')
+
+    def test_update_student_field_invalid_value(self):
+        for field_choice, value in (('age', 'old'), ('age', -1), ('number', '123'), ('name', ''), ('name', 5)):
+            with self.subTest(field=field_choice, value=value), self.assertRaises(ValidationError):
+                self.updater.update_student_field(1, field_choice, value)
+
+        self.mock_cursor.execute.assert_not_called()
+
+    @patch('crud_operations.update_student_attribute.execute_values')
+    def test_update_students_fields_groups_per_field(self, mock_execute_values):
+        # The address update matches students 1 and 2, the age update matches student 1 only
+        mock_execute_values.side_effect = [[(1,), (2,)], [(1,)]]
+
+        result = self.updater.update_students_fields([
+            (1, 'address', 'Dorm A'),
+            (2, 'address', 'Dorm B'),
+            (1, 'age', 22),
+            (3, 'age', 30),
+            (2, 'address', 'Dorm C'),  # Overrides the earlier value for student 2
+        ])
+
+        self.assertEqual(mock_execute_values.call_count, 2)
+
+        address_call, age_call = mock_execute_values.call_args_list
+        self.assertEqual(address_call.args[2], [(1, 'Dorm A'), (2, 'Dorm C')])
+        self.assertEqual(address_call.kwargs['template'], '(%s::int, %s::text)')
+        self.assertTrue(address_call.kwargs['fetch'])
+        self.assertEqual(age_call.args[2], [(1, 22), (3, 30)])
+        self.assertEqual(age_call.kwargs['template'], '(%s::int, %s::int)')
+
+        # A single transaction covers both statements
+        self.mock_connection.commit.assert_called_once()
+        self.assertEqual(result, {'matched': 2, 'unmatched': 1, 'unmatched_ids': [3]})
+
+    @patch('crud_operations.update_student_attribute.execute_values')
+    def test_update_students_fields_normalizes_ids(self, mock_execute_values):
+        mock_execute_values.return_value = [(5,)]
+
+        result = self.updater.update_students_fields([('5', 'name', 'Na Stia'), (5, 'name', 'Ju Lia')])
+
+        # "5" and 5 are the same student, and the last value wins
+        self.assertEqual(mock_execute_values.call_args.args[2], [(5, 'Ju Lia')])
+        self.assertEqual(result, {'matched': 1, 'unmatched': 0, 'unmatched_ids': []})
+
+        with self.assertRaises(ValidationError):
+            self.updater.update_students_fields([('five', 'name', 'Na Stia')])
+        self.assertEqual(mock_execute_values.call_count, 1)
+
+    @patch('crud_operations.update_student_attribute.execute_values')
+    def test_update_students_fields_database_error(self, mock_execute_values):
+        mock_execute_values.side_effect = psycopg2.Error('Mocked exception')
+
+        with self.assertRaises(DatabaseOperationError) as context:
+            self.updater.update_students_fields([(1, 'name', 'Na Stia')])
+
+        self.mock_connection.rollback.assert_called_once()
+        self.mock_connection.commit.assert_not_called()
+        self.assertEqual(str(context.exception), 'Could not update student attributes: Mocked exception')
@@ -0,0 +1,72 @@
+import os
+import subprocess
+import sys
+import unittest
+from unittest.mock import MagicMock
+
+from crud_operations.exceptions import StudentNotFoundError, ValidationError
+from crud_operations.update_student import UpdateStudent
+from crud_operations.validation import validate_field, validate_field_value, validate_student
+
+
+class TestValidation(unittest.TestCase):
+    """Unit test case for the input validation shared by the service classes."""
+
+    def test_validate_student_converts_age(self):
+        self.assertEqual(validate_student('Na Stia', 'Hannover', '21', '1234567890'), 21)
+
+    def test_validate_student_invalid_age(self):
+        with self.assertRaises(ValidationError) as context:
+            validate_student('Na Stia', 'Hannover', 'old', '1234567890')
+
+        self.assertEqual(context.exception.title, 'Invalid Age')
+
+    def test_validate_student_negative_age(self):
+        with self.assertRaises(ValidationError) as context:
+            validate_student('Na Stia', 'Hannover', '-3', '1234567890')
+
+        self.assertEqual(context.exception.title, 'Invalid Age')
+
+    def test_validate_field_value(self):
+        self.assertEqual(validate_field_value('age', '21'), 21)
+        self.assertEqual(validate_field_value('address', 'Berlin'), 'Berlin')
+        with self.assertRaises(ValidationError):
+            validate_field_value('number', '12345')
+        with self.assertRaises(ValidationError):
+            validate_field_value('id', 5)
+
+    def test_validate_field(self):
+        validate_field('address')
+        with self.assertRaises(ValidationError):
+            validate_field('id')
+
+    def test_update_rejects_invalid_values_before_the_database(self):
+        connection = MagicMock()
+        updater = UpdateStudent(connection, 'test_table')
+
+        for name, age in (('', 21), ('Na Stia', 'old'), ('Na Stia', -1)):
+            with self.subTest(name=name, age=age), self.assertRaises(ValidationError):
+                updater.update_all_student_fields(1, name, 'Hannover', age, '1234567890')
+
+        connection.cursor.assert_not_called()
+
+    def test_errors_are_standard_exception_types(self):
+        # Callers that do not know the service errors can still catch them
+        self.assertIsInstance(ValidationError('bad'), ValueError)
+        self.assertIsInstance(StudentNotFoundError(3), LookupError)
+        self.assertEqual(StudentNotFoundError(3).title, 'Not Found')
+
+    def test_service_classes_do_not_import_tkinter(self):
+        modules = ['add_student', 'create_student_table', 'delete_student', 'read_student_data',
+                   'search_students', 'update_student', 'update_student_attribute']
+        code = '; '.join(f'import crud_operations.{module}' for module in modules)
+        code += "; import sys; print('tkinter' in sys.modules)"
+        project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        result = subprocess.run([sys.executable, '-c', code], cwd=project_root,
+                                capture_output=True, text=True, check=True)
+
+        self.assertEqual(result.stdout.strip(), 'False')
+
+
+if __name__ == '__main__':
+    unittest.main()